@@ -6,6 +6,7 @@ from . import udfs
 
 from .check import Check
 from .exporter import Exporter
+from .file_history_store import DeltaFileHistoryStore, FileHistoryStore, SQLiteFileHistoryStore
 from .ingester import Ingester
 from .maps import Maps
 from .metastore import Metastore
@@ -15,25 +16,30 @@ from .table_schema import TableSchema
 from .table import Table
 from .test import Test
 from .transformer import Transformer
+from .write_properties import WriteProperties
 
 
 __all__ = [
   'Check',
   'checks',
+  'DeltaFileHistoryStore',
   'enums',
   'exceptions',
   'Exporter',
+  'FileHistoryStore',
   'Ingester',
   'Maps',
   'Metastore',
   'Pipe',
   'Pipeline',
+  'SQLiteFileHistoryStore',
   'Table',
   'TableSchema',
   'Test',
   'Transformer',
   'types',
-  'udfs'
+  'udfs',
+  'WriteProperties'
 ]
 __author__ = 'JoshTG'
 __license__ = 'MIT'
@@ -1,27 +1,40 @@
 from dataclasses import dataclass, field
 from inspect import signature
+from typing import Optional
 
 
 @dataclass
 class Check:
   """Contains check metadata and a function to generate results
+
+  A check is defined in one of two forms:
+    1. expression: returns a polars expression of 1 (passed) or 0 (failed), e.g., (column, **kwargs) -> Expr
+    2. function: returns the DataFrame with a result column added, e.g., (df, column, **kwargs) -> DataFrame
+
+  The expression form can be evaluated inside a LazyFrame alongside other checks,
+  while the function form is kept for compatibility
   
   Args:
     name (str): the name of the check
     description (str): the description of the check
-    function (callable): the polars transformation code to run the check
+    function (Optional[callable]): the polars transformation code to run the check (default None)
+    expression (Optional[callable]): the polars expression code to run the check (default None)
   
   Initialized Fields:
     simple_function (bool): indicates whether the arguments are simple (i.e., df, column)
   """
   name: str
   description: str
-  function: callable
+  function: Optional[callable] = field(default_factory=lambda: None)
+  expression: Optional[callable] = field(default_factory=lambda: None)
 
   simple_function: bool = field(init=False)
 
   def __post_init__(self) -> None:
-    self.simple_function: bool = len(signature(self.function).parameters) == 2
+    if (self.function is None) == (self.expression is None):
+      raise ValueError('Error: exactly one of function or expression must be provided')
+    self.simple_function: bool = self.function is not None \
+      and len(signature(self.function).parameters) == 2
 
   def build_result_column(self, column: str) -> str:
     """Builds the result column name based on an input column
@@ -39,4 +39,7 @@ class WriteLogic(Enum):
   """The method of saving data to a Delta Table"""
   APPEND = 'append'
   OVERWRITE = 'overwrite'
+  PARTITION_OVERWRITE = 'partition_overwrite'
   UPSERT = 'upsert'
+  SYNC = 'sync'
+  CDC = 'cdc'
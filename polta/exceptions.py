@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 
 
 class DataTypeNotRecognized(Exception):
@@ -25,6 +25,12 @@ class EmptyPipe(Exception):
     self.message: str = 'Pipe executed in strict mode but did not load data'
     super().__init__(self.message)
 
+class FilterOperatorNotRecognized(Exception):
+  """Raise when the filter operator is not recognized by system"""
+  def __init__(self, operator: Any) -> None:
+    self.message: str = f'Unrecognized filter operator {operator}'
+    super().__init__(self.message)
+
 class IncompatibleTransformLogic(Exception):
   """Raise when the transform logic is not compatible with system"""
   def __init__(self, transform_logic: Any) -> None:
@@ -43,6 +49,15 @@ class TableQualityNotRecognized(Exception):
     self.message: str = f'Unrecognized table quality {quality}'
     super().__init__(self.message)
 
+class UpsertChunkFailed(Exception):
+  """Raise when a chunk of a chunked upsert fails to merge"""
+  def __init__(self, chunk_index: int, chunk_count: Optional[int], error: Exception) -> None:
+    self.chunk_index: int = chunk_index
+    of_count: str = '' if chunk_count is None else f' of {chunk_count}'
+    self.message: str = f'Upsert chunk {chunk_index + 1}{of_count} failed ' \
+      f'(resume with start_chunk={chunk_index}): {error}'
+    super().__init__(self.message)
+
 class WriteLogicNotRecognized(Exception):
   """Raise when the write logic is not recognized by system"""
   def __init__(self, write_logic: Any) -> None:
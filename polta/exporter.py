@@ -49,11 +49,14 @@ class Exporter:
   def get_dfs(self) -> dict[str, DataFrame]:
     """Retrieves the base DataFrame if possible, or it returns nothing
 
+    The emptiness check comes from the Delta log, so empty tables never get read
+
     Returns:
       dfs (dict[str, DataFrame]): the base DataFrame in a dict
     """
-    df: DataFrame = self.table.get()
-    return {} if df.is_empty() else {self.table.id: df}
+    if self.table.count() == 0:
+      return {}
+    return {self.table.id: self.table.get()}
 
   def transform(self, dfs: dict[str, DataFrame]) -> DataFrame:
     """Returns the target table DataFrame from dfs
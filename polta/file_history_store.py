@@ -0,0 +1,403 @@
+import polars as pl
+import sqlite3
+
+from abc import ABC, abstractmethod
+from contextlib import closing
+from dataclasses import dataclass, field
+from json import loads
+from os import path
+from polars import DataFrame
+from threading import Lock
+from typing import Any, Optional, TYPE_CHECKING
+from urllib.parse import unquote
+
+if TYPE_CHECKING:
+  from polta.metastore import Metastore
+
+
+class FileHistoryStore(ABC):
+  """Stores which files have been ingested into each table, and when each file was last modified
+
+  Subclasses implement get_file_history, write_file_history, clear_file_history, get_synced_version,
+    and set_synced_version, and may override filter_unseen_files with an indexed lookup
+  """
+  @abstractmethod
+  def get_file_history(self, table_id: str) -> DataFrame:
+    """Retrieves the latest _file_mod_ts of each _file_path ingested into a table
+
+    Args:
+      table_id (str): the unique ID of the table
+
+    Returns:
+      df (DataFrame): the resulting file history DataFrame
+    """
+
+  @abstractmethod
+  def write_file_history(self, table_id: str, df: DataFrame) -> None:
+    """Records ingested files of a table
+
+    Args:
+      table_id (str): the unique ID of the table
+      df (DataFrame): the DataFrame containing _file_path, _file_mod_ts, and _ingested_ts
+    """
+
+  @abstractmethod
+  def clear_file_history(self, table_id: str) -> None:
+    """Removes the file history of a table, typically after truncation
+
+    Args:
+      table_id (str): the unique ID of the table
+    """
+
+  @abstractmethod
+  def get_synced_version(self, table_id: str) -> Optional[int]:
+    """Retrieves the file_history table version up to which the store holds the history of a table
+
+    Args:
+      table_id (str): the unique ID of the table
+
+    Returns:
+      version (Optional[int]): the synced version, or None if the history has not been loaded
+    """
+
+  @abstractmethod
+  def set_synced_version(self, table_id: str, version: int) -> None:
+    """Records that the store holds the history of a table up to a file_history table version
+
+    Args:
+      table_id (str): the unique ID of the table
+      version (int): the synced version
+    """
+
+  def filter_unseen_files(self, table_id: str, df: DataFrame) -> DataFrame:
+    """Keeps the files that were never ingested into a table, or got modified since
+
+    Args:
+      table_id (str): the unique ID of the table
+      df (DataFrame): the candidate files, containing _file_path and _file_mod_ts
+
+    Returns:
+      df (DataFrame): the candidate files left to ingest
+    """
+    return self.filter_by_history(df, self.get_file_history(table_id))
+
+  @staticmethod
+  def filter_by_history(df: DataFrame, hx: DataFrame) -> DataFrame:
+    """Keeps the candidate files missing from a file history, or modified since
+
+    Args:
+      df (DataFrame): the candidate files, containing _file_path and _file_mod_ts
+      hx (DataFrame): the file history, containing _file_path and _file_mod_ts
+
+    Returns:
+      df (DataFrame): the candidate files left to ingest
+    """
+    return (df
+      .join(hx.select('_file_path', '_file_mod_ts'), '_file_path', 'left')
+      .filter(
+        (pl.col('_file_mod_ts') > pl.col('_file_mod_ts_right')) |
+        (pl.col('_file_mod_ts_right').is_null())
+      )
+      .drop('_file_mod_ts_right')
+    )
+
+
+@dataclass
+class DeltaFileHistoryStore(FileHistoryStore):
+  """Stores the file history in the metastore's file_history Delta table, partitioned by table_id
+
+  Args:
+    metastore (Metastore): the metastore owning the file_history table
+  """
+  metastore: 'Metastore'
+
+  _cache: dict[str, tuple[set[str], DataFrame]] = field(init=False, repr=False, compare=False)
+  _lock: Lock = field(init=False, repr=False, compare=False)
+
+  def __post_init__(self) -> None:
+    self._cache: dict[str, tuple[set[str], DataFrame]] = {}
+    self._lock: Lock = Lock()
+
+  def get_file_history(self, table_id: str) -> DataFrame:
+    """Retrieves the latest _file_mod_ts of each _file_path ingested into a table
+
+    Only the table's partition gets read, and the result is cached in-process by the files it came from,
+      so later calls only read the files committed since (or re-read the partition if any got removed)
+
+    Args:
+      table_id (str): the unique ID of the table
+
+    Returns:
+      df (DataFrame): the resulting file history DataFrame
+    """
+    file_uris: set[str] = set(self.metastore
+      .get_delta_table(self.metastore.file_history_path)
+      .file_uris(partition_filters=[('table_id', '=', table_id)])
+    )
+    with self._lock:
+      cached: Optional[tuple[set[str], DataFrame]] = self._cache.get(table_id)
+
+    # Read only the new files if every cached file is still live, otherwise the whole partition
+    if cached is not None and cached[0] <= file_uris:
+      new_file_uris: set[str] = file_uris - cached[0]
+      if not new_file_uris:
+        return cached[1]
+      df: DataFrame = pl.concat([cached[1], self._read_files(new_file_uris)])
+    else:
+      df: DataFrame = self._read_files(file_uris)
+
+    df: DataFrame = df.group_by('_file_path').agg(pl.col('_file_mod_ts').max())
+    with self._lock:
+      self._cache[table_id] = (file_uris, df)
+    return df
+
+  def write_file_history(self, table_id: str, df: DataFrame) -> None:
+    """Appends ingested files of a table to the file_history table (see Metastore.append_system_records)
+
+    Args:
+      table_id (str): the unique ID of the table
+      df (DataFrame): the DataFrame containing _file_path, _file_mod_ts, and _ingested_ts
+    """
+    df: DataFrame = (df
+      .select(
+        pl.lit(table_id).alias('table_id'),
+        pl.col('_file_path'),
+        pl.col('_file_mod_ts'),
+        pl.col('_ingested_ts')
+      )
+    )
+    self.metastore.append_system_records(self.metastore.file_history_path, df)
+
+  def clear_file_history(self, table_id: str) -> None:
+    """Deletes the partition of a table from the file_history table
+
+    Args:
+      table_id (str): the unique ID of the table
+    """
+    self.metastore.commit(self.metastore.file_history_path, lambda commit_properties: self.metastore
+      .get_delta_table(self.metastore.file_history_path)
+      .delete(f'table_id = \'{table_id}\'', commit_properties=commit_properties)
+    )
+
+  def get_synced_version(self, table_id: str) -> Optional[int]:
+    """Retrieves the current file_history table version, since this store reads the table itself
+
+    Args:
+      table_id (str): the unique ID of the table
+
+    Returns:
+      version (Optional[int]): the current version of the file_history table
+    """
+    return self.metastore.get_delta_table(self.metastore.file_history_path).version()
+
+  def set_synced_version(self, table_id: str, version: int) -> None:
+    """Does nothing, since this store is always in sync with the file_history table
+
+    Args:
+      table_id (str): the unique ID of the table
+      version (int): the synced version
+    """
+
+  def get_file_history_since(self, table_id: str, starting_version: int, ending_version: int) -> Optional[DataFrame]:
+    """Retrieves the file history of a table committed after starting_version up to ending_version
+
+    Only the commits in the range get parsed, along with the data files they added to the table's partition
+
+    Args:
+      table_id (str): the unique ID of the table
+      starting_version (int): the last version already synced
+      ending_version (int): the last version to include
+
+    Returns:
+      df (Optional[DataFrame]): the added file history, or None if a commit is no longer in the log
+        or the range removed history of the table (e.g., a truncation), so it must be reloaded
+    """
+    file_uris: set[str] = set()
+    for version in range(starting_version + 1, ending_version + 1):
+      commit_path: str = path.join(self.metastore.file_history_path, '_delta_log', f'{version:020}.json')
+      if not path.exists(commit_path):
+        return None
+      with open(commit_path) as f:
+        for line in f:
+          action: dict[str, Any] = loads(line)
+          change: Optional[dict[str, Any]] = action.get('add') or action.get('remove')
+          if change is None or (change.get('partitionValues') or {}).get('table_id') != table_id:
+            continue
+          if 'remove' in action and action['remove'].get('dataChange', True):
+            return None
+          if 'add' in action:
+            file_uris.add(path.join(self.metastore.file_history_path, unquote(change['path'])))
+    return self._read_files(file_uris)
+
+  def _read_files(self, file_uris: set[str]) -> DataFrame:
+    """Reads the file paths and modification times from file_history data files
+
+    Args:
+      file_uris (set[str]): the data files to read
+
+    Returns:
+      df (DataFrame): the file paths and modification times
+    """
+    if not file_uris:
+      return DataFrame([], {'_file_path': pl.String, '_file_mod_ts': pl.Datetime('us', 'UTC')})
+    return (pl
+      .scan_parquet(sorted(file_uris), hive_partitioning=False)
+      .select('_file_path', pl.col('_file_mod_ts').dt.replace_time_zone('UTC'))
+      .collect()
+    )
+
+
+@dataclass
+class SQLiteFileHistoryStore(FileHistoryStore):
+  """Stores the latest _file_mod_ts of each ingested file in an SQLite database indexed by table and path
+
+  Checking whether a file was seen at its modification time becomes an index lookup per candidate file,
+    instead of a join against the whole history of the table
+
+  The database holds one row per file, and the metastore loads a table's history from the
+    file_history Delta table the first time the table is used. Afterwards, before each use, it
+    catches up on the file_history commits made since (see get_synced_version), so ingestions of
+    writers that do not share this database are seen as well
+
+  Args:
+    database_path (str): the path of the SQLite database file
+  """
+  database_path: str
+
+  def __post_init__(self) -> None:
+    with closing(self._connect()) as conn, conn:
+      conn.execute(
+        'CREATE TABLE IF NOT EXISTS file_history ('
+        'table_id TEXT NOT NULL, file_path TEXT NOT NULL, file_mod_us INTEGER NOT NULL, '
+        'PRIMARY KEY (table_id, file_path)) WITHOUT ROWID'
+      )
+      conn.execute(
+        'CREATE TABLE IF NOT EXISTS synced_tables (table_id TEXT PRIMARY KEY, version INTEGER NOT NULL)'
+      )
+
+  def get_file_history(self, table_id: str) -> DataFrame:
+    """Retrieves the latest _file_mod_ts of each _file_path ingested into a table
+
+    Args:
+      table_id (str): the unique ID of the table
+
+    Returns:
+      df (DataFrame): the resulting file history DataFrame
+    """
+    with closing(self._connect()) as conn:
+      rows: list[tuple[str, int]] = conn.execute(
+        'SELECT file_path, file_mod_us FROM file_history WHERE table_id = ?',
+        (table_id,)
+      ).fetchall()
+    return self._to_history_frame(rows)
+
+  def write_file_history(self, table_id: str, df: DataFrame) -> None:
+    """Records ingested files of a table, keeping the latest _file_mod_ts of each file
+
+    Args:
+      table_id (str): the unique ID of the table
+      df (DataFrame): the DataFrame containing _file_path and _file_mod_ts
+    """
+    with closing(self._connect()) as conn, conn:
+      conn.executemany(
+        'INSERT INTO file_history (table_id, file_path, file_mod_us) VALUES (?, ?, ?) '
+        'ON CONFLICT (table_id, file_path) DO UPDATE SET file_mod_us = MAX(file_mod_us, excluded.file_mod_us)',
+        [(table_id, p, t) for p, t in self._to_rows(df)]
+      )
+
+  def clear_file_history(self, table_id: str) -> None:
+    """Removes the file history of a table, typically after truncation
+
+    Args:
+      table_id (str): the unique ID of the table
+    """
+    with closing(self._connect()) as conn, conn:
+      conn.execute('DELETE FROM file_history WHERE table_id = ?', (table_id,))
+      conn.execute('DELETE FROM synced_tables WHERE table_id = ?', (table_id,))
+
+  def get_synced_version(self, table_id: str) -> Optional[int]:
+    """Retrieves the file_history table version up to which the database holds the history of a table
+
+    Args:
+      table_id (str): the unique ID of the table
+
+    Returns:
+      version (Optional[int]): the synced version, or None if the history has not been loaded
+    """
+    with closing(self._connect()) as conn:
+      row: Optional[tuple[int]] = conn.execute(
+        'SELECT version FROM synced_tables WHERE table_id = ?',
+        (table_id,)
+      ).fetchone()
+    return None if row is None else row[0]
+
+  def set_synced_version(self, table_id: str, version: int) -> None:
+    """Records that the database holds the history of a table up to a file_history table version
+
+    Args:
+      table_id (str): the unique ID of the table
+      version (int): the synced version
+    """
+    with closing(self._connect()) as conn, conn:
+      conn.execute(
+        'INSERT INTO synced_tables (table_id, version) VALUES (?, ?) '
+        'ON CONFLICT (table_id) DO UPDATE SET version = MAX(version, excluded.version)',
+        (table_id, version)
+      )
+
+  def filter_unseen_files(self, table_id: str, df: DataFrame) -> DataFrame:
+    """Keeps the files that were never ingested into a table, or got modified since
+
+    Args:
+      table_id (str): the unique ID of the table
+      df (DataFrame): the candidate files, containing _file_path and _file_mod_ts
+
+    Returns:
+      df (DataFrame): the candidate files left to ingest
+    """
+    if df.is_empty():
+      return df
+    with closing(self._connect()) as conn:
+      conn.execute('CREATE TEMP TABLE candidates (file_path TEXT PRIMARY KEY, file_mod_us INTEGER)')
+      conn.executemany('INSERT OR REPLACE INTO candidates VALUES (?, ?)', self._to_rows(df))
+      unseen: list[tuple[str]] = conn.execute(
+        'SELECT c.file_path FROM candidates c '
+        'LEFT JOIN file_history h ON h.table_id = ? AND h.file_path = c.file_path '
+        'WHERE h.file_mod_us IS NULL OR c.file_mod_us > h.file_mod_us',
+        (table_id,)
+      ).fetchall()
+    return df.filter(pl.col('_file_path').is_in([r[0] for r in unseen]))
+
+  def _connect(self) -> sqlite3.Connection:
+    """Opens a connection to the database, waiting on other writers' locks
+
+    Returns:
+      conn (sqlite3.Connection): the connection
+    """
+    return sqlite3.connect(self.database_path, timeout=30)
+
+  @staticmethod
+  def _to_rows(df: DataFrame) -> list[tuple[str, int]]:
+    """Converts file history to (file_path, file_mod_us) rows, with timestamps in UTC microseconds
+
+    Args:
+      df (DataFrame): the DataFrame containing _file_path and _file_mod_ts
+
+    Returns:
+      rows (list[tuple[str, int]]): the rows
+    """
+    return df.select('_file_path', pl.col('_file_mod_ts').dt.epoch('us')).rows()
+
+  @staticmethod
+  def _to_history_frame(rows: list[tuple[Any, ...]]) -> DataFrame:
+    """Converts (file_path, file_mod_us) rows to a file history DataFrame
+
+    Args:
+      rows (list[tuple[Any, ...]]): the rows
+
+    Returns:
+      df (DataFrame): the file history DataFrame
+    """
+    return (DataFrame(rows, {'_file_path': pl.String, '_file_mod_ts': pl.Int64}, orient='row')
+      .with_columns(pl.from_epoch('_file_mod_ts', 'us').dt.replace_time_zone('UTC'))
+    )
@@ -93,6 +93,7 @@ class Ingester:
     Returns:
       file_paths (list[str]): the resulting applicable file paths
     """
+    self.table.ensure_exists()
     if self.directory_type.value == DirectoryType.SHALLOW.value:
       return [
         path.join(self.table.ingestion_zone_path, f)
@@ -131,18 +132,8 @@ class Ingester:
     # Convert the file_paths field into a DataFrame
     paths: DataFrame = DataFrame(metadata, schema=self.payload_schema)
 
-    # Retrieve the history from the target table
-    hx: DataFrame = self.table.metastore.get_file_history(self.table.id)
-
-    # Filter the paths by the temporary history DataFrame
-    return (paths
-      .join(hx, '_file_path', 'left')
-      .filter(
-        (pl.col('_file_mod_ts') > pl.col('_file_mod_ts_right')) |
-        (pl.col('_file_mod_ts_right').is_null())
-      )
-      .drop('_file_mod_ts_right')
-    )
+    # Keep the paths that are new or modified since their last ingestion
+    return self.table.metastore.filter_unseen_files(self.table.id, paths)
 
   def _ingest_files(self, df: DataFrame) -> DataFrame:
     """Ingests files in the DataFrame according to file type / desired output
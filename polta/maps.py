@@ -59,6 +59,13 @@ class Maps:
     TableQuality.CANONICAL.value: '_canonicalized_id',
     TableQuality.STANDARD.value: '_id'
   }
+  CHANGE_DATA_FEED_COLUMNS: dict[str, plDataType] = {
+    '_change_type': String,
+    '_commit_version': Int64,
+    '_commit_timestamp': Datetime(time_unit='ms')
+  }
+  # Reader features whose tables can still be read as plain Parquet files
+  PARQUET_READER_FEATURES: list[str] = ['timestampNtz']
 
   @staticmethod
   def deltalake_field_to_polars_field(delta_field: Union[dict, str]) -> plDataType:
@@ -1,17 +1,34 @@
 import polars as pl
 
+from asyncio import get_running_loop
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, UTC
-from deltalake import DeltaTable, Schema, TableFeatures
-from os import getcwd, listdir, makedirs, path
+from deltalake import CommitProperties, DeltaTable, Schema, TableFeatures, Transaction
+from deltalake.exceptions import CommitFailedError, TableNotFoundError
+from functools import partial
+from itertools import count
+from json import load
+from os import getcwd, getpid, listdir, makedirs, path
 from polars import DataFrame
-from typing import Any
+from random import random
+from socket import gethostname
+from threading import get_ident, RLock
+from time import sleep, time_ns
+from typing import Any, Callable, ClassVar, Iterator, Optional, TypeVar
 
 from polta.enums import TableQuality
 from polta.exceptions import DomainDoesNotExist
-from polta.schemas.system import file_history, pipe_history
+from polta.file_history_store import DeltaFileHistoryStore, FileHistoryStore
+from polta.maps import Maps
+from polta.schemas.system import catalog, file_history, pipe_history, watermark
+from polta.system_write_buffer import SystemWriteBuffer
+from polta.write_properties import WriteProperties
 
 
+T = TypeVar('T')
+
 @dataclass
 class Metastore:
   """Dataclass for managing Polta metastores
@@ -27,9 +44,28 @@ class Metastore:
   Below are the available system tables:
     1. file_history: stores metadata about every file that has been ingested
     2. pipe_history: stores metadata about every pipe execution
+    3. watermark: stores the last Delta version of each source table processed by each consumer
+    4. catalog: stores the location, schema, and keys of every registered table
   
   Optional Args:
     main_path (str): the directory of the metastore (default CWD + 'metastore')
+    delta_table_cache_size (int): the max number of cached DeltaTable handles across threads (default 128)
+    write_properties (WriteProperties): the Parquet and Delta options for system table writes (default WriteProperties())
+    commit_retries (int): the number of times a write retries after a commit conflict (default 3)
+    commit_backoff_seconds (float): the base delay before a retry, doubling with each attempt (default 0.1)
+    max_concurrency (int): the max number of async operations running at once (default 8)
+    file_history_store (Optional[FileHistoryStore]): if applicable, the store serving file history lookups,
+      with the file_history table kept as its mirror (default None, i.e., the file_history table)
+    buffer_system_writes (bool): indicates whether to buffer pipe_history and file_history records
+      and commit them together, instead of one commit per record batch (default False)
+    system_write_buffer_size (int): the number of buffered records that triggers a flush (default 1000)
+    system_write_flush_seconds (float): the age of the oldest buffered record that triggers a flush (default 60.0)
+    lazy (bool): indicates whether to defer creating the metastore and its tables until they are first used,
+      instead of when they are constructed (default False)
+    writer_id (Optional[str]): the application ID of this metastore's Delta transactions, which must differ
+      between metastores writing concurrently (default None, i.e., 'polta-<host>-<process ID>-<instance>')
+    transaction_retention (str): how long tables keep the application transactions of each writer
+      (default 'interval 7 days')
 
   Initialized Fields:
     name (str): the name of the metastore (i.e., the basename of main_path)
@@ -37,14 +73,47 @@ class Metastore:
     volumes_directory (str): the path to the volumes
     file_history_path (str): the absolute path to the file_history table
     pipe_history_path (str): the absolute path to the pipe_history table
+    watermark_path (str): the absolute path to the watermark table
+    catalog_path (str): the absolute path to the catalog table
+    key_index_directory (str): the directory of the persisted primary key indexes of the tables
+    spool_directory (str): the directory of the spools of buffered system table records
   """
   main_path: str = field(default_factory=lambda: path.join(getcwd(), 'metastore'))
+  delta_table_cache_size: int = field(default_factory=lambda: 128)
+  write_properties: WriteProperties = field(default_factory=lambda: WriteProperties())
+  commit_retries: int = field(default_factory=lambda: 3)
+  commit_backoff_seconds: float = field(default_factory=lambda: 0.1)
+  max_concurrency: int = field(default_factory=lambda: 8)
+  file_history_store: Optional[FileHistoryStore] = field(default_factory=lambda: None)
+  buffer_system_writes: bool = field(default_factory=lambda: False)
+  system_write_buffer_size: int = field(default_factory=lambda: 1000)
+  system_write_flush_seconds: float = field(default_factory=lambda: 60.0)
+  lazy: bool = field(default_factory=lambda: False)
+  writer_id: Optional[str] = field(default_factory=lambda: None)
+  transaction_retention: str = field(default_factory=lambda: 'interval 7 days')
 
   name: str = field(init=False)
   tables_directory: str = field(init=False)
   volumes_directory: str = field(init=False)
   file_history_path: str = field(init=False)
   pipe_history_path: str = field(init=False)
+  watermark_path: str = field(init=False)
+  catalog_path: str = field(init=False)
+  key_index_directory: str = field(init=False)
+  spool_directory: str = field(init=False)
+  _delta_tables: OrderedDict[tuple[int, str], DeltaTable] = field(init=False, repr=False, compare=False)
+  _staged_watermarks: dict[str, dict[str, int]] = field(init=False, repr=False, compare=False)
+  _transaction_version: int = field(init=False, repr=False, compare=False)
+  _lock: RLock = field(init=False, repr=False, compare=False)
+  _table_locks: dict[str, RLock] = field(init=False, repr=False, compare=False)
+  _delta_file_history_store: DeltaFileHistoryStore = field(init=False, repr=False, compare=False)
+  _system_write_buffer: Optional[SystemWriteBuffer] = field(init=False, repr=False, compare=False)
+  _catalog: Optional[tuple[int, DataFrame]] = field(init=False, repr=False, compare=False)
+  _initialized: bool = field(init=False, repr=False, compare=False)
+  _initializing: bool = field(init=False, repr=False, compare=False)
+  _deferred_tables: dict[str, Callable[[], None]] = field(init=False, repr=False, compare=False)
+  _executor: Optional[ThreadPoolExecutor] = field(init=False, repr=False, compare=False)
+  _instances: ClassVar[Iterator[int]] = count(1)
 
   def __post_init__(self) -> None:
     self.name: str = path.basename(self.main_path)
@@ -56,7 +125,78 @@ class Metastore:
     self.sys_directory: str = path.join(self.volumes_directory, 'system')
     self.file_history_path: str = path.join(self.sys_directory, 'file_history')
     self.pipe_history_path: str = path.join(self.sys_directory, 'pipe_history')
-    self.initialize_if_not_exists()
+    self.watermark_path: str = path.join(self.sys_directory, 'watermark')
+    self.catalog_path: str = path.join(self.sys_directory, 'catalog')
+    self.key_index_directory: str = path.join(self.sys_directory, 'key_index')
+    self.spool_directory: str = path.join(self.sys_directory, 'spool')
+    self._delta_tables: OrderedDict[tuple[int, str], DeltaTable] = OrderedDict()
+    self._staged_watermarks: dict[str, dict[str, int]] = {}
+    self.writer_id: str = self.writer_id or f'polta-{gethostname()}-{getpid()}-{next(Metastore._instances)}'
+    self._transaction_version: int = 0
+    self._lock: RLock = RLock()
+    self._table_locks: dict[str, RLock] = {}
+    self._delta_file_history_store: DeltaFileHistoryStore = DeltaFileHistoryStore(self)
+    self._executor: Optional[ThreadPoolExecutor] = None
+    self._system_write_buffer: Optional[SystemWriteBuffer] = None
+    self._catalog: Optional[tuple[int, DataFrame]] = None
+    self._initialized: bool = False
+    self._initializing: bool = False
+    self._deferred_tables: dict[str, Callable[[], None]] = {}
+    if not self.lazy:
+      self.ensure_initialized()
+
+  def ensure_initialized(self) -> None:
+    """Initializes the metastore once per process, typically right before its first use in lazy mode
+
+    Other threads wait on the lock until initialization completes, so _initialized is only ever seen
+      once the system tables and the system write buffer exist. The initializing thread itself
+      re-enters through the system tables it creates, which _initializing lets through
+    """
+    if self._initialized:
+      return
+    with self._lock:
+      if self._initialized or self._initializing:
+        return
+      self._initializing: bool = True
+      try:
+        self.initialize_if_not_exists()
+
+        # Start buffering once the system tables exist, recovering any spools left by crashed processes
+        self._system_write_buffer: Optional[SystemWriteBuffer] = SystemWriteBuffer(
+          metastore=self,
+          max_records=self.system_write_buffer_size,
+          flush_interval_seconds=self.system_write_flush_seconds
+        ) if self.buffer_system_writes else None
+        self._initialized: bool = True
+      finally:
+        self._initializing: bool = False
+
+  def defer_table(self, table_path: str, create: Callable[[], None]) -> None:
+    """Defers creating a table until its Delta Table is first used (see ensure_table)
+
+    Args:
+      table_path (str): the path of the Delta Table
+      create (Callable[[], None]): the function creating the table if it does not exist
+    """
+    with self._lock:
+      self._deferred_tables[table_path] = create
+
+  def ensure_table(self, table_path: str) -> None:
+    """Creates a deferred table if it has not been created in this process yet
+
+    Args:
+      table_path (str): the path of the Delta Table
+    """
+    self.ensure_initialized()
+    with self._lock:
+      create: Optional[Callable[[], None]] = self._deferred_tables.pop(table_path, None)
+    if create is None:
+      return
+    try:
+      create()
+    except Exception:
+      self.defer_table(table_path, create)
+      raise
 
   def initialize_if_not_exists(self) -> None:
     """Initializes the metastore if it does not exist"""
@@ -68,27 +208,63 @@ class Metastore:
     makedirs(self.quarantine_directory, exist_ok=True)
     makedirs(self.ingestion_directory, exist_ok=True)
 
-    # Initialize the system tables
+    # Initialize the system tables, dropping any handles cached before initialization
+    self.evict_delta_table(self.file_history_path)
+    self.evict_delta_table(self.pipe_history_path)
+    self.evict_delta_table(self.watermark_path)
     self.create_table_if_not_exists(
       table_path=self.file_history_path,
       schema=file_history,
-      partition_by=['table_id']
+      partition_by=['table_id'],
+      configuration=self.build_configuration()
     )
     self.create_table_if_not_exists(
       table_path=self.pipe_history_path,
       schema=pipe_history,
-      partition_by=['pipe_id']
+      partition_by=['pipe_id'],
+      configuration=self.build_configuration()
+    )
+    self.create_table_if_not_exists(
+      table_path=self.watermark_path,
+      schema=watermark,
+      partition_by=['consumer_id'],
+      configuration=self.build_configuration()
     )
 
+    # Initialize the catalog, registering any tables created before it existed
+    self.evict_delta_table(self.catalog_path)
+    self._catalog: Optional[tuple[int, DataFrame]] = None
+    if not DeltaTable.is_deltatable(self.catalog_path):
+      self.create_table_if_not_exists(
+        table_path=self.catalog_path,
+        schema=catalog,
+        configuration=self.build_configuration()
+      )
+      self._register_existing_tables()
+
+  def build_configuration(self, write_properties: Optional[WriteProperties] = None) -> dict[str, str]:
+    """Builds the Delta table properties of a table in the metastore
+
+    Args:
+      write_properties (optional) (WriteProperties): the write properties of the table (default self.write_properties)
+
+    Returns:
+      configuration (dict[str, str]): the table properties
+    """
+    configuration: dict[str, str] = (write_properties or self.write_properties).to_configuration()
+    configuration['delta.setTransactionRetentionDuration'] = self.transaction_retention
+    return configuration
+
   @staticmethod
-  def create_table_if_not_exists(table_path: str, schema: Schema,
-                                 partition_by: list[str] = []) -> None:
+  def create_table_if_not_exists(table_path: str, schema: Schema, partition_by: list[str] = [],
+                                 configuration: dict[str, str] = {}) -> None:
     """Creates a Delta Table if it does not exist
 
     Args:
         table_path (str): the path of the Delta Table
         schema (Schema): the table schema, in case the Delta Table needs to be created
         partition_by (list[str]): if applicable, the list of keys by which to partition
+        configuration (dict[str, str]): if applicable, any Delta table properties
     """
     if not isinstance(table_path, str):
       raise TypeError('Error: table_path must be of type <str>')
@@ -107,20 +283,388 @@ class Metastore:
       table_uri=table_path,
       schema=schema,
       mode='ignore',
-      partition_by=partition_by or None
+      partition_by=partition_by or None,
+      configuration=configuration or None
     )
+    # Writer version 7 only records the change data feed if its feature is listed
+    features: list[TableFeatures] = [TableFeatures.TimestampWithoutTimezone]
+    if configuration.get('delta.enableChangeDataFeed') == 'true':
+      features.append(TableFeatures.ChangeDataFeed)
     dt.alter.add_feature(
-      feature=TableFeatures.TimestampWithoutTimezone,
+      feature=features,
       allow_protocol_versions_increase=True
     )
 
+  def get_delta_table(self, table_path: str) -> DeltaTable:
+    """Retrieves a cached DeltaTable handle, refreshing it only if the log has moved on
+
+    The handles are kept in a least-recently-used cache of size delta_table_cache_size, one per
+      thread and table, since a DeltaTable handle cannot be used by two threads at once
+
+    Args:
+      table_path (str): the path of the Delta Table
+    
+    Returns:
+      delta_table (DeltaTable): the up-to-date DeltaTable handle
+    """
+    self.ensure_table(table_path)
+    key: tuple[int, str] = (get_ident(), table_path)
+    with self._lock:
+      dt: Optional[DeltaTable] = self._delta_tables.get(key)
+      if dt is None:
+        dt: DeltaTable = DeltaTable(table_path)
+      elif path.exists(path.join(table_path, '_delta_log', f'{dt.version() + 1:020}.json')):
+        dt.update_incremental()
+
+      # Mark the handle as most recently used and evict the least recently used
+      self._delta_tables[key] = dt
+      self._delta_tables.move_to_end(key)
+      while len(self._delta_tables) > self.delta_table_cache_size:
+        self._delta_tables.popitem(last=False)
+      return dt
+
+  def get_table_lock(self, table_path: str) -> RLock:
+    """Retrieves the lock serializing this metastore's operations on a table
+
+    Commits (see commit) and async operations (see run_table_async) on the same table run one
+    at a time, while operations on different tables run concurrently
+
+    Args:
+      table_path (str): the path of the Delta Table
+
+    Returns:
+      lock (RLock): the lock of the table
+    """
+    with self._lock:
+      return self._table_locks.setdefault(table_path, RLock())
+
+  async def run_async(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs a blocking function on the metastore's bounded thread pool without blocking the event loop
+
+    At most max_concurrency functions run at once, and the rest wait in the queue
+
+    Args:
+      function (Callable[..., T]): the blocking function
+      *args (Any): the positional arguments of the function
+      **kwargs (Any): the keyword arguments of the function
+
+    Returns:
+      result (T): the result of the function
+    """
+    with self._lock:
+      if self._executor is None:
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+          max_workers=self.max_concurrency,
+          thread_name_prefix=f'polta-{self.name}'
+        )
+    return await get_running_loop().run_in_executor(self._executor, partial(function, *args, **kwargs))
+
+  async def run_table_async(self, table_path: str, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs a blocking function on a table like run_async(), holding the lock of the table
+
+    Args:
+      table_path (str): the path of the Delta Table
+      function (Callable[..., T]): the blocking function
+      *args (Any): the positional arguments of the function
+      **kwargs (Any): the keyword arguments of the function
+
+    Returns:
+      result (T): the result of the function
+    """
+    def locked() -> T:
+      with self.get_table_lock(table_path):
+        return function(*args, **kwargs)
+    return await self.run_async(locked)
+
+  def commit(self, table_path: str, write: Callable[[CommitProperties], T],
+             retries: Optional[int] = None, transaction: Optional[Transaction] = None) -> Optional[T]:
+    """Runs a Delta write under an idempotent transaction, retrying it if its commit conflicts
+
+    Each write carries a new application transaction (writer_id, version), where versions are
+    increasing microsecond timestamps, so a writer_id reused by a later process never looks committed.
+    Before retrying, the transaction gets looked up in the table, so a write that did land never
+    gets applied twice. Only commit conflicts (i.e., CommitFailedError) get retried.
+    The write gets called with the CommitProperties to pass on, and it must re-read the table
+    (e.g., through get_delta_table) so each retry works on the latest version
+
+    The write holds the lock of the table (see get_table_lock), so the writes of this metastore to
+    a table, including the shared system tables, commit one at a time and in transaction order
+
+    Args:
+      table_path (str): the path of the Delta Table
+      write (Callable[[CommitProperties], T]): the write to run
+      retries (optional) (int): the max number of retries (default self.commit_retries)
+      transaction (optional) (Transaction): if applicable, the transaction to replay instead of a new one,
+        skipping the write if it already committed (default None)
+
+    Returns:
+      result (Optional[T]): the result of the write, or None if it had already committed
+    """
+    with self.get_table_lock(table_path):
+      if transaction is not None and self._is_committed(table_path, transaction):
+        return None
+      if transaction is None:
+        with self._lock:
+          self._transaction_version: int = max(self._transaction_version + 1, time_ns() // 1000)
+          transaction: Transaction = Transaction(app_id=self.writer_id, version=self._transaction_version)
+      retries: int = self.commit_retries if retries is None else retries
+
+      for attempt in range(retries + 1):
+        try:
+          return write(CommitProperties(app_transactions=[transaction]))
+        except CommitFailedError:
+          if self._is_committed(table_path, transaction):
+            return None
+          if attempt == retries:
+            raise
+          delay: float = self.commit_backoff_seconds * 2 ** attempt * (1 + random())
+          print(f'  - Commit to {table_path} failed, retrying in {delay:.2f}s ({attempt + 1} of {retries})')
+          sleep(delay)
+
+  def evict_delta_table(self, table_path: str) -> None:
+    """Removes the DeltaTable handles of a table from the cache of every thread, typically after dropping it
+
+    Args:
+      table_path (str): the path of the Delta Table
+    """
+    with self._lock:
+      for key in [k for k in self._delta_tables if k[1] == table_path]:
+        self._delta_tables.pop(key)
+
+  def list_table_paths(self) -> list[str]:
+    """Retrieves the paths of every Delta Table in the metastore
+
+    This includes the registered tables, the quarantine tables, and the system tables, skipping
+      registered tables that have not been created yet (e.g., deferred in lazy mode)
+    
+    Returns:
+      table_paths (list[str]): the paths of the Delta Tables
+    """
+    table_paths: list[str] = [
+      p for p in self.get_catalog().get_column('table_path').to_list()
+      if path.isdir(path.join(p, '_delta_log'))
+    ]
+    for domain in listdir(self.quarantine_directory):
+      for quality in listdir(path.join(self.quarantine_directory, domain)):
+        for name in listdir(path.join(self.quarantine_directory, domain, quality)):
+          table_path: str = path.join(self.quarantine_directory, domain, quality, name)
+          if path.isdir(path.join(table_path, '_delta_log')):
+            table_paths.append(table_path)
+    return table_paths + [self.file_history_path, self.pipe_history_path, self.watermark_path, self.catalog_path]
+
+  def optimize_table(self, table_path: str, target_size: Optional[int] = None, z_order_columns: list[str] = [],
+                     write_properties: Optional[WriteProperties] = None) -> Optional[dict[str, Any]]:
+    """Compacts the small files of a Delta Table into larger ones, optionally clustering them by Z-order
+
+    The rewrite commits through commit, so it holds the lock of the table and retries on conflicts
+
+    Args:
+      table_path (str): the path of the Delta Table
+      target_size (optional) (int): if applicable, the target file size in bytes
+        (default write_properties.target_file_size, or deltalake's 256MB)
+      z_order_columns (optional) (list[str]): if applicable, the columns by which to Z-order the data
+      write_properties (optional) (WriteProperties): the write properties of the table (default self.write_properties)
+
+    Returns:
+      metrics (Optional[dict[str, Any]]): the optimize metrics reported by deltalake
+    """
+    options: dict[str, Any] = (write_properties or self.write_properties).to_optimize_options(target_size)
+    if z_order_columns:
+      return self.commit(table_path, lambda commit_properties: self.get_delta_table(table_path) \
+        .optimize.z_order(z_order_columns, commit_properties=commit_properties, **options))
+    return self.commit(table_path, lambda commit_properties: self.get_delta_table(table_path) \
+      .optimize.compact(commit_properties=commit_properties, **options))
+
+  def maintain(self, small_file_bytes: int = 16 * 1024 * 1024, min_small_files: int = 10,
+               target_size: Optional[int] = None, vacuum_retention_hours: Optional[int] = None,
+               checkpoint_interval: int = 100) -> DataFrame:
+    """Runs compaction, vacuum, and checkpointing across every Delta Table in the metastore
+
+    For each table:
+      1. Compacts the files if at least min_small_files are smaller than small_file_bytes
+      2. Vacuums unreferenced files older than vacuum_retention_hours
+      3. Checkpoints the log if checkpoint_interval commits have happened since the last checkpoint
+
+    Args:
+      small_file_bytes (int): the size under which a file counts as small (default 16MB)
+      min_small_files (int): the number of small files that triggers compaction (default 10)
+      target_size (optional) (int): if applicable, the target file size in bytes for compaction
+      vacuum_retention_hours (optional) (int): if applicable, the retention period (default the table's)
+      checkpoint_interval (int): the number of commits that triggers a checkpoint (default 100)
+
+    Returns:
+      df (DataFrame): a summary of the maintenance performed on each table
+    """
+    summary: list[dict[str, Any]] = []
+    for table_path in self.list_table_paths():
+      print(f'Maintaining table {table_path}')
+      sizes: list[int] = pl \
+        .from_arrow(self.get_delta_table(table_path).get_add_actions()) \
+        .get_column('size_bytes') \
+        .to_list()
+      small_files: int = len([s for s in sizes if s < small_file_bytes])
+
+      # Compact small files
+      files_compacted: int = 0
+      if small_files >= min_small_files:
+        metrics: Optional[dict[str, Any]] = self.optimize_table(table_path, target_size)
+        files_compacted: int = 0 if metrics is None else metrics['numFilesRemoved']
+
+      # Remove unreferenced files past the retention period
+      files_vacuumed: int = len(self.get_delta_table(table_path) \
+        .vacuum(retention_hours=vacuum_retention_hours, dry_run=False))
+
+      # Checkpoint the log if enough commits have happened
+      dt: DeltaTable = self.get_delta_table(table_path)
+      checkpointed: bool = dt.version() - self._last_checkpoint_version(table_path) >= checkpoint_interval
+      if checkpointed:
+        dt.create_checkpoint()
+
+      summary.append({
+        'table_path': table_path,
+        'file_count': len(sizes),
+        'small_file_count': small_files,
+        'files_compacted': files_compacted,
+        'files_vacuumed': files_vacuumed,
+        'checkpointed': checkpointed
+      })
+    return DataFrame(summary, schema={
+      'table_path': pl.String,
+      'file_count': pl.Int64,
+      'small_file_count': pl.Int64,
+      'files_compacted': pl.Int64,
+      'files_vacuumed': pl.Int64,
+      'checkpointed': pl.Boolean
+    })
+
+  def get_catalog(self) -> DataFrame:
+    """Retrieves the catalog of registered tables
+
+    The catalog is cached in-process and only re-read once the catalog table has a new version
+    
+    Returns:
+      df (DataFrame): the catalog DataFrame
+    """
+    version: int = self.get_delta_table(self.catalog_path).version()
+    cached: Optional[tuple[int, DataFrame]] = self._catalog
+    if cached is not None and cached[0] == version:
+      return cached[1]
+    df: DataFrame = pl.read_delta(self.get_delta_table(self.catalog_path))
+    self._catalog: Optional[tuple[int, DataFrame]] = (version, df)
+    return df
+
+  def get_catalog_entry(self, table_id: str) -> Optional[dict[str, Any]]:
+    """Retrieves the catalog record of a table
+
+    Args:
+      table_id (str): the unique ID of the table
+    
+    Returns:
+      entry (Optional[dict[str, Any]]): the catalog record, or None if the table is not registered
+    """
+    df: DataFrame = self.get_catalog().filter(pl.col('table_id').eq(table_id))
+    return df.row(0, named=True) if not df.is_empty() else None
+
+  def register_table(self, domain: str, quality: TableQuality, name: str, table_path: str,
+                     partition_keys: list[str] = [], primary_keys: list[str] = []) -> None:
+    """Records a table in the catalog, replacing any earlier record of it
+
+    The schema and registered_version come from the Delta Table at registration, and they are not
+      updated by later writes (use get_delta_table for the current version)
+
+    Args:
+      domain (str): the domain of the table
+      quality (TableQuality): the quality of the table
+      name (str): the name of the table
+      table_path (str): the path of the Delta Table
+      partition_keys (list[str]): if applicable, the partition keys of the table
+      primary_keys (list[str]): if applicable, the primary keys of the table
+    """
+    dt: DeltaTable = self.get_delta_table(table_path)
+    self._merge_catalog([{
+      'table_id': '.'.join([domain, quality.value, name]),
+      'domain': domain,
+      'quality': quality.value,
+      'name': name,
+      'table_path': table_path,
+      'schema': dt.schema().to_json(),
+      'partition_keys': partition_keys,
+      'primary_keys': primary_keys,
+      'registered_version': dt.version(),
+      '_updated_ts': datetime.now(UTC)
+    }])
+
+  def unregister_table(self, table_id: str) -> None:
+    """Removes a table from the catalog, typically after dropping it
+
+    Args:
+      table_id (str): the unique ID of the table
+    """
+    self.commit(self.catalog_path, lambda commit_properties: self
+      .get_delta_table(self.catalog_path)
+      .delete(f'table_id = \'{table_id}\'', commit_properties=commit_properties)
+    )
+
+  def _merge_catalog(self, records: list[dict[str, Any]]) -> None:
+    """Upserts records into the catalog by table_id
+
+    Args:
+      records (list[dict[str, Any]]): the catalog records
+    """
+    df: DataFrame = DataFrame(records, schema=Maps.deltalake_schema_to_polars_schema(catalog))
+    self.commit(self.catalog_path, lambda commit_properties: df
+      .write_delta(
+        target=self.get_delta_table(self.catalog_path),
+        mode='merge',
+        delta_merge_options={
+          'predicate': 's.table_id = t.table_id',
+          'source_alias': 's',
+          'target_alias': 't',
+          'commit_properties': commit_properties,
+          **self.write_properties.to_merge_options()
+        }
+      )
+      .when_matched_update_all()
+      .when_not_matched_insert_all()
+      .execute()
+    )
+
+  def _register_existing_tables(self) -> None:
+    """Registers the tables found in the tables directory, typically once when the catalog gets created
+
+    Primary keys are not stored in the Delta Tables, so they get recorded once each table registers itself
+    """
+    records: list[dict[str, Any]] = []
+    now: datetime = datetime.now(UTC)
+    for domain in listdir(self.tables_directory):
+      for quality in listdir(path.join(self.tables_directory, domain)):
+        for name in listdir(path.join(self.tables_directory, domain, quality)):
+          table_path: str = path.join(self.tables_directory, domain, quality, name)
+          if not path.isdir(path.join(table_path, '_delta_log')):
+            continue
+          dt: DeltaTable = DeltaTable(table_path)
+          records.append({
+            'table_id': '.'.join([domain, quality, name]),
+            'domain': domain,
+            'quality': quality,
+            'name': name,
+            'table_path': table_path,
+            'schema': dt.schema().to_json(),
+            'partition_keys': dt.metadata().partition_columns,
+            'primary_keys': [],
+            'registered_version': dt.version(),
+            '_updated_ts': now
+          })
+    if records:
+      self._merge_catalog(records)
+
   def list_domains(self) -> list[str]:
-    """Retrieves the directories and names of available domains
+    """Retrieves the names of the domains with registered tables
     
     Returns:
-      domains (list[str]): the available qualities
+      domains (list[str]): the available domains
     """
-    return listdir(self.tables_directory)
+    return self.get_catalog().get_column('domain').unique().sort().to_list()
 
   def list_qualities(self, domain: str) -> list[TableQuality]:
     """Retrieves the available table qualities for a domain
@@ -131,10 +675,17 @@ class Metastore:
     Returns:
       qualities (list[TableQuality]): the available qualities for that domain
     """
-    qualities_path: str = path.join(self.tables_directory, domain)
-    if not path.exists(qualities_path):
+    qualities: list[str] = (self
+      .get_catalog()
+      .filter(pl.col('domain').eq(domain))
+      .get_column('quality')
+      .unique()
+      .sort()
+      .to_list()
+    )
+    if not qualities:
       raise DomainDoesNotExist(domain)
-    return [TableQuality(q) for q in listdir(qualities_path)]
+    return [TableQuality(q) for q in qualities]
 
   def domain_exists(self, domain: str) -> bool:
     """Indicates whether the domain exists
@@ -145,7 +696,7 @@ class Metastore:
     Returns:
       domain_exists (bool): indicates whether the domain exists
     """
-    return path.exists(path.join(self.tables_directory, domain))
+    return domain in self.list_domains()
 
   def quality_exists(self, domain: str, quality: TableQuality) -> bool:
     """Indicates whether the quality exists under a given domain
@@ -157,7 +708,9 @@ class Metastore:
     Returns:
       quality_exists (bool): indicates whether the quality exists
     """
-    return path.exists(path.join(self.tables_directory, domain, quality.value))
+    if not self.domain_exists(domain):
+      return False
+    return quality.value in [q.value for q in self.list_qualities(domain)]
 
   def get_file_history(self, table_id: str) -> DataFrame:
     """Retrieves a file_history DataFrame for a table by id
@@ -168,34 +721,100 @@ class Metastore:
     Returns:
       df (DataFrame): the resulting file history DataFrame
     """
+    df: DataFrame = self._get_file_history_store(table_id).get_file_history(table_id)
+    buffered: Optional[DataFrame] = self._get_buffered_file_history(table_id)
+    if buffered is None:
+      return df
     return (pl
-      .read_delta(self.file_history_path)
-      .filter(pl.col('table_id').eq(table_id))
-      .select('_file_path', '_file_mod_ts')
-      .unique()
+      .concat([df, buffered])
       .group_by('_file_path')
       .agg(pl.col('_file_mod_ts').max())
     )
 
+  def filter_unseen_files(self, table_id: str, df: DataFrame) -> DataFrame:
+    """Keeps the files that were never ingested into a table, or got modified since
+
+    Args:
+      table_id (str): the unique ID of the table
+      df (DataFrame): the candidate files, containing _file_path and _file_mod_ts
+    
+    Returns:
+      df (DataFrame): the candidate files left to ingest
+    """
+    df: DataFrame = self._get_file_history_store(table_id).filter_unseen_files(table_id, df)
+    buffered: Optional[DataFrame] = self._get_buffered_file_history(table_id)
+    return df if buffered is None else FileHistoryStore.filter_by_history(df, buffered)
+
+  def _get_buffered_file_history(self, table_id: str) -> Optional[DataFrame]:
+    """Retrieves the file history of a table still buffered for the file_history table
+
+    Args:
+      table_id (str): the unique ID of the table
+    
+    Returns:
+      df (Optional[DataFrame]): the buffered file paths and modification times, or None if there are none
+    """
+    if self._system_write_buffer is None:
+      return None
+    df: Optional[DataFrame] = self._system_write_buffer.get_records(self.file_history_path)
+    if df is None:
+      return None
+    df: DataFrame = df.filter(pl.col('table_id').eq(table_id)).select('_file_path', '_file_mod_ts')
+    return None if df.is_empty() else df
+
+  def _get_file_history_store(self, table_id: str) -> FileHistoryStore:
+    """Retrieves the store serving file history lookups of a table, synced with the file_history table
+
+    A file_history_store gets the history of a table loaded from the file_history table the first
+      time, and afterwards catches up on the commits made since its synced version. If the log no
+      longer covers that version, or the commits removed history of the table, it gets reloaded
+
+    Args:
+      table_id (str): the unique ID of the table
+    
+    Returns:
+      store (FileHistoryStore): the file history store
+    """
+    if self.file_history_store is None:
+      return self._delta_file_history_store
+    version: int = self.get_delta_table(self.file_history_path).version()
+    synced_version: Optional[int] = self.file_history_store.get_synced_version(table_id)
+    if synced_version is not None and synced_version >= version:
+      return self.file_history_store
+
+    df: Optional[DataFrame] = self._delta_file_history_store.get_file_history_since(
+      table_id,
+      synced_version,
+      version
+    ) if synced_version is not None else None
+    if df is None:
+      self.file_history_store.clear_file_history(table_id)
+      df: DataFrame = self._delta_file_history_store.get_file_history(table_id)
+    self.file_history_store.write_file_history(table_id, df)
+    self.file_history_store.set_synced_version(table_id, version)
+    return self.file_history_store
+
+  async def aget_file_history(self, table_id: str) -> DataFrame:
+    """Retrieves a file_history DataFrame for a table by id without blocking the event loop
+
+    Args:
+      table_id (str): the unique ID of the table
+    
+    Returns:
+      df (DataFrame): the resulting file history DataFrame
+    """
+    return await self.run_table_async(self.file_history_path, self.get_file_history, table_id)
+
   def write_file_history(self, table_id: str, df: DataFrame) -> None:
-    """Writes the file history into the system table
+    """Writes the file history into the system table, and into the file_history_store if applicable
     
     Args:
       table_id (str): the unique ID of the table
       df (DataFrame): the DataFrame containing history information
     """
-    df: DataFrame = (df
-      .select(
-        pl.lit(table_id).alias('table_id'),
-        pl.col('_file_path'),
-        pl.col('_file_mod_ts'),
-        pl.col('_ingested_ts')
-      )
-    )
-    df.write_delta(
-      target=self.file_history_path,
-      mode='append'
-    )
+    self._delta_file_history_store.write_file_history(table_id, df)
+    if self.file_history_store is not None:
+      self._get_file_history_store(table_id).write_file_history(table_id, df)
 
   def clear_file_history(self, table_id: str) -> None:
     """Removes the file history of a table, typically after truncation
@@ -203,7 +822,10 @@ class Metastore:
     Args:
       table_id (str): the unique ID of the table
     """
-    DeltaTable(self.file_history_path).delete(f'table_id = \'{table_id}\'')
+    self.flush_system_writes()
+    self._delta_file_history_store.clear_file_history(table_id)
+    if self.file_history_store is not None:
+      self.file_history_store.clear_file_history(table_id)
 
   def write_pipe_history(self, pipe_id: str, execution_start_ts: datetime, strict: bool,
                          succeeded: bool, in_memory: bool, passed_count: int,
@@ -234,13 +856,35 @@ class Metastore:
       'failed_count': failed_count,
       'quarantined_count': quarantined_count
     }
-    DataFrame([record]).write_delta(
-      target=self.pipe_history_path,
-      mode='append'
+    self.append_system_records(
+      self.pipe_history_path,
+      DataFrame([record], schema=Maps.deltalake_schema_to_polars_schema(pipe_history))
     )
 
+  def append_system_records(self, table_path: str, df: DataFrame) -> None:
+    """Appends records to a system table, or buffers them if buffer_system_writes is enabled
+
+    Args:
+      table_path (str): the path of the system table
+      df (DataFrame): the records to append
+    """
+    self.ensure_initialized()
+    if self._system_write_buffer is not None:
+      self._system_write_buffer.append(table_path, df)
+      return
+    self.commit(table_path, lambda commit_properties: df.write_delta(
+      target=self.get_delta_table(table_path),
+      mode='append',
+      delta_write_options={**self.write_properties.to_write_options(), 'commit_properties': commit_properties}
+    ))
+
+  def flush_system_writes(self) -> None:
+    """Commits any buffered system table records, typically at the end of a pipeline"""
+    if self._system_write_buffer is not None:
+      self._system_write_buffer.flush()
+
   def get_pipe_history(self, pipe_id: str = '') -> DataFrame:
-    """Retrieves the pipe_history system table
+    """Retrieves the pipe_history system table, including any buffered records
     
     Args:
       pipe_id (str): if applicable, the unique ID of the pipe
@@ -248,7 +892,138 @@ class Metastore:
     Returns:
       df (DataFrame): the pipe_history DataFrame
     """
-    df: DataFrame = pl.read_delta(self.pipe_history_path)
+    df: DataFrame = pl.read_delta(self.get_delta_table(self.pipe_history_path))
+    buffered: Optional[DataFrame] = self._system_write_buffer.get_records(self.pipe_history_path) \
+      if self._system_write_buffer is not None else None
+    if buffered is not None:
+      df: DataFrame = pl.concat([df, buffered.select(df.columns)], how='vertical_relaxed')
     if pipe_id:
       df: DataFrame = df.filter(pl.col('pipe_id').eq(pipe_id))
     return df
+
+  def get_watermark(self, consumer_id: str, table_id: str) -> int:
+    """Retrieves the last version of a source table processed by a consumer
+
+    The filters get pushed into the scan, so only the partition of the consumer gets read
+
+    Args:
+      consumer_id (str): the unique ID of the consumer (e.g., the ID of the target table)
+      table_id (str): the unique ID of the source table
+
+    Returns:
+      version (int): the last processed version, or -1 if the consumer has not processed the table
+    """
+    version: Optional[int] = (pl
+      .scan_delta(self.get_delta_table(self.watermark_path))
+      .filter(pl.col('consumer_id').eq(consumer_id), pl.col('table_id').eq(table_id))
+      .select(pl.col('version').max())
+      .collect()
+      .item()
+    )
+    return -1 if version is None else version
+
+  def stage_watermark(self, consumer_id: str, table_id: str, version: int) -> None:
+    """Stages the version of a source table read by a consumer until commit_watermarks() runs
+
+    Args:
+      consumer_id (str): the unique ID of the consumer
+      table_id (str): the unique ID of the source table
+      version (int): the version of the source table that got read
+    """
+    with self._lock:
+      self._staged_watermarks.setdefault(consumer_id, {})[table_id] = version
+
+  def commit_watermarks(self, consumer_id: str) -> None:
+    """Persists the staged watermarks of a consumer, typically after its data got saved
+
+    Args:
+      consumer_id (str): the unique ID of the consumer
+    """
+    with self._lock:
+      staged: dict[str, int] = self._staged_watermarks.pop(consumer_id, {})
+    if not staged:
+      return
+    now: datetime = datetime.now(UTC)
+    df: DataFrame = DataFrame(
+      data=[
+        {'consumer_id': consumer_id, 'table_id': t, 'version': v, '_updated_ts': now}
+        for t, v in staged.items()
+      ],
+      schema={
+        'consumer_id': pl.String,
+        'table_id': pl.String,
+        'version': pl.Int64,
+        '_updated_ts': pl.Datetime(time_zone='UTC')
+      }
+    )
+    self.commit(self.watermark_path, lambda commit_properties: df
+      .write_delta(
+        target=self.get_delta_table(self.watermark_path),
+        mode='merge',
+        delta_merge_options={
+          'predicate': 's.consumer_id = t.consumer_id AND s.table_id = t.table_id',
+          'source_alias': 's',
+          'target_alias': 't',
+          'commit_properties': commit_properties,
+          **self.write_properties.to_merge_options()
+        }
+      )
+      .when_matched_update_all()
+      .when_not_matched_insert_all()
+      .execute()
+    )
+
+  def discard_watermarks(self, consumer_id: str) -> None:
+    """Drops the staged watermarks of a consumer, typically after a failed or in-memory run
+
+    Args:
+      consumer_id (str): the unique ID of the consumer
+    """
+    with self._lock:
+      self._staged_watermarks.pop(consumer_id, None)
+
+  def clear_watermarks(self, consumer_id: str) -> None:
+    """Removes the watermarks of a consumer so it reprocesses its sources, typically after truncation
+
+    Args:
+      consumer_id (str): the unique ID of the consumer
+    """
+    self.discard_watermarks(consumer_id)
+    self.commit(self.watermark_path, lambda commit_properties: self
+      .get_delta_table(self.watermark_path)
+      .delete(f'consumer_id = \'{consumer_id}\'', commit_properties=commit_properties)
+    )
+
+  def _is_committed(self, table_path: str, transaction: Transaction) -> bool:
+    """Indicates whether an application transaction has committed to a Delta Table
+
+    Args:
+      table_path (str): the path of the Delta Table
+      transaction (Transaction): the application transaction
+
+    Returns:
+      is_committed (bool): True if the table records the transaction's version or a later one
+    """
+    try:
+      committed: Optional[Transaction] = self.get_delta_table(table_path) \
+        .transaction_versions() \
+        .get(transaction.app_id)
+    except TableNotFoundError:
+      return False
+    return committed is not None and committed.version >= transaction.version
+
+  @staticmethod
+  def _last_checkpoint_version(table_path: str) -> int:
+    """Retrieves the version of the latest checkpoint of a Delta Table
+
+    Args:
+      table_path (str): the path of the Delta Table
+
+    Returns:
+      version (int): the latest checkpoint version, or -1 if there is none
+    """
+    last_checkpoint_path: str = path.join(table_path, '_delta_log', '_last_checkpoint')
+    if not path.exists(last_checkpoint_path):
+      return -1
+    with open(last_checkpoint_path, 'r') as f:
+      return load(f)['version']
@@ -58,6 +58,9 @@ class Pipe:
     # Record when the execution began
     execution_start: datetime = datetime.now(UTC)
 
+    # Drop any source watermarks staged by an earlier run that never saved
+    self.table.metastore.discard_watermarks(self.table.id)
+
     # Load in any extra data before transformation
     dfs.update(self.logic.get_dfs())
 
@@ -81,8 +84,10 @@ class Pipe:
     succeeded: bool = (not strict) or (not passed.is_empty())
 
     # For standard runs and non-exports, save the passed data
+    # Once saved, the sources read incrementally are processed up to the versions read
     if isinstance(self.logic, (Ingester, Transformer)) and not in_memory:
       self.save(passed)
+      self.table.metastore.commit_watermarks(self.table.id)
     
     # For exports, export the data
     if isinstance(self.logic, Exporter):
@@ -117,17 +122,21 @@ class Pipe:
     Args:
       df (DataFrame): the DataFrame to load
     """
-    self.table.create_if_not_exists(
-      table_path=self.table.table_path,
-      schema=self.table.schema.deltalake
-    )
+    # Ensure the table exists, reusing its cached handle if available
+    self.table.get_as_delta_table()
     print(f'Loading {df.shape[0]} record(s) into {self.table.table_path}')
 
     if self.write_logic.value == WriteLogic.APPEND.value:
       self.table.append(df)
     elif self.write_logic.value == WriteLogic.OVERWRITE.value:
       self.table.overwrite(df)
+    elif self.write_logic.value == WriteLogic.PARTITION_OVERWRITE.value:
+      self.table.overwrite_partitions(df)
     elif self.write_logic.value == WriteLogic.UPSERT.value:
       self.table.upsert(df)
+    elif self.write_logic.value == WriteLogic.SYNC.value:
+      self.table.sync(df)
+    elif self.write_logic.value == WriteLogic.CDC.value:
+      self.table.apply_changes(df)
     else:
       raise WriteLogicNotRecognized(self.write_logic)
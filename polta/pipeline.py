@@ -46,17 +46,39 @@ class Pipeline:
     Args:
       skip_exports (bool): indicates whether to skip the export layer (default False)
     """
-    for pipe in self.raw_pipes:
-      pipe.execute()
-    for pipe in self.conformed_pipes:
-      pipe.execute()
-    for pipe in self.standard_pipes:
-      pipe.execute()
-    for pipe in self.canonical_pipes:
-      pipe.execute()
-    if not skip_exports:
-      for pipe in self.export_pipes:
+    try:
+      for pipe in self.raw_pipes:
+        pipe.execute()
+      for pipe in self.conformed_pipes:
         pipe.execute()
+      for pipe in self.standard_pipes:
+        pipe.execute()
+      for pipe in self.canonical_pipes:
+        pipe.execute()
+      if not skip_exports:
+        for pipe in self.export_pipes:
+          pipe.execute()
+    except Exception:
+      # Still commit what the pipes buffered, without hiding the error of the pipe
+      try:
+        self._flush_system_writes()
+      except Exception as e:
+        print(f'  - Flushing the buffered system table records failed: {e!r}')
+      raise
+    self._flush_system_writes()
+
+  def _flush_system_writes(self) -> None:
+    """Commits the system table records buffered by the pipes, once per metastore"""
+    for metastore in {id(p.table.metastore): p.table.metastore for p in self._get_pipes()}.values():
+      metastore.flush_system_writes()
+
+  def _get_pipes(self) -> list[Pipe]:
+    """Retrieves every pipe in the pipeline in order of layer
+
+    Returns:
+      pipes (list[Pipe]): the pipes
+    """
+    return self.raw_pipes + self.conformed_pipes + self.standard_pipes + self.canonical_pipes + self.export_pipes
 
   def _in_memory_execute(self, skip_exports: bool = False) -> None:
     """Executes all available pipes in order of layer without saving to the metastore
@@ -1,6 +1,20 @@
 from deltalake import Field, Schema
+from deltalake.schema import ArrayType
 
 
+catalog: Schema = Schema([
+  Field('table_id', 'string'),
+  Field('domain', 'string'),
+  Field('quality', 'string'),
+  Field('name', 'string'),
+  Field('table_path', 'string'),
+  Field('schema', 'string'),
+  Field('partition_keys', ArrayType('string')),
+  Field('primary_keys', ArrayType('string')),
+  Field('registered_version', 'long'),
+  Field('_updated_ts', 'timestamp')
+])
+
 file_history: Schema = Schema([
   Field('table_id', 'string'),
   Field('_file_path', 'string'),
@@ -21,3 +35,10 @@ pipe_history: Schema = Schema([
   Field('failed_count', 'long'),
   Field('quarantined_count', 'long')
 ])
+
+watermark: Schema = Schema([
+  Field('consumer_id', 'string'),
+  Field('table_id', 'string'),
+  Field('version', 'long'),
+  Field('_updated_ts', 'timestamp')
+])
@@ -33,6 +33,10 @@ standard_metadata: Schema = Schema([
   Field('_modified_ts', 'timestamp')
 ])
 
+row_hash_metadata: Schema = Schema([
+  Field('_row_hash', 'long')
+])
+
 failed_test: Schema = Schema([
   Field('failed_test', 'string')
 ])
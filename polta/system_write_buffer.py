@@ -0,0 +1,251 @@
+import atexit
+import polars as pl
+import weakref
+
+from dataclasses import dataclass, field
+from deltalake import Transaction
+from os import fsync, listdir, makedirs, path, remove, rmdir
+from polars import DataFrame
+from threading import RLock, Timer
+from time import monotonic, time_ns
+from typing import IO, Optional, TYPE_CHECKING
+
+from polta.maps import Maps
+
+try:
+  import fcntl
+except ImportError:
+  fcntl = None
+
+if TYPE_CHECKING:
+  from polta.metastore import Metastore
+
+
+@dataclass
+class SystemWriteBuffer:
+  """Buffers system table records and flushes them with one commit per table
+
+  Every buffered record is appended to a local spool before it is kept in memory, one NDJSON file
+    per batch and table under the metastore's spool directory. A flush commits each table's records
+    under the application transaction (spool_id, batch), so a batch that committed right before a
+    crash is never committed twice when its spool gets recovered. Batches are numbered by increasing
+    microsecond timestamps, so a spool_id reused by a later process never looks committed
+
+  Spools left by processes that exited without flushing are recovered when the next buffer starts,
+    which relies on file locks (i.e., fcntl) to tell them apart from spools of running processes.
+    A buffer also recovers what is left in its own spool, in case its writer_id was used before
+
+  The first buffered record starts a background timer, so records get flushed once they are
+    flush_interval_seconds old even if nothing else gets buffered. The buffer also gets closed at
+    process exit, without the exit hook keeping it (and its metastore) alive until then
+
+  Args:
+    metastore (Metastore): the metastore owning the system tables
+    max_records (int): the number of buffered records that triggers a flush (default 1000)
+    flush_interval_seconds (float): the age of the oldest buffered record that triggers a flush (default 60.0)
+
+  Initialized Fields:
+    spool_id (str): the application ID of the flushes of this buffer (i.e., the metastore's writer_id + '-spool')
+    spool_directory (str): the directory of the spool files of this buffer
+  """
+  metastore: 'Metastore'
+  max_records: int = field(default_factory=lambda: 1000)
+  flush_interval_seconds: float = field(default_factory=lambda: 60.0)
+
+  spool_id: str = field(init=False)
+  spool_directory: str = field(init=False)
+  _records: dict[str, list[DataFrame]] = field(init=False, repr=False, compare=False)
+  _record_count: int = field(init=False, repr=False, compare=False)
+  _batch: int = field(init=False, repr=False, compare=False)
+  _first_buffered: Optional[float] = field(init=False, repr=False, compare=False)
+  _lock: RLock = field(init=False, repr=False, compare=False)
+  _lock_file: Optional[IO] = field(init=False, repr=False, compare=False)
+  _timer: Optional[Timer] = field(init=False, repr=False, compare=False)
+
+  def __post_init__(self) -> None:
+    self.spool_id: str = f'{self.metastore.writer_id}-spool'
+    self.spool_directory: str = path.join(self.metastore.spool_directory, self.spool_id)
+    self._records: dict[str, list[DataFrame]] = {}
+    self._record_count: int = 0
+    self._batch: int = time_ns() // 1000
+    self._first_buffered: Optional[float] = None
+    self._lock: RLock = RLock()
+    self._timer: Optional[Timer] = None
+    makedirs(self.spool_directory, exist_ok=True)
+    self._lock_file: Optional[IO] = self._acquire_spool_lock(self.spool_directory)
+    self.recover()
+    atexit.register(SystemWriteBuffer._close_at_exit, weakref.ref(self))
+
+  def append(self, table_path: str, df: DataFrame) -> None:
+    """Buffers records of a system table, flushing the buffer if it is full or old enough
+
+    Args:
+      table_path (str): the path of the system table
+      df (DataFrame): the records to buffer
+    """
+    with self._lock:
+      spool_path: str = path.join(self.spool_directory, f'{self._batch:020}.{path.basename(table_path)}.ndjson')
+      with open(spool_path, 'a') as f:
+        f.write(df.write_ndjson())
+        f.flush()
+        fsync(f.fileno())
+      self._records.setdefault(table_path, []).append(df)
+      self._record_count += df.shape[0]
+      if self._first_buffered is None:
+        self._first_buffered: Optional[float] = monotonic()
+        self._start_timer()
+      if self._record_count >= self.max_records \
+        or monotonic() - self._first_buffered >= self.flush_interval_seconds:
+        self.flush()
+
+  def get_records(self, table_path: str) -> Optional[DataFrame]:
+    """Retrieves the buffered records of a system table
+
+    Args:
+      table_path (str): the path of the system table
+
+    Returns:
+      df (Optional[DataFrame]): the buffered records, or None if there are none
+    """
+    with self._lock:
+      dfs: list[DataFrame] = self._records.get(table_path, [])
+      return pl.concat(dfs) if dfs else None
+
+  def flush(self) -> None:
+    """Commits the buffered records, one commit per system table, and clears the spool"""
+    with self._lock:
+      if self._timer is not None:
+        self._timer.cancel()
+        self._timer: Optional[Timer] = None
+      if not self._records:
+        return
+      for table_path, dfs in self._records.items():
+        self._commit(table_path, pl.concat(dfs), Transaction(app_id=self.spool_id, version=self._batch))
+      for file_name in listdir(self.spool_directory):
+        if file_name.startswith(f'{self._batch:020}.'):
+          remove(path.join(self.spool_directory, file_name))
+      self._records: dict[str, list[DataFrame]] = {}
+      self._record_count: int = 0
+      self._batch: int = max(self._batch + 1, time_ns() // 1000)
+      self._first_buffered: Optional[float] = None
+
+  def close(self) -> None:
+    """Flushes the buffer and removes its spool directory, typically at process exit"""
+    with self._lock:
+      self.flush()
+      if self._lock_file is None or self._lock_file.closed:
+        return
+      self._lock_file.close()
+      remove(path.join(self.spool_directory, '.lock'))
+      rmdir(self.spool_directory)
+
+  def _start_timer(self) -> None:
+    """Starts the background timer flushing the buffer once its oldest record is old enough"""
+    self._timer: Optional[Timer] = Timer(self.flush_interval_seconds, self._flush_on_timer)
+    self._timer.daemon = True
+    self._timer.start()
+
+  def _flush_on_timer(self) -> None:
+    """Flushes the buffer from the background timer, keeping the records buffered if the flush fails"""
+    try:
+      self.flush()
+    except Exception as e:
+      print(f'  - Flushing the system table spool {self.spool_id} failed: {e!r}')
+      with self._lock:
+        if self._records and self._timer is None:
+          self._start_timer()
+
+  @staticmethod
+  def _close_at_exit(buffer_ref: 'weakref.ref[SystemWriteBuffer]') -> None:
+    """Closes a buffer at process exit if it still exists
+
+    Args:
+      buffer_ref (weakref.ref[SystemWriteBuffer]): the weak reference to the buffer
+    """
+    buffer: Optional[SystemWriteBuffer] = buffer_ref()
+    if buffer is not None:
+      buffer.close()
+
+  def recover(self) -> None:
+    """Commits the spools left by buffers whose processes exited without flushing"""
+    if not path.exists(self.metastore.spool_directory):
+      return
+    self._recover_spool(self.spool_id, self.spool_directory)
+    if fcntl is None:
+      return
+    for spool_id in sorted(listdir(self.metastore.spool_directory)):
+      spool_directory: str = path.join(self.metastore.spool_directory, spool_id)
+      if spool_id == self.spool_id or not path.isdir(spool_directory):
+        continue
+      lock_file: Optional[IO] = self._acquire_spool_lock(spool_directory)
+      if lock_file is None:
+        continue
+      try:
+        self._recover_spool(spool_id, spool_directory)
+      finally:
+        lock_file.close()
+      remove(path.join(spool_directory, '.lock'))
+      rmdir(spool_directory)
+
+  def _recover_spool(self, spool_id: str, spool_directory: str) -> None:
+    """Commits the batches of a locked spool under their application transactions, removing their files
+
+    Args:
+      spool_id (str): the application ID of the spool's flushes
+      spool_directory (str): the directory of the spool files
+    """
+    file_names: list[str] = sorted(f for f in listdir(spool_directory) if f.endswith('.ndjson'))
+    for file_name in file_names:
+      batch, table_name, _ = file_name.split('.')
+      table_path: str = path.join(self.metastore.sys_directory, table_name)
+      df: DataFrame = pl.read_ndjson(
+        path.join(spool_directory, file_name),
+        schema=Maps.deltalake_schema_to_polars_schema(self.metastore.get_delta_table(table_path).schema())
+      )
+      self._commit(table_path, df, Transaction(app_id=spool_id, version=int(batch)))
+      remove(path.join(spool_directory, file_name))
+    if file_names:
+      print(f'  - Recovered the system table spool {spool_id}')
+
+  def _commit(self, table_path: str, df: DataFrame, transaction: Transaction) -> None:
+    """Appends records to a system table under an application transaction, unless it already committed
+
+    Args:
+      table_path (str): the path of the system table
+      df (DataFrame): the records to append
+      transaction (Transaction): the application transaction of the batch
+    """
+    if df.is_empty():
+      return
+    self.metastore.commit(
+      table_path,
+      lambda commit_properties: df.write_delta(
+        target=self.metastore.get_delta_table(table_path),
+        mode='append',
+        delta_write_options={
+          **self.metastore.write_properties.to_write_options(),
+          'commit_properties': commit_properties
+        }
+      ),
+      transaction=transaction
+    )
+
+  @staticmethod
+  def _acquire_spool_lock(spool_directory: str) -> Optional[IO]:
+    """Locks a spool directory for as long as the returned file stays open
+
+    Args:
+      spool_directory (str): the spool directory
+
+    Returns:
+      lock_file (Optional[IO]): the open lock file, or None if another process holds the lock
+    """
+    lock_file: IO = open(path.join(spool_directory, '.lock'), 'a')
+    if fcntl is None:
+      return lock_file
+    try:
+      fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+      lock_file.close()
+      return None
+    return lock_file
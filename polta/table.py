@@ -1,23 +1,40 @@
 import polars as pl
+import pyarrow as pa
 
 from dataclasses import dataclass, field
-from datetime import datetime, UTC
-from deltalake import DeltaTable, Schema, TableFeatures
-from os import makedirs, path
-from polars import DataFrame
+from datetime import date, datetime, UTC
+from deltalake import CommitProperties, DeltaTable, Schema, TableFeatures, write_deltalake
+from deltalake.exceptions import TableNotFoundError
+from deltalake.table import TableMerger
+from json import loads
+from os import listdir, makedirs, path, remove, replace
+from polars import DataFrame, Expr, LazyFrame
+from polars.datatypes import DataType
 from shutil import rmtree
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional, Union
+from urllib.parse import unquote
 from uuid import uuid4
+from warnings import warn
 
 from polta.test import Test
 from polta.enums import CheckAction, TableQuality
 from polta.exceptions import (
+  FilterOperatorNotRecognized,
   PoltaDataFormatNotRecognized,
-  TableQualityNotRecognized
+  TableQualityNotRecognized,
+  UpsertChunkFailed
 )
+from polta.maps import Maps
 from polta.metastore import Metastore
 from polta.table_schema import TableSchema
-from polta.types import RawPoltaData
+from polta.types import (
+  ColumnStats,
+  FilterCondition,
+  RawPoltaData,
+  TableStats,
+  UpsertChunkMetrics
+)
+from polta.write_properties import WriteProperties
 
 
 @dataclass
@@ -35,6 +52,15 @@ class Table:
     primary_keys (list[str]): for upserts, the primary keys of the table (default [])
     partition_keys (list[str]): the keys by which to partition the table (default [])
     tests (list[Test]): test checks before loading any data
+    upsert_chunk_rows (int): if applicable, the max number of rows per upsert merge (default 0)
+    upsert_chunk_bytes (int): if applicable, the max estimated bytes per upsert merge (default 0)
+    row_hash (bool): indicates whether to store a _row_hash of the raw columns to skip unchanged upserts (default False)
+    write_properties (WriteProperties): the Parquet and Delta options for every write (default WriteProperties())
+    sync_delete_predicate (Optional[str]): for syncs, the SQL predicate scoping which missing rows get deleted (default None)
+    cdc_operation_column (Optional[str]): for CDC merges, the column with each change's operation (default None)
+    cdc_sequence_column (Optional[str]): for CDC merges, the column ordering the changes of each key (default None)
+    cdc_delete_operations (list[str]): for CDC merges, the operation values denoting deletes (default ['D'])
+    change_data_feed (bool): indicates whether to record row-level changes for read_changes() (default False)
   
   Initialized fields:
     id (str): the unique identifier for the table
@@ -48,6 +74,7 @@ class Table:
     quarantine_path (str): the path to the corresponding quarantine table
     schema.quarantine (Schema): the schema of the corresponding quarantine table
     failure_column (str): the column name for identifying failure records
+    key_index_path (str): the directory of the persisted primary key index for lookups
   """
   domain: str
   name: str
@@ -57,6 +84,15 @@ class Table:
   primary_keys: list[str] = field(default_factory=lambda: [])
   partition_keys: list[str] = field(default_factory=lambda: [])
   tests: list[Test] = field(default_factory=lambda: [])
+  upsert_chunk_rows: int = field(default_factory=lambda: 0)
+  upsert_chunk_bytes: int = field(default_factory=lambda: 0)
+  row_hash: bool = field(default_factory=lambda: False)
+  write_properties: WriteProperties = field(default_factory=lambda: WriteProperties())
+  sync_delete_predicate: Optional[str] = field(default_factory=lambda: None)
+  cdc_operation_column: Optional[str] = field(default_factory=lambda: None)
+  cdc_sequence_column: Optional[str] = field(default_factory=lambda: None)
+  cdc_delete_operations: list[str] = field(default_factory=lambda: ['D'])
+  change_data_feed: bool = field(default_factory=lambda: False)
 
   id: str = field(init=False)
   schema: TableSchema = field(init=False)
@@ -64,6 +100,10 @@ class Table:
   ingestion_zone_path: str = field(init=False)
   quarantine_path: str = field(init=False)
   merge_predicate: Optional[str] = field(init=False)
+  key_index_path: str = field(init=False)
+  _key_index: Optional[DataFrame] = field(init=False, repr=False, compare=False)
+  _key_index_version: int = field(init=False, repr=False, compare=False)
+  _key_index_uuid: Optional[str] = field(init=False, repr=False, compare=False)
 
   def __post_init__(self) -> None:
     self.id: str = '.'.join([
@@ -71,7 +111,7 @@ class Table:
       self.quality.value,
       self.name
     ])
-    self.schema: TableSchema = TableSchema(self.raw_schema, self.quality)
+    self.schema: TableSchema = TableSchema(self.raw_schema, self.quality, self.row_hash)
     self.table_path: str = path.join(
       self.metastore.tables_directory,
       self.domain,
@@ -90,23 +130,71 @@ class Table:
       self.name
     )
 
+    self.key_index_path: str = path.join(self.metastore.key_index_directory, self.id)
+    self._key_index: Optional[DataFrame] = None
+    self._key_index_version: int = -1
+    self._key_index_uuid: Optional[str] = None
+
     if self.primary_keys:
       self.merge_predicate: Optional[str] = Table.build_merge_predicate(self.primary_keys)
     else:
       self.merge_predicate: Optional[str] = None
+    if self.metastore.lazy:
+      self.metastore.defer_table(self.table_path, self._create)
+    else:
+      self._create()
+
+  def _create(self) -> None:
+    """Creates the ingestion zone, if applicable, and the Delta Table if they do not exist"""
     if self.quality.value == TableQuality.RAW.value:
       self._build_ingestion_zone_if_not_exists()
-    self.create_if_not_exists(self.table_path, self.schema.deltalake, self.partition_keys)
+    self.register_if_not_exists()
+
+  def ensure_exists(self) -> None:
+    """Creates the table if it was deferred by a lazy metastore and not created in this process yet"""
+    self.metastore.ensure_table(self.table_path)
+
+  def register_if_not_exists(self) -> None:
+    """Creates the Delta Table and records it in the metastore catalog, unless the catalog already has it
+
+    A table whose catalog record matches its path, schema, and keys is trusted to exist,
+      so it is not looked up on the filesystem. The catalog records the Delta Table's schema, so if
+      it differs from self.schema, the table only registers again once the Delta Table's schema changed
+    """
+    entry: Optional[dict[str, Any]] = self.metastore.get_catalog_entry(self.id)
+    registered: bool = entry is not None \
+      and entry['table_path'] == self.table_path \
+      and entry['partition_keys'] == self.partition_keys \
+      and entry['primary_keys'] == self.primary_keys
+    if registered and entry['schema'] == self.schema.deltalake.to_json():
+      return
+    self.create_if_not_exists(
+      table_path=self.table_path,
+      schema=self.schema.deltalake,
+      partition_keys=self.partition_keys,
+      configuration=self.build_configuration()
+    )
+    if registered and entry['schema'] == self.metastore.get_delta_table(self.table_path).schema().to_json():
+      return
+    self.metastore.register_table(
+      domain=self.domain,
+      quality=self.quality,
+      name=self.name,
+      table_path=self.table_path,
+      partition_keys=self.partition_keys,
+      primary_keys=self.primary_keys
+    )
 
   @staticmethod
-  def create_if_not_exists(table_path: str, schema: Schema,
-                           partition_keys: list[str] = []) -> None:
+  def create_if_not_exists(table_path: str, schema: Schema, partition_keys: list[str] = [],
+                           configuration: dict[str, str] = {}) -> None:
     """Creates a Delta Table if it does not exist
 
     Args:
         table_path (str): the path of the Delta Table
         schema (Schema): the table schema, in case the Delta Table needs to be created
         partition_keys (list[str]): any partition keys
+        configuration (dict[str, str]): any Delta table properties
     """
     if not isinstance(table_path, str):
       raise TypeError('Error: table_path must be of type <str>')
@@ -127,10 +215,15 @@ class Table:
       table_uri=table_path,
       schema=schema,
       mode='ignore',
-      partition_by=partition_keys or None
+      partition_by=partition_keys or None,
+      configuration=configuration or None
     )
+    # Writer version 7 only records the change data feed if its feature is listed
+    features: list[TableFeatures] = [TableFeatures.TimestampWithoutTimezone]
+    if configuration.get('delta.enableChangeDataFeed') == 'true':
+      features.append(TableFeatures.ChangeDataFeed)
     dt.alter.add_feature(
-      feature=TableFeatures.TimestampWithoutTimezone,
+      feature=features,
       allow_protocol_versions_increase=True
     )
 
@@ -146,8 +239,102 @@ class Table:
     """
     return ' AND '.join([f's.{k} = t.{k}' for k in primary_keys])
 
+  @staticmethod
+  def build_partition_predicate(df: DataFrame, partition_keys: list[str], alias: str = '',
+                                max_in_values: int = 100) -> Optional[str]:
+    """Constructs a SQL predicate limiting a write to the partition values present in a DataFrame
+
+    Each key becomes a literal IN-list of its distinct values, or a min/max range
+    if there are more than max_in_values distinct values
+
+    Args:
+      df (DataFrame): the DataFrame whose partition values to use
+      partition_keys (list[str]): the partition keys of the table
+      alias (optional) (str): if applicable, the table alias to prefix the columns (e.g., 't')
+      max_in_values (optional) (int): the max number of distinct values in an IN-list (default 100)
+
+    Returns:
+      partition_predicate (Optional[str]): the predicate as a conjunction of SQL conditions, if applicable
+    """
+    if not partition_keys or df.is_empty():
+      return None
+
+    conditions: list[str] = []
+    for key in partition_keys:
+      column: str = f'{alias}.{key}' if alias else key
+      values: list[Any] = df.get_column(key).drop_nulls().unique().sort().to_list()
+      if not values:
+        conditions.append(f'{column} IS NULL')
+      elif len(values) <= max_in_values:
+        conditions.append(f'{column} IN ({", ".join(Table.to_sql_literal(v) for v in values)})')
+      else:
+        conditions.append(
+          f'{column} >= {Table.to_sql_literal(values[0])} AND '
+          f'{column} <= {Table.to_sql_literal(values[-1])}'
+        )
+    return ' AND '.join(conditions)
+
+  @staticmethod
+  def build_partition_overwrite_predicate(df: DataFrame, partition_keys: list[str]) -> Optional[str]:
+    """Constructs a SQL predicate matching exactly the partitions present in a DataFrame
+
+    Unlike build_partition_predicate, the predicate never widens to a range or to a cross product
+    of values, so an overwrite scoped by it only replaces the partitions in the DataFrame
+
+    Args:
+      df (DataFrame): the DataFrame whose partitions to match
+      partition_keys (list[str]): the partition keys of the table
+
+    Returns:
+      partition_predicate (Optional[str]): the predicate as a disjunction of partitions, if applicable
+    """
+    if not partition_keys or df.is_empty():
+      return None
+
+    def to_condition(key: str, value: Any) -> str:
+      return f'{key} IS NULL' if value is None else f'{key} = {Table.to_sql_literal(value)}'
+
+    partitions: list[dict[str, Any]] = df.select(partition_keys).unique().sort(partition_keys).to_dicts()
+    if len(partition_keys) == 1:
+      key: str = partition_keys[0]
+      values: list[Any] = [p[key] for p in partitions if p[key] is not None]
+      conditions: list[str] = [f'{key} IN ({", ".join(Table.to_sql_literal(v) for v in values)})'] \
+        if values else []
+      if len(values) < len(partitions):
+        conditions.append(f'{key} IS NULL')
+    else:
+      conditions: list[str] = [
+        '(' + ' AND '.join(to_condition(k, p[k]) for k in partition_keys) + ')'
+        for p in partitions
+      ]
+    return ' OR '.join(conditions)
+
+  @staticmethod
+  def to_sql_literal(value: Any) -> str:
+    """Converts a Python value into a SQL literal for Delta predicates
+
+    Args:
+      value (Any): the value to convert
+
+    Returns:
+      literal (str): the SQL literal
+    """
+    if value is None:
+      return 'NULL'
+    elif isinstance(value, bool):
+      return 'true' if value else 'false'
+    elif isinstance(value, (int, float)):
+      return str(value)
+    elif isinstance(value, (date, datetime)):
+      return f"'{value.isoformat()}'"
+    else:
+      return "'" + str(value).replace("'", "''") + "'"
+
   def enforce_dataframe(self, data: RawPoltaData) -> DataFrame:
-    """Takes either a DataFrame or record(s) and returns the DataFrame representation
+    """Takes either a DataFrame, Arrow data, or record(s) and returns the DataFrame representation
+
+    Arrow tables and record batches get wrapped without copying their buffers,
+    while Arrow streams get read in full (append and upsert stream them instead)
     
     Args:
       data (RawPoltaData): the data to enforce
@@ -161,45 +348,78 @@ class Table:
       return DataFrame(data, self.schema.polars)
     elif isinstance(data, DataFrame):
       return data
+    elif isinstance(data, (pa.Table, pa.RecordBatch)):
+      return pl.from_arrow(data, rechunk=False)
+    elif self._is_arrow_stream(data):
+      return pl.from_arrow(self._to_arrow_reader(data).read_all(), rechunk=False)
     else:
       raise PoltaDataFormatNotRecognized(type(data))
 
-  def apply_tests(self, df: DataFrame) -> tuple[DataFrame, DataFrame, DataFrame]:
+  def apply_tests(self, df: Union[DataFrame, LazyFrame]) -> tuple[DataFrame, DataFrame, DataFrame]:
     """Applies each test case to the data
+
+    All tests get evaluated in a single pass, and each failing row is labelled
+    by the first test it failed in the order of self.tests. A test result of null
+    (e.g., a check comparing a null value) counts as failed, so no row goes unchecked
+
+    Expression checks get fused into the query plan of a LazyFrame input,
+    while function checks run eagerly on the collected DataFrame beforehand
     
     Args:
-      df (DataFrame): the DataFrame to test
+      df (Union[DataFrame, LazyFrame]): the data to test
 
     Returns:
       passed, failed, quarantined (DataFrame): the resulting DataFrames
     """
-    # Build three empty DataFrames to hold results
-    passed: DataFrame = DataFrame([], self.schema.polars)
+    # Build two empty DataFrames to hold results
     failed: DataFrame = DataFrame([], self.schema.quarantine)
     quarantined: DataFrame = DataFrame([], self.schema.quarantine)
 
     # Skip all tests they do not exist
     if not self.tests:
-      return df, failed, quarantined
-
-    # Iterate the available tests
-    for test in self.tests:
-      # Execute the test against the original DataFrame or the remaining records
-      res_df: DataFrame = test.run(df if passed.is_empty() else passed)
-
-      # Store the results either in a passed DataFrame or failed DataFrame
-      passed: DataFrame = res_df.filter(pl.col(test.result_column) == 1).drop(test.result_column)
-      failed_test: DataFrame = (res_df
-        .filter(pl.col(test.result_column) == 0)
-        .drop(test.result_column)
-        .with_columns(pl.lit(test.check.name).alias('failed_test'))
-      )
+      return (df.collect() if isinstance(df, LazyFrame) else df), failed, quarantined
+
+    # Run function checks on a DataFrame, since they may index columns eagerly (e.g., df[column])
+    result_columns: list[str] = [f'__test_{i}__' for i in range(len(self.tests))]
+    if any(test.check.expression is None for test in self.tests):
+      df: DataFrame = df.collect() if isinstance(df, LazyFrame) else df
+      for c, test in zip(result_columns, self.tests):
+        if test.check.expression is None:
+          df: DataFrame = test.run(df).rename({test.result_column: c})
+
+    # Compute every expression test result in one pass, each under a unique column name
+    lf: LazyFrame = df.lazy().with_columns([
+      test.build_expression().alias(c)
+      for c, test in zip(result_columns, self.tests)
+      if test.check.expression is not None
+    ])
+
+    # Label each row with its first failing test and that test's action
+    res_df: DataFrame = (lf
+      .with_columns([
+        pl.coalesce([
+          pl.when(pl.col(c).fill_null(0) == 0).then(pl.lit(t.check.name))
+          for c, t in zip(result_columns, self.tests)
+        ]).alias('failed_test'),
+        pl.coalesce([
+          pl.when(pl.col(c).fill_null(0) == 0).then(pl.lit(t.check_action.value))
+          for c, t in zip(result_columns, self.tests)
+        ]).alias('__check_action__')
+      ])
+      .drop(result_columns)
+      .collect()
+    )
 
-      # Depending on the action, place the failed tests in the appropriate DataFrame
-      if test.check_action.value == CheckAction.FAIL.value:
-        failed: DataFrame = pl.concat([failed, failed_test])
-      elif test.check_action.value == CheckAction.QUARANTINE.value:
-        quarantined: DataFrame = pl.concat([quarantined, failed_test])
+    # Split the rows by action in one partition step
+    partitions: dict[tuple, DataFrame] = res_df.partition_by(
+      '__check_action__',
+      as_dict=True,
+      include_key=False
+    )
+    empty: DataFrame = res_df.clear().drop('__check_action__')
+    passed: DataFrame = partitions.get((None,), empty).drop('failed_test')
+    failed: DataFrame = partitions.get((CheckAction.FAIL.value,), empty)
+    quarantined: DataFrame = partitions.get((CheckAction.QUARANTINE.value,), empty)
 
     # Return the resulting DataFrames
     return passed, failed, quarantined
@@ -208,31 +428,702 @@ class Table:
     """Truncates the table"""
     self.overwrite(DataFrame([], self.schema.polars))
     self.metastore.clear_file_history(self.id)
+    self.metastore.clear_watermarks(self.id)
 
   def drop(self) -> None:
     """Drops the table"""
+    self.metastore.evict_delta_table(self.table_path)
+    self.metastore.unregister_table(self.id)
     if path.exists(self.table_path) and DeltaTable.is_deltatable(self.table_path):
       rmtree(self.table_path)
+    if path.exists(self.key_index_path):
+      rmtree(self.key_index_path)
 
   def clear_quarantine(self) -> None:
     """Clears the quarantine table if it exists"""
     if path.exists(self.quarantine_path) and \
      DeltaTable.is_deltatable(self.quarantine_path):
       df: DataFrame = DataFrame([], self.schema.quarantine)
-      df.write_delta(self.quarantine_path, mode='overwrite')
+      self.metastore.commit(self.quarantine_path, lambda commit_properties: df.write_delta(
+        target=self.metastore.get_delta_table(self.quarantine_path),
+        mode='overwrite',
+        delta_write_options={**self.write_properties.to_write_options(), 'commit_properties': commit_properties}
+      ))
+
+  def optimize(self, target_size: Optional[int] = None, z_order_columns: list[str] = []) -> Optional[dict[str, Any]]:
+    """Compacts small files into larger ones, optionally clustering them by Z-order
+
+    Args:
+      target_size (optional) (int): if applicable, the target file size in bytes (default
+        self.write_properties.target_file_size, or deltalake's 256MB)
+      z_order_columns (optional) (list[str]): if applicable, the columns by which to Z-order the data
+
+    Returns:
+      metrics (Optional[dict[str, Any]]): the optimize metrics reported by deltalake
+    """
+    if not isinstance(z_order_columns, list):
+      raise TypeError('Error: z_order_columns must be of type <list>')
+    if not all(c in self.schema.columns for c in z_order_columns):
+      raise ValueError('Error: not all z_order_columns exist as columns')
+
+    self.get_as_delta_table()
+    return self.metastore.optimize_table(self.table_path, target_size, z_order_columns, self.write_properties)
+
+  def vacuum(self, retention_hours: Optional[int] = None, dry_run: bool = False,
+             enforce_retention_duration: bool = True) -> list[str]:
+    """Deletes files no longer referenced by the Delta Table and older than the retention period
+
+    Args:
+      retention_hours (optional) (int): if applicable, the retention period (default the table's, i.e., 7 days)
+      dry_run (optional) (bool): indicates whether to only list the files to delete (default False)
+      enforce_retention_duration (optional) (bool): indicates whether to reject retention periods
+        shorter than the table's (default True)
+
+    Returns:
+      file_paths (list[str]): the deleted files, or the files to delete in a dry run
+    """
+    return self.get_as_delta_table().vacuum(
+      retention_hours=retention_hours,
+      dry_run=dry_run,
+      enforce_retention_duration=enforce_retention_duration
+    )
+
+  def checkpoint(self) -> None:
+    """Writes a checkpoint of the Delta log so readers do not need to replay every commit"""
+    self.get_as_delta_table().create_checkpoint()
+
+  def build_configuration(self) -> dict[str, str]:
+    """Builds the Delta table properties of the Table
+
+    Returns:
+      configuration (dict[str, str]): the table properties
+    """
+    configuration: dict[str, str] = self.metastore.build_configuration(self.write_properties)
+    if self.change_data_feed:
+      configuration['delta.enableChangeDataFeed'] = 'true'
+    return configuration
 
   def get_as_delta_table(self) -> DeltaTable:
     """Retrieves the DeltaTable object for the Table
+
+    The handle is cached in the metastore and only refreshed when the Delta log has moved on,
+    so the table gets created only if no handle can be opened
+
+    Table properties only get set when the table is created, so reading never commits to the
+      Delta log (see apply_properties() for existing tables)
     
     Returns:
       delta_table (DeltaTable): the resulting Delta Table
     """
-    self.create_if_not_exists(self.table_path, self.schema.deltalake, self.partition_keys)
-    return DeltaTable(self.table_path)
+    try:
+      return self.metastore.get_delta_table(self.table_path)
+    except TableNotFoundError:
+      self.create_if_not_exists(self.table_path, self.schema.deltalake, self.partition_keys, self.build_configuration())
+      return self.metastore.get_delta_table(self.table_path)
+
+  def apply_properties(self) -> bool:
+    """Sets any table properties of self.build_configuration() missing from an existing Delta Table
+
+    Returns:
+      applied (bool): indicates whether any table properties had to be set
+    """
+    configuration: dict[str, str] = self.build_configuration()
+    if configuration.items() <= self.get_as_delta_table().metadata().configuration.items():
+      return False
+    self.metastore.commit(self.table_path, lambda commit_properties: self.get_as_delta_table().alter.set_table_properties(
+      configuration,
+      commit_properties=commit_properties
+    ))
+    return True
+
+  def scan(self, filter_conditions: dict = {}, filters: list[FilterCondition] = []) -> LazyFrame:
+    """Retrieves the Delta Table as a lazy query plan
+
+    Before any data is read, the conditions prune the files to scan:
+      1. Conditions on partition keys skip files by their partition values
+      2. Conditions on other columns skip files by their min/max statistics
+
+    Filters, projections, limits, and sorts applied to the LazyFrame get pushed
+    down to the Parquet reader once it is collected
+    
+    Args:
+      filter_conditions (optional) (dict): if applicable, equality conditions, or is_in conditions for list values
+      filters (optional) (list[FilterCondition]): if applicable, (column, operator, value) conditions
+
+    Returns:
+      lf (LazyFrame): the Delta Table as a LazyFrame
+    """
+    conditions: list[FilterCondition] = self.build_conditions(filter_conditions, filters)
+    file_uris, _ = self.get_file_uris(filters=conditions)
+    lf: LazyFrame = self._scan_files(file_uris)
+
+    # Apply the conditions to the remaining rows
+    if conditions:
+      lf: LazyFrame = lf.filter(*[Table.condition_to_expression(*c) for c in conditions])
+    return lf
+
+  def lookup(self, keys: Union[Any, tuple, dict, list, DataFrame]) -> DataFrame:
+    """Retrieves the rows matching one or more primary keys, opening only the files containing them
+
+    self.primary_keys must be specified for this method to run
+
+    The primary key index maps each key to its file. It is persisted in the metastore and
+    cached in memory, and before each lookup it catches up on the commits since it was built,
+    so appends, upserts, and compactions only cost the files they added
+
+    Args:
+      keys (Union[Any, tuple, dict, list, DataFrame]): the key(s), each as a value (single primary key),
+        a tuple in primary key order, or a dict; or a DataFrame of primary key columns
+
+    Returns:
+      df (DataFrame): the matching rows
+    """
+    if not self.primary_keys:
+      raise ValueError('Error: Delta Table does not have primary keys')
+
+    keys_df: DataFrame = self._build_keys_frame(keys)
+    file_uris: list[str] = (self
+      .get_key_index()
+      .join(keys_df, on=self.primary_keys, how='semi', nulls_equal=True)
+      .get_column('_file_path')
+      .unique()
+      .to_list()
+    )
+    return (self
+      ._scan_files(file_uris)
+      .join(keys_df.lazy(), on=self.primary_keys, how='semi', nulls_equal=True)
+      .collect()
+    )
+
+  def get_key_index(self) -> DataFrame:
+    """Retrieves the primary key index, bringing it up to date with the Delta log
+
+    Returns:
+      df (DataFrame): the primary keys of every row with its _file_path
+    """
+    dt: DeltaTable = self.get_as_delta_table()
+    table_uuid: str = dt.metadata().id
+    version: int = dt.version()
+    if self._key_index_uuid != table_uuid:
+      self._load_key_index(table_uuid)
+    if self._key_index is not None and self._key_index_version == version:
+      return self._key_index
+
+    # Catch up on the files added and removed since the index was built, or rebuild it
+    file_changes: Optional[tuple[list[str], list[str]]] = self._get_log_file_changes(
+      starting_version=self._key_index_version,
+      ending_version=version
+    ) if self._key_index is not None and self._key_index_version < version else None
+    if file_changes is None:
+      index: DataFrame = self._read_keys(dt.file_uris())
+    else:
+      added, removed = file_changes
+      index: DataFrame = pl.concat([
+        self._key_index.filter(~pl.col('_file_path').is_in(removed)),
+        self._read_keys(added)
+      ])
+    self._save_key_index(index, table_uuid, version)
+    return index
+
+  def _read_keys(self, file_uris: list[str]) -> DataFrame:
+    """Reads only the primary key columns of Delta Table files, along with each file's URI
+
+    Args:
+      file_uris (list[str]): the URIs of the files to read
+
+    Returns:
+      df (DataFrame): the primary keys of every row with its _file_path
+    """
+    schema: dict[str, DataType] = {
+      **{k: self.schema.polars[k] for k in self.primary_keys},
+      '_file_path': pl.String
+    }
+    if not file_uris:
+      return DataFrame([], schema)
+    lf: LazyFrame = pl.scan_parquet(
+      file_uris,
+      schema={k: v for k, v in self.schema.polars.items() if k not in self.partition_keys},
+      hive_schema={k: self.schema.polars[k] for k in self.partition_keys} or None,
+      hive_partitioning=bool(self.partition_keys),
+      allow_missing_columns=True,
+      include_file_paths='_file_path'
+    )
+    return lf.select(*schema.keys()).collect()
+
+  def _load_key_index(self, table_uuid: str) -> None:
+    """Loads the latest persisted primary key index of the Delta Table into memory, if any
+
+    The index files are named after the table's unique metadata ID and version,
+    so an index of a dropped and recreated table never gets reused
+
+    Args:
+      table_uuid (str): the unique metadata ID of the Delta Table
+    """
+    self._key_index: Optional[DataFrame] = None
+    self._key_index_version: int = -1
+    self._key_index_uuid: Optional[str] = table_uuid
+    versions: list[int] = [
+      int(f.removeprefix(f'{table_uuid}.').removesuffix('.parquet'))
+      for f in listdir(self.key_index_path)
+      if f.startswith(f'{table_uuid}.') and f.endswith('.parquet')
+    ] if path.exists(self.key_index_path) else []
+    if versions:
+      try:
+        self._key_index: Optional[DataFrame] = pl.read_parquet(
+          path.join(self.key_index_path, f'{table_uuid}.{max(versions):020}.parquet')
+        )
+      except FileNotFoundError:
+        # Another writer replaced the file with a newer index in the meantime
+        return self._load_key_index(table_uuid)
+      self._key_index_version: int = max(versions)
+
+  def _save_key_index(self, index: DataFrame, table_uuid: str, version: int) -> None:
+    """Persists the primary key index of a table version, replacing the older index files
+
+    The file gets written under a temporary name and renamed into place, so readers never see a
+      partial index. Only index files of older versions (or of earlier tables at the same path)
+      get removed, and nothing gets written if a concurrent writer saved a newer version already
+
+    Args:
+      index (DataFrame): the primary key index
+      table_uuid (str): the unique metadata ID of the Delta Table
+      version (int): the table version it reflects
+    """
+    self._key_index: Optional[DataFrame] = index
+    self._key_index_version: int = version
+    self._key_index_uuid: Optional[str] = table_uuid
+    file_name: str = f'{table_uuid}.{version:020}.parquet'
+    file_path: str = path.join(self.key_index_path, file_name)
+    temp_path: str = path.join(self.key_index_path, f'.{file_name}.{uuid4().hex}.tmp')
+    makedirs(self.key_index_path, exist_ok=True)
+    if any(f.startswith(f'{table_uuid}.') and f.endswith('.parquet') and f > file_name
+           for f in listdir(self.key_index_path)):
+      return
+    index.write_parquet(temp_path)
+    replace(temp_path, file_path)
+    saved_ts: float = path.getmtime(file_path)
+    for f in listdir(self.key_index_path):
+      if not f.endswith('.parquet') or f == file_name:
+        continue
+      f_path: str = path.join(self.key_index_path, f)
+      try:
+        if (f < file_name) if f.startswith(f'{table_uuid}.') else (path.getmtime(f_path) < saved_ts):
+          remove(f_path)
+      except FileNotFoundError:
+        # Another writer removed it already
+        pass
+
+  def _build_keys_frame(self, keys: Union[Any, tuple, dict, list, DataFrame]) -> DataFrame:
+    """Converts lookup keys into a DataFrame of the primary key columns
+
+    Args:
+      keys (Union[Any, tuple, dict, list, DataFrame]): the key(s) to convert
+
+    Returns:
+      df (DataFrame): the keys as a DataFrame
+    """
+    schema: dict[str, DataType] = {k: self.schema.polars[k] for k in self.primary_keys}
+    if isinstance(keys, DataFrame):
+      return keys.select(self.primary_keys).cast(schema)
+    if not isinstance(keys, list):
+      keys: list[Any] = [keys]
+
+    rows: list[dict[str, Any]] = []
+    for key in keys:
+      if not isinstance(key, (dict, tuple)):
+        key: tuple = (key,)
+      if isinstance(key, tuple):
+        if len(key) != len(self.primary_keys):
+          raise ValueError(f'Error: key {key} does not match primary keys {self.primary_keys}')
+        key: dict[str, Any] = dict(zip(self.primary_keys, key))
+      rows.append({k: key.get(k) for k in self.primary_keys})
+    return DataFrame(rows, schema)
+
+  def count(self) -> int:
+    """Retrieves the number of rows in the Delta Table from the Delta log
+
+    If any file lacks its row count statistic, the row count comes from a scan instead
+
+    Returns:
+      count (int): the number of rows
+    """
+    row_count: Optional[int] = Table._sum_known(
+      pl.from_arrow(self.get_as_delta_table().get_add_actions(flatten=True)),
+      'num_records'
+    )
+    if row_count is None:
+      return self.scan().select(pl.len()).collect().item()
+    return row_count
+
+  def stats(self) -> TableStats:
+    """Retrieves the statistics of the Delta Table from the Delta log, without reading any data
+
+    Column statistics come from the per-file statistics in the log, so they are None
+    for columns without statistics in every file (e.g., beyond data_skipping_num_indexed_cols)
+
+    Returns:
+      stats (TableStats): the version, file count, row count, size, and per-column min/max/null counts
+    """
+    dt: DeltaTable = self.get_as_delta_table()
+    actions: DataFrame = pl.from_arrow(dt.get_add_actions(flatten=True))
+    return TableStats(
+      version=dt.version(),
+      file_count=actions.shape[0],
+      row_count=Table._sum_known(actions, 'num_records'),
+      size_bytes=Table._sum_known(actions, 'size_bytes') or 0,
+      columns={c: Table._column_stats(actions, c) for c in self.schema.columns}
+    )
+
+  @staticmethod
+  def _column_stats(actions: DataFrame, column: str) -> ColumnStats:
+    """Aggregates the statistics of one column across the add actions of a Delta Table
+
+    Args:
+      actions (DataFrame): the flattened add actions
+      column (str): the column name
+
+    Returns:
+      stats (ColumnStats): the min, max, and null count of the column
+    """
+    if actions.is_empty():
+      return ColumnStats(min=None, max=None, null_count=0)
+
+    # Partition values are exact, so they never lack statistics
+    if f'partition.{column}' in actions.columns:
+      values: pl.Series = actions.get_column(f'partition.{column}')
+      return ColumnStats(
+        min=values.min(),
+        max=values.max(),
+        null_count=Table._sum_known(actions.filter(values.is_null()), 'num_records')
+      )
+
+    # Otherwise, the statistics are only complete if every file carries them
+    null_count: Optional[int] = Table._sum_known(actions, f'null_count.{column}')
+    if null_count is None or f'min.{column}' not in actions.columns:
+      return ColumnStats(min=None, max=None, null_count=null_count)
+    return ColumnStats(
+      min=actions.get_column(f'min.{column}').min(),
+      max=actions.get_column(f'max.{column}').max(),
+      null_count=null_count
+    )
+
+  @staticmethod
+  def _sum_known(actions: DataFrame, column: str) -> Optional[int]:
+    """Sums a statistic across the add actions of a Delta Table if every file carries it
+
+    Args:
+      actions (DataFrame): the flattened add actions
+      column (str): the statistic column (e.g., 'num_records')
+
+    Returns:
+      total (Optional[int]): the sum, or None if any file lacks the statistic
+    """
+    if actions.is_empty():
+      return 0
+    if column not in actions.columns or actions.get_column(column).null_count():
+      return None
+    return int(actions.get_column(column).sum())
+
+  def read_incremental(self, consumer_id: str) -> LazyFrame:
+    """Retrieves only the data added since the consumer last processed the Delta Table
+
+    The consumer's watermark (the last processed table version) comes from the metastore,
+    and only the files added by later commits get scanned. The version read gets staged
+    as the consumer's new watermark, which a Pipe whose table ID is the consumer_id
+    commits once it saves its data
+
+    This is meant for append-only sources (e.g., raw tables), since files rewritten by
+    merges carry their unchanged rows as well. For mutable sources, use read_changes()
+
+    The watermark moves past every row read, including rows the consumer's tests failed or
+    quarantined, so those rows are not read again. To reprocess them, clear the consumer's
+    watermarks (see Metastore.clear_watermarks)
+
+    If the Delta log got cleaned up past the watermark, the whole table gets scanned, with a warning
+
+    Args:
+      consumer_id (str): the unique ID of the consumer (typically the ID of the target table)
+
+    Returns:
+      lf (LazyFrame): the data added since the watermark
+    """
+    if not isinstance(consumer_id, str):
+      raise TypeError('Error: consumer_id must be of type <str>')
+
+    dt: DeltaTable = self.get_as_delta_table()
+    version: int = dt.version()
+    watermark: int = self.metastore.get_watermark(consumer_id, self.id)
+
+    # Without a watermark, or if the log got cleaned up past it, everything is new
+    file_changes: Optional[tuple[list[str], list[str]]] = \
+      self._get_log_file_changes(watermark, version, data_change_only=True) if watermark >= 0 else None
+    if watermark >= 0 and file_changes is None:
+      warn(
+        f'The Delta log of {self.id} no longer covers version {watermark}, so {consumer_id} reads the whole table',
+        RuntimeWarning
+      )
+    if file_changes is not None and self.requires_delta_reader(dt):
+      raise ValueError(f'Error: {self.id} requires the Delta reader, so use read_changes() to read it incrementally')
+    self.metastore.stage_watermark(consumer_id, self.id, version)
+    if file_changes is None:
+      return self.scan()
+    return self._scan_files(file_changes[0])
+
+  def _scan_files(self, file_uris: list[str]) -> LazyFrame:
+    """Scans Parquet files of the Delta Table, reading partition keys from the hive paths
+
+    If the table's protocol requires the Delta reader (e.g., deletion vectors or column mapping),
+      plain Parquet files would return wrong rows or columns, so the whole table gets scanned
+      through pl.scan_delta instead, and callers must still apply their own filters
+
+    Args:
+      file_uris (list[str]): the URIs of the files to scan
+
+    Returns:
+      lf (LazyFrame): the files as a LazyFrame in schema order
+    """
+    dt: DeltaTable = self.get_as_delta_table()
+    polars_schema: dict[str, pl.DataType] = Maps.deltalake_schema_to_polars_schema(schema=dt.schema())
+    if self.requires_delta_reader(dt):
+      return pl.scan_delta(dt).select(*polars_schema.keys())
+
+    # If there are no files, return an empty plan of the same schema
+    if not file_uris:
+      return pl.LazyFrame(schema=polars_schema)
+
+    lf: LazyFrame = pl.scan_parquet(
+      file_uris,
+      schema={k: v for k, v in polars_schema.items() if k not in self.partition_keys},
+      hive_schema={k: polars_schema[k] for k in self.partition_keys} or None,
+      hive_partitioning=bool(self.partition_keys),
+      allow_missing_columns=True
+    )
+    return lf.select(*polars_schema.keys())
+
+  @staticmethod
+  def requires_delta_reader(dt: DeltaTable) -> bool:
+    """Indicates whether a Delta Table's data files cannot be read as plain Parquet files
+
+    Args:
+      dt (DeltaTable): the Delta Table
+
+    Returns:
+      requires_delta_reader (bool): indicates whether the table must be read through the Delta reader
+    """
+    protocol: Any = dt.protocol()
+    if protocol.min_reader_version == 2:
+      return dt.metadata().configuration.get('delta.columnMapping.mode', 'none') != 'none'
+    return any(f not in Maps.PARQUET_READER_FEATURES for f in protocol.reader_features or [])
+
+  def _get_log_file_changes(self, starting_version: int, ending_version: int,
+                            data_change_only: bool = False) -> Optional[tuple[list[str], list[str]]]:
+    """Retrieves the files added and removed by the commits after starting_version up to ending_version
+
+    Files added and removed again within the range (e.g., by a truncation) are in neither list
+
+    Args:
+      starting_version (int): the last version already processed
+      ending_version (int): the last version to include
+      data_change_only (optional) (bool): indicates whether to skip actions that do not change data,
+        so compactions neither re-add nor remove data (default False)
+
+    Returns:
+      file_changes (Optional[tuple[list[str], list[str]]]): the added and removed file URIs,
+        or None if a commit is no longer in the log
+    """
+    added: dict[str, None] = {}
+    removed: dict[str, None] = {}
+    for version in range(starting_version + 1, ending_version + 1):
+      commit_path: str = path.join(self.table_path, '_delta_log', f'{version:020}.json')
+      if not path.exists(commit_path):
+        return None
+      with open(commit_path) as f:
+        for line in f:
+          action: dict[str, Any] = loads(line)
+          if 'add' in action and (action['add'].get('dataChange', True) or not data_change_only):
+            added[unquote(action['add']['path'])] = None
+          elif 'remove' in action and (action['remove'].get('dataChange', True) or not data_change_only):
+            file_path: str = unquote(action['remove']['path'])
+            if file_path in added:
+              del added[file_path]
+            else:
+              removed[file_path] = None
+    return (
+      [path.join(self.table_path, p) for p in added],
+      [path.join(self.table_path, p) for p in removed]
+    )
+
+  def read_changes(self, starting_version: int = 0, ending_version: Optional[int] = None) -> LazyFrame:
+    """Retrieves the row-level changes of the Delta Table from its change data feed
+
+    self.change_data_feed must be enabled for this method to run, and only commits made
+    since it got enabled carry changes
+
+    Each row carries its _change_type ('insert', 'update_preimage', 'update_postimage', or 'delete'),
+    its _commit_version, and its _commit_timestamp
+
+    Args:
+      starting_version (optional) (int): the first table version to include (default 0)
+      ending_version (optional) (int): if applicable, the last table version to include (default None)
+
+    Returns:
+      lf (LazyFrame): the changes
+    """
+    if not isinstance(starting_version, int):
+      raise TypeError('Error: starting_version must be of type <int>')
+    if ending_version is not None and not isinstance(ending_version, int):
+      raise TypeError('Error: ending_version must be of type <int>')
+    if not self.change_data_feed:
+      raise ValueError('Error: Delta Table does not have the change data feed enabled')
+
+    schema: dict[str, DataType] = {**self.schema.polars, **Maps.CHANGE_DATA_FEED_COLUMNS}
+    dt: DeltaTable = self.get_as_delta_table()
+    if starting_version > dt.version():
+      return LazyFrame([], schema)
+
+    changes: pa.Table = dt.load_cdf(starting_version=starting_version, ending_version=ending_version).read_all()
+    return pl.from_arrow(changes, rechunk=False).lazy().select(*schema.keys())
+
+  def get_file_uris(self, filter_conditions: dict = {},
+                    filters: list[FilterCondition] = []) -> tuple[list[str], int]:
+    """Retrieves the data files that may contain rows matching the conditions
+
+    The partition values and min/max statistics come from the Delta log,
+    so no Parquet files get opened
+    
+    Args:
+      filter_conditions (optional) (dict): if applicable, equality conditions, or is_in conditions for list values
+      filters (optional) (list[FilterCondition]): if applicable, (column, operator, value) conditions
+    
+    Returns:
+      file_uris, skipped_count (tuple[list[str], int]): the files to scan and the number of skipped files
+    """
+    conditions: list[FilterCondition] = self.build_conditions(filter_conditions, filters)
+    dt: DeltaTable = self.get_as_delta_table()
+    file_uris: list[str] = dt.file_uris()
+    if not conditions or not file_uris:
+      return file_uris, 0
+
+    # Evaluate every condition against the add actions at once, taking the paths from the same rows
+    actions: DataFrame = pl.from_arrow(dt.get_add_actions(flatten=True))
+    kept: list[str] = [
+      path.join(path.abspath(self.table_path), unquote(p))
+      for p in actions
+        .filter(pl.all_horizontal([
+          self._condition_to_file_expression(actions.columns, *c)
+          for c in conditions
+        ]))
+        .get_column('path')
+        .to_list()
+    ]
+    return kept, len(file_uris) - len(kept)
+
+  @staticmethod
+  def build_conditions(filter_conditions: dict = {},
+                       filters: list[FilterCondition] = []) -> list[FilterCondition]:
+    """Combines filter_conditions and filters into one list of (column, operator, value) conditions
+
+    Args:
+      filter_conditions (optional) (dict): if applicable, equality conditions, or is_in conditions for list values
+      filters (optional) (list[FilterCondition]): if applicable, (column, operator, value) conditions
+    
+    Returns:
+      conditions (list[FilterCondition]): the combined conditions
+    """
+    if not isinstance(filter_conditions, dict):
+      raise TypeError('Error: filter_conditions must be of type <dict>')
+    if not isinstance(filters, list):
+      raise TypeError('Error: filters must be of type <list>')
+    if not all(isinstance(f, tuple) and len(f) == 3 for f in filters):
+      raise TypeError('Error: all values in filters must be of type <tuple> (column, operator, value)')
+
+    conditions: list[FilterCondition] = [
+      (c, 'in', list(v)) if isinstance(v, (list, set, tuple)) else (c, '=', v)
+      for c, v in filter_conditions.items()
+    ]
+    return conditions + filters
+
+  @staticmethod
+  def condition_to_expression(column: str, operator: str, value: Any) -> Expr:
+    """Converts a (column, operator, value) condition into a Polars expression
+
+    Args:
+      column (str): the column to compare
+      operator (str): the comparison operator (e.g., '=', '>=', 'in')
+      value (Any): the value to compare against
+
+    Returns:
+      expression (Expr): the resulting boolean expression
+    """
+    col: Expr = pl.col(column)
+    if operator == '=':
+      return col.eq(value)
+    elif operator == '!=':
+      return col.ne(value)
+    elif operator == '<':
+      return col.lt(value)
+    elif operator == '<=':
+      return col.le(value)
+    elif operator == '>':
+      return col.gt(value)
+    elif operator == '>=':
+      return col.ge(value)
+    elif operator == 'in':
+      return col.is_in(value)
+    elif operator == 'not in':
+      return col.is_in(value).not_()
+    else:
+      raise FilterOperatorNotRecognized(operator)
+
+  def _condition_to_file_expression(self, action_columns: list[str], column: str,
+                                    operator: str, value: Any) -> Expr:
+    """Converts a condition into an expression indicating whether a file may contain matches
+
+    Args:
+      action_columns (list[str]): the columns of the flattened add actions
+      column (str): the column to compare
+      operator (str): the comparison operator (e.g., '=', '>=', 'in')
+      value (Any): the value to compare against
+
+    Returns:
+      expression (Expr): the boolean expression over the add actions
+    """
+    # Partition values are exact, so the condition applies directly
+    if column in self.partition_keys:
+      return Table.condition_to_expression(f'partition.{column}', operator, value) \
+        .fill_null(False)
+
+    # Without statistics, the file must be scanned
+    min_column, max_column = f'min.{column}', f'max.{column}'
+    if min_column not in action_columns or max_column not in action_columns:
+      return pl.lit(True)
+    mn, mx = pl.col(min_column), pl.col(max_column)
+
+    if operator == '=':
+      expression: Expr = mn.le(value) & mx.ge(value)
+    elif operator == '!=':
+      expression: Expr = (mn.eq(value) & mx.eq(value)).not_()
+    elif operator == '<':
+      expression: Expr = mn.lt(value)
+    elif operator == '<=':
+      expression: Expr = mn.le(value)
+    elif operator == '>':
+      expression: Expr = mx.gt(value)
+    elif operator == '>=':
+      expression: Expr = mx.ge(value)
+    elif operator == 'in':
+      expression: Expr = pl.any_horizontal([mn.le(v) & mx.ge(v) for v in value] or [pl.lit(False)])
+    elif operator == 'not in':
+      expression: Expr = pl.lit(True)
+    else:
+      raise FilterOperatorNotRecognized(operator)
+
+    # Missing statistics for a file mean it must be scanned
+    return expression.fill_null(True)
 
   def get(self, filter_conditions: dict = {}, partition_by: list[str] = [], order_by: list[str] = [],
           order_by_descending: bool = True, select: list[str] = [], sort_by: list[str] = [], limit: int = 0,
-          unique: bool = False) -> DataFrame:
+          unique: bool = False, filters: list[FilterCondition] = []) -> DataFrame:
     """Retrieves a record, or records, by a specific condition, expecting only one record to return
       
     Args:
@@ -244,6 +1135,7 @@ class Table:
       sort_by (optional) (list[str]): if applicable, the columns by which to sort the output
       limit (optional) (int): if applicable, a limit to the number of rows to return
       unique (optional) (bool): if applicable, remove any duplicate records
+      filters (optional) (list[FilterCondition]): if applicable, (column, operator, value) conditions (e.g., ('id', '>=', 2))
 
     Returns:
       df (DataFrame): the resulting DataFrame
@@ -273,38 +1165,33 @@ class Table:
     if not all(isinstance(c, str) for c in sort_by):
       raise TypeError('Error: all values in sort_by must be of type <str>')
     
-    self.create_if_not_exists(self.table_path, self.schema.deltalake, self.partition_keys)
-
-    # Retrieve Delta Table as a Polars DataFrame
-    df: DataFrame = pl.read_delta(self.table_path)
-
-    # Apply the filter condition if applicable
-    if filter_conditions:
-      df: DataFrame = df.filter(**filter_conditions)
+    # Build a lazy query plan against the files that can match the conditions
+    lf: LazyFrame = self.scan(filter_conditions, filters)
 
     # Filter columns if applicable
     if select:
-      df: DataFrame = df.select(select)
+      lf: LazyFrame = lf.select(select)
 
     # Apply a simple deduplication if applicable        
     if partition_by and order_by:
-      df: DataFrame = df \
+      lf: LazyFrame = lf \
         .sort(order_by, descending=order_by_descending) \
         .unique(subset=partition_by, keep='first')
     
     # Apply a limit if applicable
     if limit:
-      df: DataFrame = df.limit(limit)
+      lf: LazyFrame = lf.limit(limit)
     
     # Remove duplicate records if applicable
     if unique:
-      df: DataFrame = df.unique()
+      lf: LazyFrame = lf.unique()
       
     # Sort the results if applicable
     if sort_by:
-      df: DataFrame = df.sort(sort_by)
+      lf: LazyFrame = lf.sort(sort_by)
 
-    return df
+    # Execute the plan, pushing filters, projections, and limits into the reader
+    return lf.collect()
 
   def add_metadata_columns(self, df: DataFrame) -> DataFrame:
     """Adds relevant metadata columns to the DataFrame before loading
@@ -345,61 +1232,261 @@ class Table:
     else:
       raise TableQualityNotRecognized(self.quality.value)
 
+    # Hash the raw columns in one vectorized pass for change detection
+    # The hash is stable for a given polars version, so upgrades may cause one-off rewrites
+    if self.row_hash:
+      df: DataFrame = df.with_columns([
+        pl.struct(self.schema.raw_columns).hash(seed=0).reinterpret(signed=True).alias('_row_hash')
+      ])
+
     return df
 
-  def upsert(self, data: RawPoltaData) -> None:
+  def upsert(self, data: RawPoltaData, chunk_rows: Optional[int] = None,
+             chunk_bytes: Optional[int] = None, start_chunk: int = 0) -> list[UpsertChunkMetrics]:
     """Upserts a DataFrame into the Delta Table
 
     self.primary_keys must be specified for this method to run
+
+    If a chunk size is set, the data get merged in batches of at most that many rows/bytes,
+    each in its own commit. Because every merge matches on the primary keys, a failed upsert
+    can be re-run in full, or resumed from the failed chunk with start_chunk
+
+    Arrow streams (e.g., a RecordBatchReader) get merged one record batch at a time,
+    further split by any chunk size, so the full input is never held in memory
     
     Args:
       data (RawPoltaData): the data to upsert
+      chunk_rows (optional) (int): the max number of rows per merge (default self.upsert_chunk_rows)
+      chunk_bytes (optional) (int): the max estimated bytes per merge (default self.upsert_chunk_bytes)
+      start_chunk (optional) (int): the index of the first chunk to merge (default 0)
+
+    Returns:
+      metrics (list[UpsertChunkMetrics]): the row counts and timing of each merged chunk
     """
     if not self.primary_keys:
       raise ValueError('Error: Delta Table does not have primary keys')
 
-    df: DataFrame = self._preprocess(data)
+    chunk_rows: int = self.upsert_chunk_rows if chunk_rows is None else chunk_rows
+    chunk_bytes: int = self.upsert_chunk_bytes if chunk_bytes is None else chunk_bytes
 
-    # Merge the DataFrame into its respective Delta Table
-    # This merge logic is a simple upsert based on the table's primary keys
-    (df
-      .write_delta(
-        target=self.table_path,
-        mode='merge',
-        delta_merge_options={
-          'predicate': self.merge_predicate,
-          'source_alias': 's',
-          'target_alias': 't',
-        }
+    # Arrow streams get merged batch by batch, so their chunk count is unknown upfront
+    chunks: Iterable[DataFrame]
+    chunk_count: Optional[int]
+    if self._is_arrow_stream(data):
+      chunks = (
+        chunk
+        for batch in self._to_arrow_reader(data)
+        if batch.num_rows
+        for chunk in self._split_into_chunks(self._preprocess(batch), chunk_rows, chunk_bytes)
       )
-      .when_matched_update_all()
-      .when_not_matched_insert_all()
+      chunk_count = None
+    else:
+      chunks = self._split_into_chunks(self._preprocess(data), chunk_rows, chunk_bytes)
+      chunk_count = len(chunks)
+
+    metrics: list[UpsertChunkMetrics] = []
+    for i, chunk in enumerate(chunks):
+      if i < start_chunk:
+        continue
+      start: datetime = datetime.now(UTC)
+      try:
+        result: dict[str, Any] = self._merge(chunk)
+      except Exception as e:
+        if chunk_count == 1:
+          raise
+        raise UpsertChunkFailed(i, chunk_count, e) from e
+      metrics.append(self._build_merge_metrics(i, chunk.shape[0], start, result))
+      if chunk_count != 1:
+        of_count: str = '' if chunk_count is None else f' of {chunk_count}'
+        print(f'  - Upserted chunk {i + 1}{of_count}: '
+              f'{metrics[-1]["row_count"]} record(s) in {metrics[-1]["duration_seconds"]:.2f}s')
+    return metrics
+
+  def sync(self, data: RawPoltaData, delete_predicate: Optional[str] = None) -> UpsertChunkMetrics:
+    """Syncs the Delta Table to a full snapshot in a single merge
+
+    self.primary_keys must be specified for this method to run
+
+    Matched rows get updated, new rows get inserted, and rows missing from the snapshot
+    get deleted, so only the files with changes get rewritten. If a delete predicate is set,
+    only missing rows satisfying it get deleted (e.g., "t.region = 'EU'" for a regional snapshot)
+
+    Args:
+      data (RawPoltaData): the full snapshot
+      delete_predicate (optional) (str): the SQL predicate on the target (alias t) scoping the deletes
+        (default self.sync_delete_predicate)
+
+    Returns:
+      metrics (UpsertChunkMetrics): the row counts and timing of the merge
+    """
+    if not self.primary_keys:
+      raise ValueError('Error: Delta Table does not have primary keys')
+
+    df: DataFrame = self._preprocess(data)
+    start: datetime = datetime.now(UTC)
+    result: dict[str, Any] = self._merge(
+      df=df,
+      delete_missing=True,
+      delete_predicate=self.sync_delete_predicate if delete_predicate is None else delete_predicate
+    )
+    return self._build_merge_metrics(0, df.shape[0], start, result)
+
+  def apply_changes(self, data: RawPoltaData) -> UpsertChunkMetrics:
+    """Applies change records (inserts, updates, and deletes) to the Delta Table in a single merge
+
+    self.primary_keys, self.cdc_operation_column, and self.cdc_sequence_column must be specified
+    for this method to run, and both CDC columns must be in the table schema
+
+    Only the latest change per primary key gets applied. Deletes remove matched rows, and any other
+    operation updates or inserts the row. Changes older than the stored row get ignored, so replaying
+    a batch of changes is safe
+
+    Args:
+      data (RawPoltaData): the change records
+
+    Returns:
+      metrics (UpsertChunkMetrics): the row counts and timing of the merge
+    """
+    if not self.primary_keys:
+      raise ValueError('Error: Delta Table does not have primary keys')
+    op: Optional[str] = self.cdc_operation_column
+    seq: Optional[str] = self.cdc_sequence_column
+    if op not in self.schema.columns or seq not in self.schema.columns:
+      raise ValueError('Error: cdc_operation_column and cdc_sequence_column must be table columns')
+
+    df: DataFrame = self.keep_latest_changes(self._preprocess(data), self.primary_keys, seq)
+    start: datetime = datetime.now(UTC)
+
+    delete_values: str = ', '.join(Table.to_sql_literal(v) for v in self.cdc_delete_operations)
+    is_delete: str = f's.{op} IS NOT NULL AND s.{op} IN ({delete_values})'
+    is_newer: str = f'(s.{seq} > t.{seq} OR t.{seq} IS NULL)'
+    update_predicate: str = f'NOT ({is_delete}) AND {is_newer}'
+    if self.row_hash:
+      update_predicate += ' AND (s._row_hash <> t._row_hash OR t._row_hash IS NULL)'
+
+    result: dict[str, Any] = self.metastore.commit(self.table_path, lambda commit_properties: self
+      ._start_merge(df, commit_properties=commit_properties)
+      .when_matched_delete(predicate=f'{is_delete} AND {is_newer}')
+      .when_matched_update_all(predicate=update_predicate)
+      .when_not_matched_insert_all(predicate=f'NOT ({is_delete})')
       .execute()
+    ) or {}
+    return self._build_merge_metrics(0, df.shape[0], start, result)
+
+  @staticmethod
+  def keep_latest_changes(df: DataFrame, primary_keys: list[str], sequence_column: str) -> DataFrame:
+    """Keeps only the change with the highest sequence number per primary key
+
+    This is a vectorized top-1 per key, so the DataFrame itself never gets sorted. Null sequence
+      numbers rank lowest, and ties go to the last change in the input, so every key keeps one change
+
+    Args:
+      df (DataFrame): the change records
+      primary_keys (list[str]): the primary keys identifying each row
+      sequence_column (str): the column ordering the changes of each key
+
+    Returns:
+      df (DataFrame): the latest change per primary key
+    """
+    return (df
+      .with_row_index('__row__')
+      .filter(pl.col('__row__') == pl
+        .col('__row__')
+        .sort_by(sequence_column, nulls_last=False, maintain_order=True)
+        .last()
+        .over(primary_keys)
+      )
+      .drop('__row__')
     )
 
+  async def aget(self, **kwargs: Any) -> DataFrame:
+    """Retrieves the Delta Table like get(), without blocking the event loop
+
+    The read runs on the metastore's bounded thread pool (see Metastore.max_concurrency),
+      one operation at a time per table
+
+    Args:
+      **kwargs (Any): the arguments of get()
+
+    Returns:
+      df (DataFrame): the resulting DataFrame
+    """
+    return await self.metastore.run_table_async(self.table_path, self.get, **kwargs)
+
+  async def aappend(self, data: RawPoltaData) -> None:
+    """Appends to the Delta Table like append(), without blocking the event loop
+
+    Args:
+      data (RawPoltaData): the data with which to append
+    """
+    await self.metastore.run_table_async(self.table_path, self.append, data)
+
+  async def aoverwrite(self, data: RawPoltaData) -> None:
+    """Overwrites the Delta Table like overwrite(), without blocking the event loop
+
+    Args:
+      data (RawPoltaData): the data with which to overwrite
+    """
+    await self.metastore.run_table_async(self.table_path, self.overwrite, data)
+
+  async def aupsert(self, data: RawPoltaData, **kwargs: Any) -> list[UpsertChunkMetrics]:
+    """Upserts into the Delta Table like upsert(), without blocking the event loop
+
+    Args:
+      data (RawPoltaData): the data to upsert
+      **kwargs (Any): the other arguments of upsert()
+
+    Returns:
+      metrics (list[UpsertChunkMetrics]): the row counts and timing of each merged chunk
+    """
+    return await self.metastore.run_table_async(self.table_path, self.upsert, data, **kwargs)
+
   def overwrite(self, data: RawPoltaData) -> None:
     """Overwrites the Delta Table with the inputted DataFrame
+
+    Arrow streams get written batch by batch in a single commit
     
     Args:
       data (RawPoltaData): the data with which to overwrite
     """
+    self._write(data, mode='overwrite')
+
+  def overwrite_partitions(self, data: RawPoltaData) -> None:
+    """Overwrites only the partitions of the Delta Table present in the inputted DataFrame
+
+    self.partition_keys must be specified for this method to run
+
+    Files of other partitions stay untouched, so reloading a day's snapshot only rewrites that day
+
+    Args:
+      data (RawPoltaData): the data with which to overwrite its partitions
+    """
+    if not self.partition_keys:
+      raise ValueError('Error: Delta Table does not have partition keys')
+
     df: DataFrame = self._preprocess(data)
-    df.write_delta(
-      target=self.table_path,
-      mode='overwrite'
-    )
+    predicate: Optional[str] = self.build_partition_overwrite_predicate(df, self.partition_keys)
+    if predicate is None:
+      return
+    self.metastore.commit(self.table_path, lambda commit_properties: df.write_delta(
+      target=self.get_as_delta_table(),
+      mode='overwrite',
+      delta_write_options={
+        **self.write_properties.to_write_options(),
+        'predicate': predicate,
+        'commit_properties': commit_properties
+      }
+    ))
 
   def append(self, data: RawPoltaData) -> None:
     """Appends a DataFrame to the Delta Table
 
+    Arrow streams get written batch by batch in a single commit
+
     Args:
       data (RawPoltaData): the data with which to append
     """
-    df: DataFrame = self._preprocess(data)
-    df.write_delta(
-      target=self.table_path,
-      mode='append'
-    )
+    self._write(data, mode='append')
 
   def conform_schema(self, df: DataFrame) -> DataFrame:
     """Conforms the DataFrame to the expected schema
@@ -424,15 +1511,21 @@ class Table:
     print(f'  - {df.shape[0]} record(s) got quarantined: {self.quarantine_path}')
     # Merge if the quarantine table exists
     # Otherwise, just append this time
-    if DeltaTable.is_deltatable(self.quarantine_path):
-      (df
+    try:
+      quarantine_table: Optional[DeltaTable] = self.metastore.get_delta_table(self.quarantine_path)
+    except TableNotFoundError:
+      quarantine_table: Optional[DeltaTable] = None
+    if quarantine_table is not None:
+      self.metastore.commit(self.quarantine_path, lambda commit_properties: df
         .write_delta(
-          target=self.quarantine_path,
+          target=self.metastore.get_delta_table(self.quarantine_path),
           mode='merge',
           delta_merge_options={
             'predicate': f's.{self.schema.failure_column} = t.{self.schema.failure_column}',
             'source_alias': 's',
-            'target_alias': 't'
+            'target_alias': 't',
+            'commit_properties': commit_properties,
+            **self.write_properties.to_merge_options()
           }
         )
         .when_matched_update_all()
@@ -440,7 +1533,15 @@ class Table:
         .execute()
       )
     else:
-      df.write_delta(self.quarantine_path, mode='append')
+      self.metastore.commit(self.quarantine_path, lambda commit_properties: df.write_delta(
+        target=self.quarantine_path,
+        mode='append',
+        delta_write_options={
+          **self.write_properties.to_write_options(),
+          'configuration': self.metastore.build_configuration(self.write_properties),
+          'commit_properties': commit_properties
+        }
+      ))
 
   def _build_ingestion_zone_if_not_exists(self) -> None:
     """Builds an empty directory for ingesting files"""
@@ -448,6 +1549,123 @@ class Table:
       makedirs(self.ingestion_zone_path, exist_ok=True)
       print(f'Ingestion zone created: {self.ingestion_zone_path}')
 
+  def _merge(self, df: DataFrame, delete_missing: bool = False,
+             delete_predicate: Optional[str] = None) -> dict[str, Any]:
+    """Merges a preprocessed DataFrame into the Delta Table on the table's primary keys
+
+    Partition keys that are also primary keys get restricted to the values in the
+    DataFrame, so the merge only scans and rewrites the affected partitions
+
+    If self.row_hash is enabled, matched rows only get updated if their _row_hash differs,
+    so files without real changes do not get rewritten
+    
+    Args:
+      df (DataFrame): the preprocessed DataFrame to merge
+      delete_missing (optional) (bool): indicates whether to delete target rows missing from the DataFrame (default False)
+      delete_predicate (optional) (str): if applicable, the SQL predicate scoping those deletes (default None)
+
+    Returns:
+      metrics (dict[str, Any]): the merge metrics reported by deltalake
+    """
+    update_predicate: Optional[str] = 's._row_hash <> t._row_hash OR t._row_hash IS NULL' \
+      if self.row_hash else None
+
+    def merge(commit_properties: CommitProperties) -> dict[str, Any]:
+      # This merge logic is a simple upsert based on the table's primary keys
+      # Deleting missing rows needs every target row in scope, so partitions cannot get pruned
+      merger: TableMerger = (self
+        ._start_merge(df, prune_partitions=not delete_missing, commit_properties=commit_properties)
+        .when_matched_update_all(predicate=update_predicate)
+        .when_not_matched_insert_all()
+      )
+      if delete_missing:
+        merger: TableMerger = merger.when_not_matched_by_source_delete(predicate=delete_predicate)
+      return merger.execute()
+
+    return self.metastore.commit(self.table_path, merge) or {}
+
+  def _start_merge(self, df: DataFrame, prune_partitions: bool = True,
+                   commit_properties: Optional[CommitProperties] = None) -> TableMerger:
+    """Starts a merge of a preprocessed DataFrame into the Delta Table on the table's primary keys
+
+    Args:
+      df (DataFrame): the preprocessed DataFrame to merge (alias s)
+      prune_partitions (optional) (bool): indicates whether to restrict the target (alias t)
+        to the partitions in the DataFrame (default True)
+      commit_properties (optional) (CommitProperties): if applicable, the properties of the commit
+
+    Returns:
+      merger (TableMerger): the merge, ready for its clauses
+    """
+    partition_predicate: Optional[str] = Table.build_partition_predicate(
+      df=df,
+      partition_keys=[k for k in self.partition_keys if k in self.primary_keys],
+      alias='t'
+    ) if prune_partitions else None
+    predicate: str = ' AND '.join(p for p in [self.merge_predicate, partition_predicate] if p)
+    return df.write_delta(
+      target=self.get_as_delta_table(),
+      mode='merge',
+      delta_merge_options={
+        'predicate': predicate,
+        'source_alias': 's',
+        'target_alias': 't',
+        'commit_properties': commit_properties,
+        **self.write_properties.to_merge_options()
+      }
+    )
+
+  @staticmethod
+  def _build_merge_metrics(chunk_index: int, row_count: int, start: datetime,
+                           result: dict[str, Any]) -> UpsertChunkMetrics:
+    """Builds the metrics of one merge from the deltalake merge result
+
+    Args:
+      chunk_index (int): the index of the merged chunk
+      row_count (int): the number of source rows
+      start (datetime): when the merge started
+      result (dict[str, Any]): the merge metrics reported by deltalake
+
+    Returns:
+      metrics (UpsertChunkMetrics): the row counts and timing of the merge
+    """
+    return UpsertChunkMetrics(
+      chunk_index=chunk_index,
+      row_count=row_count,
+      duration_seconds=(datetime.now(UTC) - start).total_seconds(),
+      num_target_rows_inserted=result.get('num_target_rows_inserted', 0),
+      num_target_rows_updated=result.get('num_target_rows_updated', 0),
+      num_target_rows_deleted=result.get('num_target_rows_deleted', 0),
+      num_target_files_scanned=result.get('num_target_files_scanned', 0),
+      num_target_files_skipped=result.get('num_target_files_skipped_during_scan', 0)
+    )
+
+  @staticmethod
+  def _split_into_chunks(df: DataFrame, chunk_rows: int = 0, chunk_bytes: int = 0) -> list[DataFrame]:
+    """Splits a DataFrame into zero-copy slices bounded by row count and estimated size
+
+    Args:
+      df (DataFrame): the DataFrame to split
+      chunk_rows (int): if applicable, the max number of rows per chunk (default 0)
+      chunk_bytes (int): if applicable, the max estimated bytes per chunk (default 0)
+
+    Returns:
+      chunks (list[DataFrame]): the resulting chunks, or the whole DataFrame if no limit applies
+    """
+    if not isinstance(chunk_rows, int) or chunk_rows < 0:
+      raise ValueError('Error: chunk_rows must be a non-negative <int>')
+    if not isinstance(chunk_bytes, int) or chunk_bytes < 0:
+      raise ValueError('Error: chunk_bytes must be a non-negative <int>')
+
+    # Convert the memory budget into rows using the average row size
+    limits: list[int] = [chunk_rows] if chunk_rows else []
+    if chunk_bytes and df.shape[0]:
+      limits.append(max(1, chunk_bytes * df.shape[0] // max(1, int(df.estimated_size()))))
+
+    if not limits or df.shape[0] <= min(limits):
+      return [df]
+    return list(df.iter_slices(min(limits)))
+
   def _preprocess(self, data: RawPoltaData) -> DataFrame:
     """Preprocesses the data before writing to delta
     
@@ -461,3 +1679,77 @@ class Table:
     df: DataFrame = self.enforce_dataframe(data)
     df: DataFrame = self.conform_schema(df)
     return df
+
+  def _write(self, data: RawPoltaData, mode: str) -> None:
+    """Appends or overwrites the data in a single commit, streaming Arrow streams
+
+    Args:
+      data (RawPoltaData): the data to write
+      mode (str): the write mode (i.e., 'append' or 'overwrite')
+    """
+    # A stream can only be consumed once, so its write cannot be retried
+    if self._is_arrow_stream(data):
+      reader: pa.RecordBatchReader = self._preprocess_arrow_stream(data)
+      self.metastore.commit(self.table_path, lambda commit_properties: write_deltalake(
+        self.get_as_delta_table(),
+        reader,
+        mode=mode,
+        commit_properties=commit_properties,
+        **self.write_properties.to_write_options()
+      ), retries=0)
+    else:
+      df: DataFrame = self._preprocess(data)
+      self.metastore.commit(self.table_path, lambda commit_properties: df.write_delta(
+        target=self.get_as_delta_table(),
+        mode=mode,
+        delta_write_options={**self.write_properties.to_write_options(), 'commit_properties': commit_properties}
+      ))
+
+  def _preprocess_arrow_stream(self, data: RawPoltaData) -> pa.RecordBatchReader:
+    """Lazily preprocesses an Arrow stream one record batch at a time
+
+    Args:
+      data (RawPoltaData): the Arrow stream to preprocess
+
+    Returns:
+      reader (RecordBatchReader): the stream of preprocessed record batches
+    """
+    compat_level: pl.CompatLevel = pl.CompatLevel.newest()
+    schema: pa.Schema = DataFrame([], self.schema.polars).to_arrow(compat_level=compat_level).schema
+
+    def preprocess(reader: pa.RecordBatchReader) -> Iterator[pa.RecordBatch]:
+      for batch in reader:
+        if not batch.num_rows:
+          continue
+        df: DataFrame = self._preprocess(batch).cast(self.schema.polars)
+        yield from df.to_arrow(compat_level=compat_level).to_batches()
+
+    return pa.RecordBatchReader.from_batches(schema, preprocess(self._to_arrow_reader(data)))
+
+  @staticmethod
+  def _is_arrow_stream(data: Any) -> bool:
+    """Indicates whether the data is an Arrow stream rather than in-memory data
+
+    Args:
+      data (Any): the data to check
+
+    Returns:
+      is_arrow_stream (bool): True if the data is a RecordBatchReader or exports __arrow_c_stream__
+    """
+    if isinstance(data, (DataFrame, pa.Table, pa.RecordBatch)):
+      return False
+    return isinstance(data, pa.RecordBatchReader) or hasattr(data, '__arrow_c_stream__')
+
+  @staticmethod
+  def _to_arrow_reader(data: Any) -> pa.RecordBatchReader:
+    """Wraps an Arrow stream as a RecordBatchReader via the Arrow PyCapsule interface
+
+    Args:
+      data (Any): the Arrow stream
+
+    Returns:
+      reader (RecordBatchReader): the RecordBatchReader of the stream
+    """
+    if isinstance(data, pa.RecordBatchReader):
+      return data
+    return pa.RecordBatchReader.from_stream(data)
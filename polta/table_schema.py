@@ -4,7 +4,7 @@ from polars.datatypes import DataType
 
 from polta.enums import TableQuality
 from polta.maps import Maps
-from polta.schemas.table import failed_test
+from polta.schemas.table import failed_test, row_hash_metadata
 
 
 @dataclass
@@ -14,6 +14,9 @@ class TableSchema:
   Positional Args:
     raw_deltalake (Schema): the schema of the table (without metadata fields)
     quality (TableQuality): the quality of the table
+
+  Optional Args:
+    row_hash (bool): indicates whether to add a _row_hash metadata field (default False)
   
   Initialized Fields:
     raw_polars (dict[str, DataType]): the raw schema as a polars dict
@@ -26,6 +29,7 @@ class TableSchema:
   """
   raw_deltalake: Schema
   quality: TableQuality
+  row_hash: bool = field(default_factory=lambda: False)
 
   raw_polars: dict[str, DataType] = field(init=False)
   metadata_fields: list[Field] = field(init=False)
@@ -43,6 +47,8 @@ class TableSchema:
       .deltalake_schema_to_polars_schema(self.raw_deltalake)
     self.metadata_fields: list[Field] = Maps \
       .quality_to_metadata_columns(self.quality)
+    if self.row_hash:
+      self.metadata_fields: list[Field] = self.metadata_fields + row_hash_metadata.fields
     self.deltalake: Schema = Schema(
       self.metadata_fields + self.raw_deltalake.fields
     )
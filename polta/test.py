@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
-from polars import DataFrame
-from typing import Any
+from polars import DataFrame, Expr, LazyFrame
+from typing import Any, Union
 
 from polta.check import Check
 from polta.enums import CheckAction
@@ -29,8 +29,33 @@ class Test:
   def __post_init__(self) -> None:
     self.result_column: str = self.check.build_result_column(self.column)
 
-  def run(self, df: DataFrame) -> DataFrame:
-    if self.check.simple_function:
+  def build_expression(self) -> Expr:
+    """Builds the result column expression for expression checks
+
+    Returns:
+      expression (Expr): the expression of 1 (passed) or 0 (failed), aliased as the result column
+    """
+    if self.check.expression is None:
+      raise TypeError(f'Error: check {self.check.name} does not define an expression')
+    return self.check.expression(self.column, **self.kwargs).alias(self.result_column)
+
+  def run(self, df: Union[DataFrame, LazyFrame]) -> Union[DataFrame, LazyFrame]:
+    """Runs the check against the data, adding the result column
+
+    Function checks always receive a DataFrame, so a LazyFrame gets collected
+      before they run and the result is returned as a LazyFrame again
+
+    Args:
+      df (Union[DataFrame, LazyFrame]): the data to check
+
+    Returns:
+      df (Union[DataFrame, LazyFrame]): the data with the result column
+    """
+    if self.check.expression is not None:
+      return df.with_columns(self.build_expression())
+    if isinstance(df, LazyFrame):
+      return self.run(df.collect()).lazy()
+    elif self.check.simple_function:
       return self.check.function(df, self.column)
     else:
       return self.check.function(df, self.column, **self.kwargs)
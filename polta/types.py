@@ -1,10 +1,19 @@
 from datetime import datetime
 from polars import DataFrame
-from typing import Literal, TypeAlias, TypedDict, Union
+from pyarrow import RecordBatch, RecordBatchReader, Table
+from typing import Any, Literal, Optional, Protocol, TypeAlias, TypedDict, Union
 
 
+class ArrowStreamExportable(Protocol):
+  """Protocol for any object exporting an Arrow stream via the Arrow PyCapsule interface"""
+  def __arrow_c_stream__(self, requested_schema: Any = None) -> Any: ...
+
 ExcelSpreadsheetEngine: TypeAlias = Literal['calamine', 'openpyxl', 'xlsx2csv']
-RawPoltaData: TypeAlias = Union[DataFrame, dict, list[dict]]
+FilterOperator: TypeAlias = Literal['=', '!=', '<', '<=', '>', '>=', 'in', 'not in']
+FilterCondition: TypeAlias = tuple[str, FilterOperator, Any]
+RawPoltaData: TypeAlias = Union[
+  DataFrame, dict, list[dict], Table, RecordBatch, RecordBatchReader, ArrowStreamExportable
+]
 
 class RawMetadata(TypedDict):
   """TypedDict to contain raw metadata for an ingest pipe"""
@@ -13,3 +22,28 @@ class RawMetadata(TypedDict):
   _file_path: str
   _file_name: str
   _file_mod_ts: datetime
+
+class UpsertChunkMetrics(TypedDict):
+  """TypedDict to contain the results of one upsert chunk"""
+  chunk_index: int
+  row_count: int
+  duration_seconds: float
+  num_target_rows_inserted: int
+  num_target_rows_updated: int
+  num_target_rows_deleted: int
+  num_target_files_scanned: int
+  num_target_files_skipped: int
+
+class ColumnStats(TypedDict):
+  """TypedDict to contain the statistics of one table column, or None where unknown"""
+  min: Any
+  max: Any
+  null_count: Optional[int]
+
+class TableStats(TypedDict):
+  """TypedDict to contain the statistics of a table at a version"""
+  version: int
+  file_count: int
+  row_count: Optional[int]
+  size_bytes: int
+  columns: dict[str, ColumnStats]
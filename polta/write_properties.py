@@ -0,0 +1,90 @@
+from dataclasses import dataclass, field
+from deltalake import WriterProperties
+from typing import Any, Literal, Optional
+
+
+@dataclass
+class WriteProperties:
+  """Contains the Parquet and Delta options applied to every write of a table
+
+  Leaving a field as None keeps the deltalake default
+
+  Optional Args:
+    compression (Optional[str]): the Parquet compression codec (e.g., 'ZSTD')
+    compression_level (Optional[int]): the level of the compression codec (e.g., 3 for ZSTD)
+    max_row_group_size (Optional[int]): the max number of rows per Parquet row group
+    target_file_size (Optional[int]): the target size of each Parquet file in bytes
+    data_skipping_num_indexed_cols (Optional[int]): the number of leading columns with file statistics
+    data_skipping_stats_columns (Optional[list[str]]): the columns with file statistics, overriding the number
+  """
+  compression: Optional[Literal['UNCOMPRESSED', 'SNAPPY', 'GZIP', 'BROTLI', 'LZ4', 'ZSTD', 'LZ4_RAW']] = \
+    field(default_factory=lambda: None)
+  compression_level: Optional[int] = field(default_factory=lambda: None)
+  max_row_group_size: Optional[int] = field(default_factory=lambda: None)
+  target_file_size: Optional[int] = field(default_factory=lambda: None)
+  data_skipping_num_indexed_cols: Optional[int] = field(default_factory=lambda: None)
+  data_skipping_stats_columns: Optional[list[str]] = field(default_factory=lambda: None)
+
+  def to_writer_properties(self) -> Optional[WriterProperties]:
+    """Builds the deltalake WriterProperties for the Parquet writer
+
+    Returns:
+      writer_properties (Optional[WriterProperties]): the writer properties, if any are set
+    """
+    if self.compression is None and self.compression_level is None and self.max_row_group_size is None:
+      return None
+    return WriterProperties(
+      compression=self.compression,
+      compression_level=self.compression_level,
+      max_row_group_size=self.max_row_group_size
+    )
+
+  def to_configuration(self) -> dict[str, str]:
+    """Builds the Delta table properties for data-skipping statistics
+
+    Returns:
+      configuration (dict[str, str]): the table properties, if any are set
+    """
+    configuration: dict[str, str] = {}
+    if self.data_skipping_num_indexed_cols is not None:
+      configuration['delta.dataSkippingNumIndexedCols'] = str(self.data_skipping_num_indexed_cols)
+    if self.data_skipping_stats_columns is not None:
+      configuration['delta.dataSkippingStatsColumns'] = ','.join(self.data_skipping_stats_columns)
+    return configuration
+
+  def to_write_options(self) -> dict[str, Any]:
+    """Builds the options for appends and overwrites (i.e., polars delta_write_options)
+
+    Returns:
+      options (dict[str, Any]): the write options
+    """
+    options: dict[str, Any] = {}
+    writer_properties: Optional[WriterProperties] = self.to_writer_properties()
+    if writer_properties is not None:
+      options['writer_properties'] = writer_properties
+    if self.target_file_size is not None:
+      options['target_file_size'] = self.target_file_size
+    return options
+
+  def to_merge_options(self) -> dict[str, Any]:
+    """Builds the options for merges (i.e., additions to polars delta_merge_options)
+
+    Returns:
+      options (dict[str, Any]): the merge options
+    """
+    writer_properties: Optional[WriterProperties] = self.to_writer_properties()
+    return {} if writer_properties is None else {'writer_properties': writer_properties}
+
+  def to_optimize_options(self, target_size: Optional[int] = None) -> dict[str, Any]:
+    """Builds the options for compaction and Z-ordering (i.e., deltalake optimize options)
+
+    Args:
+      target_size (optional) (int): if applicable, the target file size in bytes (default self.target_file_size)
+
+    Returns:
+      options (dict[str, Any]): the optimize options
+    """
+    return {
+      'target_size': target_size or self.target_file_size,
+      'writer_properties': self.to_writer_properties()
+    }
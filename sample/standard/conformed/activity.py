@@ -24,19 +24,14 @@ table: Table = Table(
 
 def get_dfs() -> dict[str, DataFrame]:
   """Basic load logic:
-    1. Get raw activity data as a DataFrame
-    2. Anti join against conformed layer to get net-new records
+    1. Get the raw activity data added since the last run as a DataFrame
   
   Returns:
     dfs (dict[str, DataFrame]): The resulting data as 'activity'
   """
   from sample.standard.raw.activity import table as tab_raw_activity
 
-  conformed_ids: DataFrame = table.get(select=['_raw_id'], unique=True)
-  df: DataFrame = (tab_raw_activity
-    .get()
-    .join(conformed_ids, '_raw_id', 'anti')
-  )
+  df: DataFrame = tab_raw_activity.read_incremental(consumer_id=table.id).collect()
   return {'activity': df}
 
 def transform(dfs: dict[str, DataFrame]) -> DataFrame:
@@ -1,6 +1,8 @@
-from polars import col, DataFrame
+from polars import col, DataFrame, Expr
 from unittest import TestCase
 
+from polta.check import Check
+
 from tests.testing_data.checks import TestingData
 
 
@@ -37,3 +39,23 @@ class TestChecks(TestCase):
 
     # Assert results are as expected
     assert df.to_dicts() == self.td.value_in_df.to_dicts()
+
+  def test_check_forms(self) -> None:
+    # Assert expression checks build an aliased expression
+    expression: Expr = self.td.positive_int_test.build_expression()
+    assert isinstance(expression, Expr)
+    df: DataFrame = self.td.input_df.select(expression)
+    assert df.columns == [self.td.positive_int_result_column]
+
+    # Assert function checks remain compatible and match expression checks
+    df: DataFrame = (self.td
+      .legacy_test.run(self.td.input_df)
+      .filter(col(self.td.positive_int_result_column) == 0)
+    )
+    assert df.to_dicts() == self.td.positive_int_failed_df.to_dicts()
+    self.assertRaises(TypeError, self.td.legacy_test.build_expression)
+
+    # Assert a check must have exactly one form
+    with self.assertRaises(ValueError) as ve:
+      Check('empty', 'Has no form')
+    self.assertEqual(ve.exception.args[0], self.td.check_msg)
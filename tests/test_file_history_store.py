@@ -0,0 +1,69 @@
+from polars import DataFrame
+from unittest import TestCase
+
+from polta.file_history_store import FileHistoryStore
+from sample.metastore import metastore_init
+from tests.testing_data.file_history_store import TestingData
+
+
+class TestFileHistoryStore(TestCase):
+  """Tests the file history stores"""
+  td: TestingData = TestingData()
+
+  def test_sqlite_store(self) -> None:
+    # Assert a cleared table is not synced yet
+    self.td.store.clear_file_history(self.td.table_id)
+    assert self.td.store.get_synced_version(self.td.table_id) is None
+    assert self.td.store.get_file_history(self.td.table_id).is_empty()
+
+    # Assert the store keeps the latest modification time of each file
+    self.td.store.write_file_history(self.td.table_id, self.td.df_2)
+    self.td.store.write_file_history(self.td.table_id, self.td.df_1)
+    df: DataFrame = self.td.store.get_file_history(self.td.table_id)
+    assert df.sort('_file_path').to_dicts() == self.td.expected_history
+
+    # Assert only new and modified files are left to ingest
+    df: DataFrame = self.td.store.filter_unseen_files(self.td.table_id, self.td.candidates_df)
+    assert df['_file_path'].sort().to_list() == self.td.expected_unseen_paths
+    assert df.schema == self.td.candidates_df.schema
+
+    # Assert the synced version only moves forward
+    self.td.store.set_synced_version(self.td.table_id, 2)
+    self.td.store.set_synced_version(self.td.table_id, 1)
+    assert self.td.store.get_synced_version(self.td.table_id) == 2
+
+    # Assert stores must implement every abstract method
+    self.assertRaises(TypeError, FileHistoryStore)
+
+    # Clear the store after testing
+    self.td.store.clear_file_history(self.td.table_id)
+
+  def test_metastore_mirror(self) -> None:
+    # Write history before the store is in use
+    self.td.metastore.clear_file_history(self.td.table_id)
+    metastore_init.write_file_history(self.td.table_id, self.td.df_1)
+
+    # Assert the store loads the existing history and the Delta table mirrors new writes
+    self.td.metastore.write_file_history(self.td.table_id, self.td.df_2)
+    assert self.td.store.get_synced_version(self.td.table_id) is not None
+    for df in [self.td.metastore.get_file_history(self.td.table_id), metastore_init.get_file_history(self.td.table_id)]:
+      assert df.sort('_file_path').to_dicts() == self.td.expected_history
+    df: DataFrame = self.td.metastore.filter_unseen_files(self.td.table_id, self.td.candidates_df)
+    assert df['_file_path'].sort().to_list() == self.td.expected_unseen_paths
+
+    # Assert the store catches up on files ingested by writers without the store
+    metastore_init.write_file_history(self.td.table_id, self.td.df_3)
+    df: DataFrame = self.td.metastore.filter_unseen_files(self.td.table_id, self.td.candidates_df)
+    assert df['_file_path'].to_list() == self.td.expected_caught_up_paths
+    assert self.td.store.get_synced_version(self.td.table_id) \
+      == metastore_init.get_delta_table(metastore_init.file_history_path).version()
+
+    # Assert the store reloads the history once another writer clears it
+    metastore_init.clear_file_history(self.td.table_id)
+    assert self.td.metastore.get_file_history(self.td.table_id).is_empty()
+    metastore_init.write_file_history(self.td.table_id, self.td.df_3)
+
+    # Assert clearing removes the history from both
+    self.td.metastore.clear_file_history(self.td.table_id)
+    assert self.td.metastore.get_file_history(self.td.table_id).is_empty()
+    assert metastore_init.get_file_history(self.td.table_id).is_empty()
@@ -1,17 +1,32 @@
-from deltalake import DeltaTable, Schema
+from asyncio import gather, run
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from deltalake import CommitProperties, DeltaTable, Schema, Transaction
+from deltalake.exceptions import CommitFailedError
 from os import path
 from polars import DataFrame
 from shutil import rmtree
+from threading import Lock
+from time import sleep
+from typing import Any
 from unittest import TestCase
 
 from polta.enums import TableQuality
 from polta.exceptions import DomainDoesNotExist
 from polta.metastore import Metastore, pipe_history
+from polta.table import Table
 from sample.metastore import metastore, metastore_init
 from sample.standard.pipelines.user import pip_can_user
 from tests.testing_data.metastore import TestingData
 
 
+class SlowMetastore(Metastore):
+  """Metastore whose initialization takes long enough for other threads to race it"""
+  def initialize_if_not_exists(self) -> None:
+    sleep(0.2)
+    super().initialize_if_not_exists()
+
+
 class TestMetastore(TestCase):
   """Tests the Metastore class"""
   # Retrieve test data and initialize the metastore
@@ -68,6 +83,213 @@ class TestMetastore(TestCase):
       rmtree(self.td.test_path)
     assert not path.exists(self.td.test_path)
 
+  def test_get_delta_table(self) -> None:
+    # Assert the same handle is returned while the log has not moved on
+    dt: DeltaTable = self.pm.get_delta_table(self.pm.pipe_history_path)
+    version: int = dt.version()
+    assert self.pm.get_delta_table(self.pm.pipe_history_path) is dt
+
+    # Assert the handle refreshes once another writer commits to the table
+    self.td.pipe_history_df.write_delta(self.pm.pipe_history_path, mode='append')
+    assert self.pm.get_delta_table(self.pm.pipe_history_path) is dt
+    assert dt.version() == version + 1
+
+    # Assert the least recently used handle gets evicted beyond the cache size
+    pm: Metastore = Metastore(self.pm_init.main_path, delta_table_cache_size=1)
+    dt: DeltaTable = pm.get_delta_table(pm.file_history_path)
+    pm.get_delta_table(pm.pipe_history_path)
+    assert pm.get_delta_table(pm.file_history_path) is not dt
+
+    # Assert handles can be evicted manually
+    dt: DeltaTable = self.pm.get_delta_table(self.pm.pipe_history_path)
+    self.pm.evict_delta_table(self.pm.pipe_history_path)
+    assert self.pm.get_delta_table(self.pm.pipe_history_path) is not dt
+
+  def test_commit(self) -> None:
+    attempts: list[int] = []
+    history_path: str = self.pm.pipe_history_path
+    row_count: int = self.pm.get_pipe_history().shape[0]
+
+    # Assert a conflicting commit gets retried
+    def conflicting_write(commit_properties: CommitProperties) -> str:
+      attempts.append(1)
+      if len(attempts) == 1:
+        raise CommitFailedError('Commit conflict')
+      return 'committed'
+    assert self.pm.commit(history_path, conflicting_write) == 'committed'
+    assert len(attempts) == 2
+
+    # Assert a write that landed despite an error does not get applied twice
+    def ambiguous_write(commit_properties: CommitProperties) -> None:
+      self.td.pipe_history_df.write_delta(
+        target=self.pm.get_delta_table(history_path),
+        mode='append',
+        delta_write_options={'commit_properties': commit_properties}
+      )
+      raise CommitFailedError('Connection reset after commit')
+    assert self.pm.commit(history_path, ambiguous_write) is None
+    assert self.pm.get_pipe_history().shape[0] == row_count + self.td.pipe_history_df.shape[0]
+    transaction: Transaction = self.pm.get_delta_table(history_path).transaction_versions()[self.pm.writer_id]
+    assert transaction.version == self.pm._transaction_version
+
+    # Assert errors other than commit conflicts do not get retried
+    def broken_write(commit_properties: CommitProperties) -> None:
+      attempts.append(1)
+      raise OSError('Disk full')
+    attempts.clear()
+    self.assertRaises(OSError, self.pm.commit, history_path, broken_write)
+    assert len(attempts) == 1
+
+    # Assert tables keep writer transactions for the configured retention only
+    configuration: dict[str, str] = self.pm.get_delta_table(self.pm.catalog_path).metadata().configuration
+    assert configuration['delta.setTransactionRetentionDuration'] == self.pm.transaction_retention
+
+    # Assert retries give up after commit_retries attempts
+    def failing_write(commit_properties: CommitProperties) -> None:
+      raise CommitFailedError('Commit conflict')
+    self.assertRaises(CommitFailedError, self.pm.commit, history_path, failing_write, 1)
+
+  def test_threaded_commits(self) -> None:
+    history_path: str = self.pm.pipe_history_path
+    row_count: int = self.pm.get_pipe_history().shape[0]
+
+    # Assert blocking writes to a shared system table from several threads all commit
+    def write(_: int) -> None:
+      self.pm.commit(history_path, lambda commit_properties: self.td.pipe_history_df.write_delta(
+        target=self.pm.get_delta_table(history_path),
+        mode='append',
+        delta_write_options={'commit_properties': commit_properties}
+      ))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+      list(executor.map(write, range(8)))
+    assert self.pm.get_pipe_history().shape[0] == row_count + 8 * self.td.pipe_history_df.shape[0]
+
+  def test_run_async(self) -> None:
+    # Track how many functions run at once on a metastore limited to two
+    pm: Metastore = Metastore(self.pm_init.main_path, max_concurrency=2)
+    lock: Lock = Lock()
+    state: dict[str, int] = {'running': 0, 'peak': 0}
+
+    def work(value: int) -> int:
+      with lock:
+        state['running'] += 1
+        state['peak'] = max(state['peak'], state['running'])
+      sleep(0.05)
+      with lock:
+        state['running'] -= 1
+      return value
+
+    async def run_all() -> list[int]:
+      return await gather(*[pm.run_async(work, i) for i in range(6)])
+
+    assert run(run_all()) == list(range(6))
+    assert state['peak'] == 2
+
+    # The async file history matches the blocking one
+    df: DataFrame = run(pm.aget_file_history('nonexistent_table'))
+    assert df.equals(pm.get_file_history('nonexistent_table'))
+
+  def test_file_history(self) -> None:
+    table_id: str = self.td.file_history_table_id
+    self.pm.clear_file_history(table_id)
+    assert self.pm.get_file_history(table_id).is_empty()
+
+    # Assert the cached history picks up new commits
+    self.pm.write_file_history(table_id, self.td.file_history_df_1)
+    df: DataFrame = self.pm.get_file_history(table_id)
+    assert self.pm.get_file_history(table_id) is df
+    self.pm.write_file_history(table_id, self.td.file_history_df_2)
+    assert self.pm.get_file_history(table_id).sort('_file_path').to_dicts() == self.td.expected_file_history
+
+    # Assert a fresh metastore reads the same history from the partition
+    pm: Metastore = Metastore(self.pm.main_path)
+    assert pm.get_file_history(table_id).sort('_file_path').to_dicts() == self.td.expected_file_history
+
+    # Assert removed files drop out of the cache
+    self.pm.clear_file_history(table_id)
+    assert self.pm.get_file_history(table_id).is_empty()
+
+  def test_maintain(self) -> None:
+    # Assert every table in the metastore gets listed
+    table_paths: list[str] = self.pm.list_table_paths()
+    assert self.pm.file_history_path in table_paths
+    assert self.pm.pipe_history_path in table_paths
+    assert self.pm.watermark_path in table_paths
+    assert self.pm.catalog_path in table_paths
+    assert pip_can_user.table.table_path in table_paths
+
+    # Assert maintenance runs across every table with low thresholds
+    df: DataFrame = self.pm.maintain(min_small_files=2, checkpoint_interval=0)
+    assert df.shape[0] == len(table_paths)
+    assert df.get_column('checkpointed').all()
+    assert df.get_column('files_compacted').sum() > 0
+
+  def test_catalog(self) -> None:
+    # Assert tables register themselves with their keys
+    entry: dict[str, Any] = self.pm_init.get_catalog_entry(self.td.table.id)
+    assert entry['table_path'] == self.td.table.table_path
+    assert entry['primary_keys'] == self.td.table.primary_keys
+
+    # Assert the schema comes from the Delta Table, along with the version it was registered at
+    dt: DeltaTable = self.pm_init.get_delta_table(self.td.table.table_path)
+    assert entry['schema'] == dt.schema().to_json()
+    assert entry['registered_version'] <= dt.version()
+
+    # Assert an unchanged table does not register again, while a changed one does
+    version: int = self.pm_init.get_delta_table(self.pm_init.catalog_path).version()
+    replace(self.td.table)
+    assert self.pm_init.get_delta_table(self.pm_init.catalog_path).version() == version
+    table: Table = replace(self.td.table, primary_keys=['id'])
+    assert self.pm_init.get_catalog_entry(table.id)['primary_keys'] == ['id']
+
+    # Assert dropped tables get unregistered
+    table.drop()
+    assert self.pm_init.get_catalog_entry(table.id) is None
+
+    # Assert a new catalog registers the existing tables
+    replace(self.td.table)
+    rmtree(self.pm_init.catalog_path)
+    self.pm_init.initialize_if_not_exists()
+    assert self.pm_init.get_catalog_entry(self.td.table.id)['table_path'] == self.td.table.table_path
+    replace(self.td.table)
+    assert self.pm_init.get_catalog_entry(self.td.table.id)['primary_keys'] == self.td.table.primary_keys
+
+  def test_lazy(self) -> None:
+    # Assert a lazy metastore and its tables do not touch the filesystem when constructed
+    pm: Metastore = Metastore(self.td.lazy_path, lazy=True)
+    table: Table = replace(self.td.table, metastore=pm)
+    raw_table: Table = replace(self.td.table, quality=TableQuality.RAW, metastore=pm)
+    assert not path.exists(self.td.lazy_path)
+
+    # Assert the first write creates the metastore and the table once
+    table.append(self.td.lazy_df)
+    assert path.exists(pm.catalog_path)
+    assert pm.get_catalog_entry(table.id)['table_path'] == table.table_path
+    assert pm.get_catalog_entry(raw_table.id) is None
+    assert table.get().shape[0] == self.td.lazy_df.shape[0]
+    assert pm.list_domains() == [table.domain]
+
+    # Assert the ingestion zone gets created before an ingester first lists it
+    assert not path.exists(raw_table.ingestion_zone_path)
+    raw_table.ensure_exists()
+    assert path.exists(raw_table.ingestion_zone_path)
+
+    # Assert maintenance skips registered tables whose Delta Table does not exist (yet)
+    rmtree(table.table_path)
+    assert table.table_path not in pm.list_table_paths()
+    assert pm.maintain().shape[0] == len(pm.list_table_paths())
+    rmtree(self.td.lazy_path)
+
+    # Assert threads racing the initialization only return once it is complete
+    pm: Metastore = SlowMetastore(self.td.lazy_path, lazy=True, buffer_system_writes=True)
+    def initialize(_: int) -> tuple[bool, bool]:
+      pm.ensure_initialized()
+      return path.exists(pm.catalog_path), pm._system_write_buffer is not None
+    with ThreadPoolExecutor(max_workers=2) as executor:
+      assert list(executor.map(initialize, range(2))) == [(True, True), (True, True)]
+    pm._system_write_buffer.close()
+    rmtree(self.td.lazy_path)
+
   def test_list_domains(self) -> None:
     # Assert metastore can return the list of domains
     domains: list[str] = self.pm.list_domains()
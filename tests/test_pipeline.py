@@ -1,7 +1,10 @@
 from os import path, remove
 from polars import DataFrame
+from types import SimpleNamespace
 from unittest import TestCase
 
+from polta.pipeline import Pipeline
+
 from sample.in_memory.pipelines.user import \
   pipeline as ppl_in_memory_user
 from sample.standard.canonical.user import \
@@ -16,6 +19,18 @@ from sample.standard.raw.activity import \
   table as tab_raw_activity
 
 
+class FailingPipe:
+  """Minimal pipe that fails, on a metastore whose buffered system writes fail to flush as well"""
+  def __init__(self) -> None:
+    self.table: SimpleNamespace = SimpleNamespace(metastore=SimpleNamespace(flush_system_writes=self.flush))
+
+  def execute(self) -> None:
+    raise ValueError('Pipe failed')
+
+  def flush(self) -> None:
+    raise OSError('Flush failed')
+
+
 class TestPipeline(TestCase):
   """Tests the standard and in-memory Pipeline logic"""
   def test_standard_pipeline(self) -> None:
@@ -65,3 +80,8 @@ class TestPipeline(TestCase):
 
     # Post-assertion cleanup
     exported_files.clear()
+
+  def test_failed_pipeline(self) -> None:
+    # Assert a failing flush does not hide the error of the pipe
+    with self.assertRaises(ValueError):
+      Pipeline(raw_pipes=[FailingPipe()]).execute()
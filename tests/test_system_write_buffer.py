@@ -0,0 +1,116 @@
+from gc import collect
+from os import listdir, path
+from polars import DataFrame
+from time import sleep
+from typing import Any
+from unittest import TestCase
+from weakref import ref
+
+from polta.metastore import Metastore
+from sample.metastore import metastore_init
+from tests.testing_data.system_write_buffer import TestingData
+
+
+class TestSystemWriteBuffer(TestCase):
+  """Tests the SystemWriteBuffer class"""
+  td: TestingData = TestingData()
+
+  def _get_metastore(self, **kwargs: Any) -> Metastore:
+    return Metastore(metastore_init.main_path, buffer_system_writes=True, **kwargs)
+
+  def _count_pipe_history(self) -> int:
+    return metastore_init.get_pipe_history(self.td.pipe_id).shape[0]
+
+  def test_flush_by_size(self) -> None:
+    pm: Metastore = self._get_metastore(system_write_buffer_size=self.td.buffer_size)
+    row_count: int = self._count_pipe_history()
+    version: int = pm.get_delta_table(pm.pipe_history_path).version()
+
+    # Assert buffered records are readable and spooled, but not committed
+    for _ in range(self.td.buffer_size - 1):
+      pm.write_pipe_history(**self.td.pipe_history_record)
+    assert pm.get_delta_table(pm.pipe_history_path).version() == version
+    assert pm.get_pipe_history(self.td.pipe_id).shape[0] == row_count + self.td.buffer_size - 1
+    assert len([f for f in listdir(pm._system_write_buffer.spool_directory) if f.endswith('.ndjson')]) == 1
+
+    # Assert a full buffer gets committed at once and the spool gets cleared
+    pm.write_pipe_history(**self.td.pipe_history_record)
+    assert pm.get_delta_table(pm.pipe_history_path).version() == version + 1
+    assert self._count_pipe_history() == row_count + self.td.buffer_size
+    assert [f for f in listdir(pm._system_write_buffer.spool_directory) if f.endswith('.ndjson')] == []
+
+  def test_flush_by_interval(self) -> None:
+    # Assert records older than the interval get flushed
+    pm: Metastore = self._get_metastore(system_write_flush_seconds=0)
+    row_count: int = self._count_pipe_history()
+    pm.write_pipe_history(**self.td.pipe_history_record)
+    assert self._count_pipe_history() == row_count + 1
+
+  def test_flush_by_timer(self) -> None:
+    # Assert buffered records get flushed once old enough, even without another append
+    pm: Metastore = self._get_metastore(system_write_flush_seconds=self.td.flush_seconds)
+    row_count: int = self._count_pipe_history()
+    pm.write_pipe_history(**self.td.pipe_history_record)
+    assert self._count_pipe_history() == row_count
+    sleep(self.td.flush_seconds * 5)
+    assert self._count_pipe_history() == row_count + 1
+    assert pm._system_write_buffer._timer is None
+
+    # Assert the exit hook does not keep the buffer or its metastore alive
+    buffer_ref: ref = ref(pm._system_write_buffer)
+    del pm
+    collect()
+    assert buffer_ref() is None
+
+  def test_buffered_file_history(self) -> None:
+    pm: Metastore = self._get_metastore()
+    pm.clear_file_history(self.td.table_id)
+
+    # Assert buffered file history already filters out ingested files
+    pm.write_file_history(self.td.table_id, self.td.file_history_df)
+    assert metastore_init.get_file_history(self.td.table_id).is_empty()
+    assert pm.get_file_history(self.td.table_id).shape[0] == 1
+    df: DataFrame = pm.filter_unseen_files(self.td.table_id, self.td.candidates_df)
+    assert df['_file_path'].to_list() == self.td.expected_unseen_paths
+
+    # Assert flushing commits the history
+    pm.flush_system_writes()
+    assert metastore_init.get_file_history(self.td.table_id).shape[0] == 1
+    pm.clear_file_history(self.td.table_id)
+
+  def test_recover(self) -> None:
+    pm: Metastore = self._get_metastore()
+    row_count: int = self._count_pipe_history()
+
+    # Simulate a crash after spooling a record, then after committing a record
+    pm.write_pipe_history(**self.td.pipe_history_record)
+    spool_directory: str = pm._system_write_buffer.spool_directory
+    spool_file: str = path.join(spool_directory, [f for f in listdir(spool_directory) if f.endswith('.ndjson')][0])
+    with open(spool_file) as f:
+      spooled: str = f.read()
+    pm.flush_system_writes()
+    pm.write_pipe_history(**self.td.pipe_history_record)
+    with open(spool_file, 'w') as f:
+      f.write(spooled)
+    pm._system_write_buffer._lock_file.close()
+    pm._system_write_buffer._records = {}
+
+    # Assert the next buffer commits the spooled record but not the committed one
+    self._get_metastore()
+    assert self._count_pipe_history() == row_count + 2
+    assert path.basename(spool_directory) not in listdir(pm.spool_directory)
+
+  def test_recover_reused_writer_id(self) -> None:
+    pm: Metastore = self._get_metastore(writer_id=self.td.writer_id)
+    row_count: int = self._count_pipe_history()
+
+    # Simulate a crash after spooling a record
+    pm.write_pipe_history(**self.td.pipe_history_record)
+    pm._system_write_buffer._lock_file.close()
+    pm._system_write_buffer._records = {}
+
+    # Assert a later metastore with the same writer_id commits its own leftover spool
+    pm: Metastore = self._get_metastore(writer_id=self.td.writer_id)
+    assert self._count_pipe_history() == row_count + 1
+    assert [f for f in listdir(pm._system_write_buffer.spool_directory) if f.endswith('.ndjson')] == []
+    pm._system_write_buffer.close()
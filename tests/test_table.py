@@ -1,15 +1,31 @@
-from deltalake import DeltaTable, Field, Schema
-from os import path
-from polars import DataFrame, read_delta
+from asyncio import gather, run
+from deltalake import DeltaTable, Field, Schema, TableFeatures, write_deltalake
+from os import listdir, path, rename
+from pyarrow import RecordBatchReader
+from polars import col, DataFrame, LazyFrame, read_delta, when
 from shutil import rmtree
 from typing import Any
 from unittest import TestCase
 
-from polta.exceptions import PoltaDataFormatNotRecognized
+from polta.exceptions import (
+  FilterOperatorNotRecognized,
+  PoltaDataFormatNotRecognized,
+  UpsertChunkFailed
+)
 from polta.table import Table
+from polta.types import TableStats, UpsertChunkMetrics
 from tests.testing_data.table import TestingData
 
 
+class StreamExporter:
+  """Minimal third-party producer exposing only the Arrow PyCapsule stream interface"""
+  def __init__(self, df: DataFrame) -> None:
+    self.df: DataFrame = df
+
+  def __arrow_c_stream__(self, requested_schema: Any = None) -> Any:
+    return self.df.__arrow_c_stream__(requested_schema)
+
+
 class TestTable(TestCase):
   """Tests Table class"""
   td: TestingData = TestingData()
@@ -46,6 +62,70 @@ class TestTable(TestCase):
     # Assert table initialization created the merge predicate as expected
     assert self.td.table.merge_predicate == self.td.expected_merge_predicate
 
+  def test_build_partition_predicate(self) -> None:
+    # Assert partition values become literal IN-lists
+    predicate: str = Table.build_partition_predicate(self.df_1, ['active_ind', 'name'], 't')
+    assert predicate == self.td.expected_partition_predicate
+
+    # Assert many partition values become a range
+    predicate: str = Table.build_partition_predicate(self.df_1, ['id'], max_in_values=2)
+    assert predicate == self.td.expected_range_predicate
+
+    # Assert no predicate gets built without partition keys or data
+    assert Table.build_partition_predicate(self.df_1, []) is None
+    assert Table.build_partition_predicate(self.empty_df, ['active_ind']) is None
+
+  def test_partitioned_merge(self) -> None:
+    # Truncate table before testing
+    self.td.partitioned_table.truncate()
+
+    # Upsert dataset 1 into both partitions
+    self.td.partitioned_table.upsert(self.df_1)
+
+    # Assert an upsert into one partition skips the files of the other
+    metrics: list[UpsertChunkMetrics] = self.td.partitioned_table.upsert(
+      self.df_1.filter(~col('active_ind'))
+    )
+    assert metrics[0]['num_target_rows_updated'] == 2
+    assert metrics[0]['num_target_files_skipped'] == 1
+    assert self.td.partitioned_table.get().shape[0] == self.td.output_dataset_1_len
+
+    # Clear table after testing
+    self.td.partitioned_table.truncate()
+
+  def test_build_partition_overwrite_predicate(self) -> None:
+    # Assert a single partition key becomes an exact IN-list
+    predicate: str = Table.build_partition_overwrite_predicate(self.df_1, ['active_ind'])
+    assert predicate == self.td.expected_overwrite_predicate
+
+    # Assert several partition keys become a disjunction of partitions, including nulls
+    df: DataFrame = self.df_1.with_columns(active_ind=when(col('id') == 3).then(None).otherwise(col('active_ind')))
+    predicate: str = Table.build_partition_overwrite_predicate(df, ['active_ind', 'id'])
+    assert predicate == self.td.expected_multi_key_overwrite_predicate
+
+    # Assert no predicate gets built without partition keys or data
+    assert Table.build_partition_overwrite_predicate(self.df_1, []) is None
+    assert Table.build_partition_overwrite_predicate(self.empty_df, ['active_ind']) is None
+
+  def test_overwrite_partitions(self) -> None:
+    # Load dataset 1 into both partitions
+    self.td.table.overwrite(self.df_1)
+    active_ids: list[dict[str, Any]] = self.td.table.get(filter_conditions={'active_ind': True}) \
+      .select('id').sort('id').to_dicts()
+
+    # Assert reloading the inactive partition leaves the active partition untouched
+    reload_df: DataFrame = self.df_1.filter(~col('active_ind')).head(1)
+    self.td.table.overwrite_partitions(reload_df)
+    assert self.td.table.get(filter_conditions={'active_ind': True}) \
+      .select('id').sort('id').to_dicts() == active_ids
+    assert self.td.table.get(filter_conditions={'active_ind': False}).shape[0] == 1
+
+    # Assert a table without partition keys cannot overwrite partitions
+    self.assertRaises(ValueError, self.td.row_hash_table.overwrite_partitions, self.df_1)
+
+    # Clear table after testing
+    self.td.table.truncate()
+
   def test_truncate(self) -> None:
     # Assert some data exists in the table
     self.td.table.append(self.df_1)
@@ -132,6 +212,63 @@ class TestTable(TestCase):
     df: DataFrame = self.td.table.get(sort_by=['id'])
     assert isinstance(df, DataFrame)
 
+  def test_scan(self) -> None:
+    # Load data into the table before testing
+    self.td.table.overwrite(self.df_1)
+
+    # Assert the scan returns a LazyFrame without reading any data
+    lf: LazyFrame = self.td.table.scan()
+    assert isinstance(lf, LazyFrame)
+
+    # Assert filters and projections on the LazyFrame return the expected data
+    df: DataFrame = (lf
+      .filter(~col('active_ind'))
+      .select('id')
+      .sort('id')
+      .collect()
+    )
+    assert df.to_dicts() == self.td.scan_inactive_ids
+
+    # Clear table after testing
+    self.td.table.truncate()
+
+  def test_get_file_uris(self) -> None:
+    # Load data into two partitions before testing
+    self.td.table.overwrite(self.df_1)
+    self.td.table.append(self.df_2)
+
+    # Assert conditions on partition keys skip files by partition value
+    file_uris, skipped_count = self.td.table.get_file_uris({'active_ind': False})
+    assert len(file_uris) == 1
+    assert skipped_count == 2
+
+    # Assert the kept file is the one from the matching partition, as listed by the Delta Table
+    assert file_uris[0] in self.td.table.get_as_delta_table().file_uris()
+    assert 'active_ind=false' in file_uris[0]
+
+    # Assert conditions on other columns skip files by min/max statistics
+    file_uris, skipped_count = self.td.table.get_file_uris(filters=[('id', '>=', 4)])
+    assert len(file_uris) == 1
+    assert skipped_count == 2
+
+    # Assert pruned reads still return only the matching rows
+    df: DataFrame = self.td.table.get(filters=[('id', '>=', 3)], sort_by=['id'])
+    assert df.select('id').to_dicts() == self.td.filters_ids
+    df: DataFrame = self.td.table.get({'id': [1, 4]}, sort_by=['id'])
+    assert df.select('id').to_dicts() == self.td.filter_conditions_in_ids
+
+    # Assert validation checks work as expected
+    with self.assertRaises(TypeError) as te:
+      self.td.table.get(filters=4)
+    self.assertEqual(te.exception.args[0], self.td.filters_msg)
+    with self.assertRaises(TypeError) as te:
+      self.td.table.get(filters=[('id', '>=')])
+    self.assertEqual(te.exception.args[0], self.td.filters_item_msg)
+    self.assertRaises(FilterOperatorNotRecognized, self.td.table.get, filters=[('id', '~', 4)])
+
+    # Clear table after testing
+    self.td.table.truncate()
+
   def test_enforce_dataframe(self) -> None:
     # Assert bad data fails
     self.assertRaises(PoltaDataFormatNotRecognized, self.td.table.enforce_dataframe, 4)
@@ -152,6 +289,13 @@ class TestTable(TestCase):
     assert isinstance(df, DataFrame)
     assert df.is_empty()
 
+    # Assert Arrow tables, record batches, and streams work
+    for data in [self.df_1.to_arrow(), self.df_1.to_arrow().to_batches()[0], self.df_1]:
+      df: DataFrame = self.td.table.enforce_dataframe(data)
+      assert df.equals(self.df_1)
+    df: DataFrame = self.td.table.enforce_dataframe(self.df_1.to_arrow().to_reader())
+    assert df.equals(self.df_1)
+
   def test_ingestion_zone_directory(self) -> None:
     # Remove ingestion zone path first
     rmtree(self.td.raw_table.ingestion_zone_path)
@@ -169,6 +313,38 @@ class TestTable(TestCase):
     assert sorted([r['id'] for r in failed.to_dicts()]) == self.td.failed_ids
     assert sorted([r['id'] for r in quarantined.to_dicts()]) == self.td.quarantine_ids
 
+    # Assert each failed row is labelled by the first test it failed
+    assert failed.select('id', 'failed_test').sort('id').to_dicts() == self.td.failed_records
+
+    # Assert tests get evaluated inside a LazyFrame plan
+    passed, failed, quarantined = self.td.apply_test_table.apply_tests(self.apply_test_df.lazy())
+    assert sorted([r['id'] for r in passed.to_dicts()]) == self.td.passed_ids
+    assert sorted([r['id'] for r in failed.to_dicts()]) == self.td.failed_ids
+    assert sorted([r['id'] for r in quarantined.to_dicts()]) == self.td.quarantine_ids
+
+    # Assert DataFrame-style function checks receive a DataFrame, even from a LazyFrame input
+    for data in [self.apply_test_df, self.apply_test_df.lazy()]:
+      passed, failed, quarantined = self.td.eager_apply_test_table.apply_tests(data)
+      assert sorted([r['id'] for r in passed.to_dicts()]) == self.td.passed_ids
+      assert failed.select('id', 'failed_test').sort('id').to_dicts() == self.td.failed_records
+      assert sorted([r['id'] for r in quarantined.to_dicts()]) == self.td.quarantine_ids
+
+    # Assert no rows pass when every row fails the first test
+    passed, failed, quarantined = self.td.apply_test_table.apply_tests(
+      self.apply_test_df.filter(col('id').is_in(self.td.first_test_failed_ids))
+    )
+    assert passed.is_empty()
+    assert sorted([r['id'] for r in failed.to_dicts()]) == self.td.first_test_failed_ids
+    assert quarantined.is_empty()
+
+    # Assert rows with a null test result fail instead of dropping out or passing
+    passed, failed, quarantined = self.td.null_result_apply_test_table.apply_tests(
+      DataFrame(self.td.null_result_dataset, self.td.null_result_apply_test_table.schema.polars)
+    )
+    assert sorted([r['id'] for r in passed.to_dicts()]) == self.td.null_result_passed_ids
+    assert sorted([r['id'] for r in failed.to_dicts()]) == self.td.null_result_failed_ids
+    assert quarantined.is_empty()
+
   def test_append(self) -> None:
     # Truncate table before testing
     self.td.table.truncate()
@@ -188,6 +364,30 @@ class TestTable(TestCase):
     # Clear table after testing
     self.td.table.truncate()
 
+  def test_async(self) -> None:
+    # Truncate table before testing
+    self.td.table.truncate()
+
+    async def append_and_get() -> DataFrame:
+      await gather(
+        self.td.table.aappend(self.df_1),
+        self.td.table.aappend(self.df_2)
+      )
+      metrics: list[UpsertChunkMetrics] = await self.td.table.aupsert(self.df_2)
+      assert sum(m['num_target_rows_inserted'] for m in metrics) == 0
+      return await self.td.table.aget()
+
+    # Both concurrent appends land, and the upsert of existing rows inserts nothing
+    df: DataFrame = run(append_and_get())
+    assert df.shape[0] == self.df_1.shape[0] + self.df_2.shape[0]
+
+    # Overwrite the table asynchronously
+    run(self.td.table.aoverwrite(self.df_1))
+    assert self.td.table.get().shape[0] == self.td.output_dataset_1_len
+
+    # Clear table after testing
+    self.td.table.truncate()
+
   def test_overwrite(self) -> None:
     # Test overwrite with dataset 1
     self.td.table.overwrite(self.df_1)
@@ -242,6 +442,314 @@ class TestTable(TestCase):
     # Assert validation checks work as expected
     self.assertRaises(ValueError, self.td.raw_table.upsert, self.df_1)
     
+  def test_chunked_upsert(self) -> None:
+    # Truncate table before testing
+    self.td.table.truncate()
+
+    # Assert a row-bounded upsert merges one chunk per row
+    metrics: list[UpsertChunkMetrics] = self.td.table.upsert(self.df_1, chunk_rows=1)
+    assert [m['row_count'] for m in metrics] == [1, 1, 1]
+    assert sum(m['num_target_rows_inserted'] for m in metrics) == self.td.output_dataset_1_len
+    assert self.td.table.get().shape[0] == self.td.output_dataset_1_len
+
+    # Assert a memory-bounded upsert splits the data as well
+    metrics: list[UpsertChunkMetrics] = self.td.table.upsert(self.df_1, chunk_bytes=1)
+    assert len(metrics) == self.td.output_dataset_1_len
+    assert sum(m['num_target_rows_updated'] for m in metrics) == self.td.output_dataset_1_len
+
+    # Assert an upsert can resume from a given chunk
+    metrics: list[UpsertChunkMetrics] = self.td.table.upsert(self.df_2, chunk_rows=1, start_chunk=1)
+    assert [m['chunk_index'] for m in metrics] == [1]
+    assert self.td.table.get().shape[0] == self.td.output_dataset_1_len + 1
+
+    # Assert a failed chunk gets reported 1-based like the progress, with the 0-based index to resume from
+    error: UpsertChunkFailed = UpsertChunkFailed(0, 3, ValueError('merge failed'))
+    assert error.message.startswith('Upsert chunk 1 of 3 failed (resume with start_chunk=0)')
+
+    # Assert an unbounded upsert merges in one chunk
+    assert len(self.td.table.upsert(self.df_2)) == 1
+
+    # Assert validation checks work as expected
+    self.assertRaises(ValueError, self.td.table.upsert, self.df_1, -1)
+
+    # Clear table after testing
+    self.td.table.truncate()
+
+  def test_arrow_stream_writes(self) -> None:
+    # Truncate table before testing
+    self.td.table.truncate()
+
+    # Assert a streamed append writes every batch in a single commit
+    version: int = self.td.table.get_as_delta_table().version()
+    reader: RecordBatchReader = self.df_1.to_arrow().to_reader(max_chunksize=1)
+    self.td.table.append(reader)
+    assert self.td.table.get_as_delta_table().version() == version + 1
+    assert self.td.table.get().select('id').sort('id').to_dicts() == self.td.output_dataset_1_ids
+
+    # Assert a streamed upsert merges batch by batch
+    reader: RecordBatchReader = self.df_2.to_arrow().to_reader(max_chunksize=1)
+    metrics: list[UpsertChunkMetrics] = self.td.table.upsert(reader)
+    assert [m['row_count'] for m in metrics] == [1] * self.td.output_dataset_2_len
+    assert self.td.table.get().shape[0] == self.td.output_dataset_1_len + 1
+
+    # Assert objects exporting __arrow_c_stream__ get streamed as well
+    self.td.table.overwrite(StreamExporter(self.df_2))
+    assert self.td.table.get().select('id').sort('id').to_dicts() == self.td.output_dataset_2_ids
+
+    # Clear table after testing
+    self.td.table.truncate()
+
+  def test_sync(self) -> None:
+    # Load dataset 1 into the table
+    self.td.table.overwrite(self.df_1)
+
+    # Assert a snapshot missing a row deletes it in the same merge
+    metrics: UpsertChunkMetrics = self.td.table.sync(self.df_1.filter(col('id') != 2))
+    assert metrics['num_target_rows_updated'] == 2
+    assert metrics['num_target_rows_deleted'] == 1
+    assert self.td.table.get().select('id').sort('id').to_dicts() == self.td.sync_ids
+
+    # Assert a scoped snapshot only deletes missing rows within its scope
+    metrics: UpsertChunkMetrics = self.td.table.sync(
+      self.df_1.filter(col('active_ind')),
+      delete_predicate='t.active_ind = true'
+    )
+    assert metrics['num_target_rows_deleted'] == 0
+    assert self.td.table.get().select('id').sort('id').to_dicts() == self.td.sync_ids
+
+    # Clear table after testing
+    self.td.table.truncate()
+
+  def test_apply_changes(self) -> None:
+    # Truncate table before testing
+    self.td.cdc_table.truncate()
+
+    # Assert only the latest change per key survives, without sorting the input
+    df: DataFrame = Table.keep_latest_changes(DataFrame(self.td.cdc_dataset_1), ['id'], 'seq')
+    assert df.select('id', 'seq').to_dicts() == [{'id': 1, 'seq': 3}, {'id': 2, 'seq': 1}, {'id': 3, 'seq': 2}]
+
+    # Assert keys whose sequence numbers are null still keep their last change
+    df: DataFrame = Table.keep_latest_changes(DataFrame(self.td.cdc_null_sequence_dataset), ['id'], 'seq')
+    assert df.select('id', 'name').to_dicts() == self.td.expected_cdc_null_sequence_rows
+
+    # Assert inserts, updates, and deletes get applied in one merge
+    self.td.cdc_table.apply_changes(DataFrame(self.td.cdc_dataset_1))
+    assert self.td.cdc_table.get().select('id', 'name').sort('id').to_dicts() == self.td.expected_cdc_rows_1
+
+    # Assert stale changes get ignored while newer ones get applied
+    metrics: UpsertChunkMetrics = self.td.cdc_table.apply_changes(DataFrame(self.td.cdc_dataset_2))
+    assert metrics['num_target_rows_deleted'] == 1
+    assert metrics['num_target_rows_inserted'] == 1
+    assert self.td.cdc_table.get().select('id', 'name').sort('id').to_dicts() == self.td.expected_cdc_rows_2
+
+    # Assert tables without CDC columns cannot apply changes
+    self.assertRaises(ValueError, self.td.table.apply_changes, self.df_1)
+
+    # Clear table after testing
+    self.td.cdc_table.truncate()
+
+  def test_read_changes(self) -> None:
+    # Load the initial data
+    self.td.cdf_table.overwrite(DataFrame(self.td.cdf_dataset))
+    version: int = self.td.cdf_table.get_as_delta_table().version()
+
+    # Assert the changes since the last read only contain the upserted rows
+    self.td.cdf_table.upsert(DataFrame([{'id': 1, 'name': 'Spongebob Squarepants'}, {'id': 3, 'name': 'Plankton'}]))
+    lf: LazyFrame = self.td.cdf_table.read_changes(version + 1)
+    assert isinstance(lf, LazyFrame)
+    df: DataFrame = lf.select('id', '_change_type').sort('id', '_change_type').collect()
+    assert df.to_dicts() == self.td.expected_change_types
+
+    # Assert reading past the latest version returns no changes
+    df: DataFrame = self.td.cdf_table.read_changes(version + 2).collect()
+    assert df.is_empty()
+    assert '_commit_version' in df.columns
+
+    # Assert tables without the change data feed cannot read changes
+    self.assertRaises(ValueError, self.td.table.read_changes)
+    self.assertRaises(TypeError, self.td.cdf_table.read_changes, '1')
+
+    # Clear table after testing
+    self.td.cdf_table.truncate()
+
+  def test_read_incremental(self) -> None:
+    # Truncate table and watermarks before testing
+    self.td.table.truncate()
+    self.td.table.metastore.clear_watermarks(self.td.consumer_id)
+
+    # Assert a consumer without a watermark reads everything
+    self.td.table.append(self.df_1)
+    df: DataFrame = self.td.table.read_incremental(self.td.consumer_id).collect()
+    assert df.shape[0] == self.td.output_dataset_1_len
+
+    # Assert an uncommitted read gets repeated, while a committed one does not
+    self.td.table.metastore.discard_watermarks(self.td.consumer_id)
+    assert self.td.table.read_incremental(self.td.consumer_id).collect().shape[0] == self.td.output_dataset_1_len
+    self.td.table.metastore.commit_watermarks(self.td.consumer_id)
+    assert self.td.table.read_incremental(self.td.consumer_id).collect().is_empty()
+
+    # Assert only files added after the watermark get read
+    self.td.table.metastore.commit_watermarks(self.td.consumer_id)
+    self.td.table.append(self.df_2)
+    df: DataFrame = self.td.table.read_incremental(self.td.consumer_id).collect()
+    assert df.select('id').sort('id').to_dicts() == self.td.output_dataset_2_ids
+    self.td.table.metastore.commit_watermarks(self.td.consumer_id)
+    assert self.td.table.metastore.get_watermark(self.td.consumer_id, self.td.table.id) \
+      == self.td.table.get_as_delta_table().version()
+
+    # Assert a watermark the log no longer covers falls back to a full scan with a warning
+    self.td.table.append(self.df_2)
+    commit_path: str = path.join(self.td.table.table_path, '_delta_log',
+                                 f'{self.td.table.get_as_delta_table().version():020}.json')
+    rename(commit_path, f'{commit_path}.bak')
+    try:
+      with self.assertWarns(RuntimeWarning):
+        lf: LazyFrame = self.td.table.read_incremental(self.td.consumer_id)
+    finally:
+      rename(f'{commit_path}.bak', commit_path)
+    assert lf.collect().shape[0] == self.td.output_dataset_1_len + 2 * self.df_2.shape[0]
+
+    # Assert validation checks work as expected
+    self.assertRaises(TypeError, self.td.table.read_incremental, 1)
+
+    # Clear table and watermarks after testing
+    self.td.table.truncate()
+    self.td.table.metastore.clear_watermarks(self.td.consumer_id)
+    assert self.td.table.metastore.get_watermark(self.td.consumer_id, self.td.table.id) == -1
+
+  def test_requires_delta_reader(self) -> None:
+    # Assert the table's own tables can be read as plain Parquet files
+    assert not Table.requires_delta_reader(self.td.table.get_as_delta_table())
+
+    # Assert tables with deletion vectors require the Delta reader
+    write_deltalake(self.td.deletion_vectors_path, self.df_1.to_arrow(), mode='overwrite')
+    dt: DeltaTable = DeltaTable(self.td.deletion_vectors_path)
+    assert not Table.requires_delta_reader(dt)
+    dt.alter.add_feature(TableFeatures.DeletionVectors, allow_protocol_versions_increase=True)
+    assert Table.requires_delta_reader(dt)
+
+    # Remove the table after testing
+    rmtree(self.td.deletion_vectors_path)
+
+  def test_lookup(self) -> None:
+    # Load dataset 1 into the table
+    self.td.table.overwrite(self.df_1)
+
+    # Assert single and batched lookups return the matching rows
+    df: DataFrame = self.td.table.lookup((1, 'Spongebob Squarepants'))
+    assert df.select('id').to_dicts() == [{'id': 1}]
+    df: DataFrame = self.td.table.lookup([{'id': 2, 'name': 'Gary the Snail'}, (3, 'Plankton'), (9, 'Nobody')])
+    assert df.select('id').sort('id').to_dicts() == self.td.scan_inactive_ids
+
+    # Assert the index catches up on upserts, only opening the files with the keys
+    self.td.table.upsert(self.df_2)
+    index: DataFrame = self.td.table.get_key_index()
+    assert index.shape[0] == self.td.table.count()
+    assert set(index.get_column('_file_path')) == set(self.td.table.get_as_delta_table().file_uris())
+    assert self.td.table.lookup(self.df_2).shape[0] == self.td.output_dataset_2_len
+
+    # Assert a fresh Table reuses the persisted index
+    table: Table = Table(
+      domain=self.td.table.domain,
+      quality=self.td.table.quality,
+      name=self.td.table.name,
+      raw_schema=self.td.table.raw_schema,
+      primary_keys=self.td.table.primary_keys,
+      metastore=self.td.table.metastore,
+      partition_keys=self.td.table.partition_keys
+    )
+    assert table.lookup(self.df_2).shape[0] == self.td.output_dataset_2_len
+    assert table.get_key_index().equals(self.td.table.get_key_index())
+
+    # Assert a stale Table does not remove the index saved for a newer version
+    self.td.table.upsert(self.df_2)
+    self.td.table.get_key_index()
+    table._save_key_index(table.get_key_index().clear(), table._key_index_uuid, table._key_index_version - 1)
+    assert len(listdir(self.td.table.key_index_path)) == 1
+    assert self.td.table.lookup(self.df_2).shape[0] == self.td.output_dataset_2_len
+
+    # Assert validation checks work as expected
+    self.assertRaises(ValueError, self.td.table.lookup, (1,))
+    self.assertRaises(ValueError, self.td.raw_table.lookup, [])
+
+    # Clear table after testing
+    self.td.table.truncate()
+    assert self.td.table.get_key_index().is_empty()
+
+  def test_stats(self) -> None:
+    # Assert an empty table has empty statistics
+    self.td.table.truncate()
+    assert self.td.table.count() == 0
+    stats: TableStats = self.td.table.stats()
+    assert stats['file_count'] == 0
+    assert stats['row_count'] == 0
+
+    # Assert the statistics match the data without reading it
+    self.td.table.append(self.df_1)
+    stats: TableStats = self.td.table.stats()
+    assert self.td.table.count() == self.td.output_dataset_1_len
+    assert stats['version'] == self.td.table.get_as_delta_table().version()
+    assert stats['file_count'] == 2
+    assert stats['row_count'] == self.td.output_dataset_1_len
+    assert stats['size_bytes'] > 0
+    assert stats['columns']['id'] == self.td.expected_id_stats
+    assert stats['columns']['active_ind'] == self.td.expected_active_ind_stats
+
+    # Clear table after testing
+    self.td.table.truncate()
+
+  def test_row_hash_merge(self) -> None:
+    # Truncate table before testing
+    self.td.row_hash_table.truncate()
+
+    # Assert the row hash gets stored as a metadata column
+    self.td.row_hash_table.upsert(self.df_1)
+    df: DataFrame = self.td.row_hash_table.get()
+    assert '_row_hash' in self.td.row_hash_table.schema.metadata_columns
+    assert df.get_column('_row_hash').null_count() == 0
+
+    # Assert unchanged rows do not get updated
+    metrics: list[UpsertChunkMetrics] = self.td.row_hash_table.upsert(self.df_1)
+    assert metrics[0]['num_target_rows_updated'] == 0
+
+    # Assert changed rows still get updated
+    metrics: list[UpsertChunkMetrics] = self.td.row_hash_table.upsert(
+      self.df_1.with_columns(~col('active_ind').alias('active_ind')).filter(col('id') == 1)
+    )
+    assert metrics[0]['num_target_rows_updated'] == 1
+
+    # Clear table after testing
+    self.td.row_hash_table.truncate()
+
+  def test_maintenance(self) -> None:
+    # Load several small files before testing
+    self.td.table.truncate()
+    for _ in range(3):
+      self.td.table.append(self.df_1)
+    file_count: int = len(self.td.table.get_file_uris()[0])
+
+    # Assert compaction rewrites the small files
+    metrics: dict[str, Any] = self.td.table.optimize()
+    assert metrics['numFilesRemoved'] == file_count
+    assert len(self.td.table.get_file_uris()[0]) < file_count
+
+    # Assert Z-ordering works on chosen columns
+    metrics: dict[str, Any] = self.td.table.optimize(z_order_columns=['id'])
+    assert metrics['numFilesAdded'] > 0
+    self.assertRaises(ValueError, self.td.table.optimize, z_order_columns=['nonexistent'])
+
+    # Assert vacuum removes the files replaced by compaction
+    removed: list[str] = self.td.table.vacuum(retention_hours=0, enforce_retention_duration=False)
+    assert len(removed) >= file_count
+
+    # Assert checkpointing writes a checkpoint of the log
+    self.td.table.checkpoint()
+    assert path.exists(path.join(self.td.table.table_path, '_delta_log', '_last_checkpoint'))
+    assert self.td.table.get().shape[0] == self.td.output_dataset_1_len * 3
+
+    # Clear table after testing
+    self.td.table.truncate()
+
   def test_get_as_delta_table(self) -> None:
     # Assert Delta Table retrieval works
     delta_table: DeltaTable = self.td.table.get_as_delta_table()
@@ -0,0 +1,56 @@
+from polars import DataFrame, from_arrow
+from pyarrow.parquet import FileMetaData, ParquetFile
+from unittest import TestCase
+
+from tests.testing_data.write_properties import TestingData
+
+
+class TestWriteProperties(TestCase):
+  """Tests the WriteProperties class"""
+  td: TestingData = TestingData()
+
+  def test_options(self) -> None:
+    # Assert default properties keep the deltalake defaults
+    assert self.td.default_properties.to_writer_properties() is None
+    assert self.td.default_properties.to_configuration() == {}
+    assert self.td.default_properties.to_write_options() == {}
+    assert self.td.default_properties.to_merge_options() == {}
+    assert self.td.default_properties.to_optimize_options() == {'target_size': None, 'writer_properties': None}
+
+    # Assert set properties get converted into deltalake options
+    assert self.td.properties.to_configuration() == self.td.expected_configuration
+    assert self.td.properties.to_write_options()['target_file_size'] == self.td.properties.target_file_size
+    assert 'writer_properties' in self.td.properties.to_write_options()
+    assert 'writer_properties' in self.td.properties.to_merge_options()
+    assert self.td.properties.to_optimize_options()['target_size'] == self.td.properties.target_file_size
+    assert self.td.properties.to_optimize_options(1024)['target_size'] == 1024
+    assert self.td.properties.to_optimize_options()['writer_properties'] is not None
+
+  def test_table_writes(self) -> None:
+    # Write through every write logic of the table
+    self.td.table.truncate()
+    self.td.table.append(self.td.df)
+    self.td.table.upsert(self.td.df)
+    self.td.table.overwrite(self.td.df)
+
+    # Assert the table properties got applied to the Delta Table, so applying them again is a no-op
+    configuration: dict[str, str] = self.td.table.get_as_delta_table().metadata().configuration
+    assert configuration.items() >= self.td.table.write_properties.to_configuration().items()
+    assert not self.td.table.apply_properties()
+
+    # Assert the Parquet files use the configured compression and row groups
+    for file_uri in self.td.table.get_file_uris()[0]:
+      metadata: FileMetaData = ParquetFile(file_uri).metadata
+      assert metadata.row_group(0).column(0).compression == self.td.expected_compression
+      assert metadata.num_row_groups == self.td.expected_row_groups
+
+    # Assert only the configured columns carry statistics
+    actions: DataFrame = from_arrow(self.td.table.get_as_delta_table().get_add_actions(flatten=True))
+    stats_columns: list[str] = [
+      c for c in actions.columns
+      if c.startswith(('min.', 'max.')) and actions.get_column(c).null_count() == 0
+    ]
+    assert stats_columns == self.td.expected_stats_columns
+
+    # Clear table after testing
+    self.td.table.truncate()
@@ -1,5 +1,8 @@
+import polars as pl
+
 from polars import DataFrame
 
+from polta.check import Check
 from polta.checks import (
   check_not_null_or_empty,
   check_positive_int,
@@ -49,3 +52,22 @@ class TestingData:
   value_in_df: DataFrame = DataFrame([
     {'id': 4, 'name': 'Plankton', 'category': 'TP', 'salary': 70_000, value_in_result_column: 0},
   ])
+
+  legacy_check: Check = Check(
+    name='positive_int',
+    description='Checks whether column values are positive integers',
+    function=lambda df, column: (df
+      .with_columns([
+        pl.when(pl.col(column) >= 0)
+          .then(pl.lit(1))
+          .otherwise(pl.lit(0))
+          .alias(f'__{column}__positive_int__')
+      ])
+    )
+  )
+  legacy_test: Test = Test(
+    check=legacy_check,
+    column='salary',
+    check_action=CheckAction.FAIL
+  )
+  check_msg: str = 'Error: exactly one of function or expression must be provided'
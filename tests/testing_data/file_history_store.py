@@ -0,0 +1,51 @@
+from datetime import datetime, UTC
+from os import path
+from polars import DataFrame
+from typing import Any
+
+from polta.file_history_store import SQLiteFileHistoryStore
+from polta.metastore import Metastore
+from sample.metastore import metastore_init
+
+
+class TestingData:
+  """Contains test data for the file history stores"""
+  table_id: str = 'test.store.file_history'
+  store: SQLiteFileHistoryStore = SQLiteFileHistoryStore(
+    database_path=path.join(metastore_init.sys_directory, 'file_history.sqlite')
+  )
+  metastore: Metastore = Metastore(metastore_init.main_path, file_history_store=store)
+
+  df_1: DataFrame = DataFrame([{
+    '_file_path': 'a.json',
+    '_file_mod_ts': datetime(2025, 1, 1, tzinfo=UTC),
+    '_ingested_ts': datetime(2025, 1, 1, tzinfo=UTC)
+  }])
+  df_2: DataFrame = DataFrame([
+    {
+      '_file_path': 'a.json',
+      '_file_mod_ts': datetime(2025, 1, 2, tzinfo=UTC),
+      '_ingested_ts': datetime(2025, 1, 2, tzinfo=UTC)
+    },
+    {
+      '_file_path': 'b.json',
+      '_file_mod_ts': datetime(2025, 1, 2, tzinfo=UTC),
+      '_ingested_ts': datetime(2025, 1, 2, tzinfo=UTC)
+    }
+  ])
+  df_3: DataFrame = DataFrame([{
+    '_file_path': 'c.json',
+    '_file_mod_ts': datetime(2025, 1, 1, tzinfo=UTC),
+    '_ingested_ts': datetime(2025, 1, 3, tzinfo=UTC)
+  }])
+  expected_history: list[dict[str, Any]] = [
+    {'_file_path': 'a.json', '_file_mod_ts': datetime(2025, 1, 2, tzinfo=UTC)},
+    {'_file_path': 'b.json', '_file_mod_ts': datetime(2025, 1, 2, tzinfo=UTC)}
+  ]
+  candidates_df: DataFrame = DataFrame([
+    {'_file_path': 'a.json', '_file_mod_ts': datetime(2025, 1, 2, tzinfo=UTC)},
+    {'_file_path': 'b.json', '_file_mod_ts': datetime(2025, 1, 3, tzinfo=UTC)},
+    {'_file_path': 'c.json', '_file_mod_ts': datetime(2025, 1, 1, tzinfo=UTC)}
+  ])
+  expected_unseen_paths: list[str] = ['b.json', 'c.json']
+  expected_caught_up_paths: list[str] = ['b.json']
@@ -1,7 +1,12 @@
+from datetime import datetime, UTC
 from deltalake import Field, Schema
 from os import getcwd, path
+from polars import DataFrame
+from typing import Any
 
 from polta.enums import TableQuality
+from polta.maps import Maps
+from polta.schemas.system import pipe_history
 from polta.table import Table
 from sample.metastore import metastore_init
 
@@ -40,3 +45,55 @@ class TestingData:
     primary_keys=['id', 'name'],
     metastore=metastore_init
   )
+
+  pipe_history_df: DataFrame = DataFrame(
+    [{
+      'pipe_id': 'pp.test.cache',
+      'execution_start_ts': datetime(2025, 1, 1, tzinfo=UTC),
+      'execution_end_ts': datetime(2025, 1, 1, tzinfo=UTC),
+      'execution_duration': 0.0,
+      'strict': False,
+      'succeeded': True,
+      'in_memory': False,
+      'total_count': 0,
+      'passed_count': 0,
+      'failed_count': 0,
+      'quarantined_count': 0
+    }],
+    schema=Maps.deltalake_schema_to_polars_schema(pipe_history)
+  )
+
+  file_history_table_id: str = 'test.cache.file_history'
+  file_history_df_1: DataFrame = DataFrame([{
+    '_file_path': 'a.json',
+    '_file_mod_ts': datetime(2025, 1, 1, tzinfo=UTC),
+    '_ingested_ts': datetime(2025, 1, 1, tzinfo=UTC)
+  }])
+  file_history_df_2: DataFrame = DataFrame([
+    {
+      '_file_path': 'a.json',
+      '_file_mod_ts': datetime(2025, 1, 2, tzinfo=UTC),
+      '_ingested_ts': datetime(2025, 1, 2, tzinfo=UTC)
+    },
+    {
+      '_file_path': 'b.json',
+      '_file_mod_ts': datetime(2025, 1, 2, tzinfo=UTC),
+      '_ingested_ts': datetime(2025, 1, 2, tzinfo=UTC)
+    }
+  ])
+  expected_file_history: list[dict[str, Any]] = [
+    {'_file_path': 'a.json', '_file_mod_ts': datetime(2025, 1, 2, tzinfo=UTC)},
+    {'_file_path': 'b.json', '_file_mod_ts': datetime(2025, 1, 2, tzinfo=UTC)}
+  ]
+
+  lazy_path: str = path.join(getcwd(), 'sample', 'test_metastore_lazy')
+  lazy_df: DataFrame = DataFrame([{
+    '_raw_id': 'abc',
+    '_conformed_id': 'def',
+    '_canonicalized_id': 'ghi',
+    '_created_ts': datetime(2025, 1, 1, tzinfo=UTC),
+    '_modified_ts': datetime(2025, 1, 1, tzinfo=UTC),
+    'id': 1,
+    'name': 'Spongebob',
+    'active_ind': True
+  }])
@@ -0,0 +1,32 @@
+from datetime import datetime, UTC
+from polars import DataFrame
+from typing import Any
+
+
+class TestingData:
+  """Contains test data for the system write buffer"""
+  pipe_id: str = 'pp.test.buffer'
+  pipe_history_record: dict[str, Any] = {
+    'pipe_id': pipe_id,
+    'execution_start_ts': datetime(2025, 1, 1, tzinfo=UTC),
+    'strict': False,
+    'succeeded': True,
+    'in_memory': False,
+    'passed_count': 1,
+    'failed_count': 0,
+    'quarantined_count': 0
+  }
+  buffer_size: int = 3
+  flush_seconds: float = 0.1
+  writer_id: str = 'polta-test-buffer'
+  table_id: str = 'test.buffer.file_history'
+  file_history_df: DataFrame = DataFrame([{
+    '_file_path': 'a.json',
+    '_file_mod_ts': datetime(2025, 1, 1, tzinfo=UTC),
+    '_ingested_ts': datetime(2025, 1, 1, tzinfo=UTC)
+  }])
+  candidates_df: DataFrame = DataFrame([
+    {'_file_path': 'a.json', '_file_mod_ts': datetime(2025, 1, 1, tzinfo=UTC)},
+    {'_file_path': 'b.json', '_file_mod_ts': datetime(2025, 1, 1, tzinfo=UTC)}
+  ])
+  expected_unseen_paths: list[str] = ['b.json']
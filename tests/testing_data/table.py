@@ -1,3 +1,5 @@
+import polars as pl
+
 from datetime import datetime, UTC
 from deltalake import Field, Schema
 from os import getcwd, path
@@ -8,6 +10,7 @@ from polta.checks import (
   check_positive_int,
   check_value_in
 )
+from polta.check import Check
 from polta.test import Test
 from polta.enums import CheckAction, TableQuality
 from polta.table import Table
@@ -52,7 +55,66 @@ class TestingData:
     partition_keys=['active_ind']
   )
 
+  partitioned_table: Table = Table(
+    domain='standard',
+    quality=TableQuality.CANONICAL,
+    name='partitioned_test_table',
+    raw_schema=Schema([
+      Field('id', 'integer'),
+      Field('name', 'string'),
+      Field('active_ind', 'boolean')
+    ]),
+    primary_keys=['id', 'active_ind'],
+    metastore=metastore,
+    partition_keys=['active_ind']
+  )
+
+  row_hash_table: Table = Table(
+    domain='standard',
+    quality=TableQuality.CANONICAL,
+    name='row_hash_test_table',
+    raw_schema=Schema([
+      Field('id', 'integer'),
+      Field('name', 'string'),
+      Field('active_ind', 'boolean')
+    ]),
+    primary_keys=['id'],
+    metastore=metastore,
+    row_hash=True
+  )
+
+  cdc_table: Table = Table(
+    domain='standard',
+    quality=TableQuality.STANDARD,
+    name='cdc_test_table',
+    raw_schema=Schema([
+      Field('id', 'integer'),
+      Field('name', 'string'),
+      Field('op', 'string'),
+      Field('seq', 'long')
+    ]),
+    primary_keys=['id'],
+    metastore=metastore,
+    cdc_operation_column='op',
+    cdc_sequence_column='seq'
+  )
+
+  cdf_table: Table = Table(
+    domain='standard',
+    quality=TableQuality.STANDARD,
+    name='cdf_test_table',
+    raw_schema=Schema([
+      Field('id', 'integer'),
+      Field('name', 'string')
+    ]),
+    primary_keys=['id'],
+    metastore=metastore,
+    change_data_feed=True
+  )
+
+  consumer_id: str = 'standard.canonical.test_consumer'
   test_path: str = path.join(getcwd(), 'sample', 'test_metastore', 'volumes', 'test_zone', 'table')
+  deletion_vectors_path: str = path.join(getcwd(), 'sample', 'test_metastore', 'volumes', 'test_zone', 'dv_table')
   filter_conditions_msg: str = 'Error: filter_conditions must be of type <dict>'
   partition_by_msg: str = 'Error: partition_by must be of type <list>'
   order_by_msg: str = 'Error: order_by must be of type <list>'
@@ -65,8 +127,61 @@ class TestingData:
   order_by_item_msg: str = 'Error: all values in order_by must be of type <str>'
   select_item_msg: str = 'Error: all values in select must be of type <str>'
   sort_by_item_msg: str = 'Error: all values in sort_by must be of type <str>'
+  filters_msg: str = 'Error: filters must be of type <list>'
+  filters_item_msg: str = 'Error: all values in filters must be of type <tuple> (column, operator, value)'
+
+  cdc_dataset_1: list[dict[str, Any]] = [
+    {'id': 1, 'name': 'Spongebob', 'op': 'I', 'seq': 1},
+    {'id': 1, 'name': 'Spongebob Squarepants', 'op': 'U', 'seq': 3},
+    {'id': 1, 'name': 'SpongeBob', 'op': 'U', 'seq': 2},
+    {'id': 2, 'name': 'Gary the Snail', 'op': 'I', 'seq': 1},
+    {'id': 3, 'name': 'Plankton', 'op': 'I', 'seq': 1},
+    {'id': 3, 'name': 'Plankton', 'op': 'D', 'seq': 2}
+  ]
+  cdc_dataset_2: list[dict[str, Any]] = [
+    {'id': 1, 'name': 'Stale Spongebob', 'op': 'U', 'seq': 2},
+    {'id': 2, 'name': 'Gary the Snail', 'op': 'D', 'seq': 2},
+    {'id': 4, 'name': 'Squidward Tentacles', 'op': 'I', 'seq': 1}
+  ]
+  cdc_null_sequence_dataset: list[dict[str, Any]] = [
+    {'id': 1, 'name': 'Spongebob', 'op': 'I', 'seq': None},
+    {'id': 1, 'name': 'Spongebob Squarepants', 'op': 'U', 'seq': None},
+    {'id': 2, 'name': 'Gary', 'op': 'I', 'seq': None},
+    {'id': 2, 'name': 'Gary the Snail', 'op': 'U', 'seq': 1}
+  ]
+  expected_cdc_null_sequence_rows: list[dict[str, Any]] = [
+    {'id': 1, 'name': 'Spongebob Squarepants'},
+    {'id': 2, 'name': 'Gary the Snail'}
+  ]
+  expected_cdc_rows_1: list[dict[str, Any]] = [
+    {'id': 1, 'name': 'Spongebob Squarepants'},
+    {'id': 2, 'name': 'Gary the Snail'}
+  ]
+  expected_cdc_rows_2: list[dict[str, Any]] = [
+    {'id': 1, 'name': 'Spongebob Squarepants'},
+    {'id': 4, 'name': 'Squidward Tentacles'}
+  ]
+
+  cdf_dataset: list[dict[str, Any]] = [
+    {'id': 1, 'name': 'Spongebob'},
+    {'id': 2, 'name': 'Gary the Snail'}
+  ]
+  expected_change_types: list[dict[str, Any]] = [
+    {'id': 1, '_change_type': 'update_postimage'},
+    {'id': 1, '_change_type': 'update_preimage'},
+    {'id': 3, '_change_type': 'insert'}
+  ]
+
+  expected_id_stats: dict[str, Any] = {'min': 1, 'max': 3, 'null_count': 0}
+  expected_active_ind_stats: dict[str, Any] = {'min': False, 'max': True, 'null_count': 0}
 
   expected_merge_predicate: str = 's.id = t.id AND s.name = t.name'
+  expected_partition_predicate: str = 't.active_ind IN (false, true) AND t.name IN (\'Gary the Snail\', ' \
+    '\'Plankton\', \'Spongebob Squarepants\')'
+  expected_range_predicate: str = 'id >= 1 AND id <= 3'
+  expected_overwrite_predicate: str = 'active_ind IN (false, true)'
+  expected_multi_key_overwrite_predicate: str = '(active_ind IS NULL AND id = 3) OR ' \
+    '(active_ind = false AND id = 2) OR (active_ind = true AND id = 1)'
 
   input_dataset_1: list[dict[str, Any]] = [
     {
@@ -106,6 +221,14 @@ class TestingData:
     {'id': 3}
   ]
   output_dataset_1_len: int = 3
+  sync_ids: list[dict[str, int]] = [
+    {'id': 1},
+    {'id': 3}
+  ]
+  scan_inactive_ids: list[dict[str, int]] = [
+    {'id': 2},
+    {'id': 3}
+  ]
 
   input_dataset_2: list[dict[str, Any]] = [
     {
@@ -134,6 +257,15 @@ class TestingData:
     {'id': 4}
   ] 
   output_dataset_2_len: int = 2
+  filters_ids: list[dict[str, int]] = [
+    {'id': 3},
+    {'id': 3},
+    {'id': 4}
+  ]
+  filter_conditions_in_ids: list[dict[str, int]] = [
+    {'id': 1},
+    {'id': 4}
+  ]
 
   quarantine_dataset: list[dict[str, Any]] = [
     {
@@ -177,6 +309,52 @@ class TestingData:
       Test(check_value_in, 'active_ind', CheckAction.QUARANTINE, {'values': [False]})
     ]
   )
+  # A DataFrame-style function check, which indexes the column eagerly
+  eager_value_in_check: Check = Check(
+    name='value_in',
+    description='Checks whether a column value is in a list',
+    function=lambda df, column, values: (df
+      .with_columns(pl.Series(f'__{column}__value_in__', (~df[column].is_in(values)).cast(pl.Int32)))
+    )
+  )
+  eager_apply_test_table: Table = Table(
+    domain='standard',
+    quality=TableQuality.CANONICAL,
+    name='eager_apply_tests',
+    raw_schema=apply_test_table.raw_schema,
+    primary_keys=['id', 'name'],
+    metastore=metastore,
+    tests=[
+      Test(check_not_null_or_empty, 'category', CheckAction.FAIL),
+      Test(check_positive_int, 'id', CheckAction.FAIL),
+      Test(eager_value_in_check, 'active_ind', CheckAction.QUARANTINE, {'values': [False]})
+    ]
+  )
+  # An expression check that returns null for null values
+  null_result_check: Check = Check(
+    name='positive',
+    description='Checks whether a column value is positive, returning null for null values',
+    expression=lambda column: (pl.col(column) > 0).cast(pl.Int32)
+  )
+  null_result_apply_test_table: Table = Table(
+    domain='standard',
+    quality=TableQuality.CANONICAL,
+    name='null_result_apply_tests',
+    raw_schema=Schema([
+      Field('id', 'integer'),
+      Field('amount', 'integer')
+    ]),
+    primary_keys=['id'],
+    metastore=metastore,
+    tests=[Test(null_result_check, 'amount', CheckAction.FAIL)]
+  )
+  null_result_dataset: list[dict[str, Any]] = [
+    {'id': 1, 'amount': 5},
+    {'id': 2, 'amount': None},
+    {'id': 3, 'amount': -5}
+  ]
+  null_result_passed_ids: list[int] = [1]
+  null_result_failed_ids: list[int] = [2, 3]
   apply_test_dataset: list[dict[str, Any]] = [
     {
       '_raw_id': 'abc',
@@ -236,4 +414,10 @@ class TestingData:
   ]
   passed_ids: list[int] = [2]
   failed_ids: list[int] = [-1, 3, 5]
+  failed_records: list[dict[str, Any]] = [
+    {'id': -1, 'failed_test': 'positive_int'},
+    {'id': 3, 'failed_test': 'not_null_or_empty'},
+    {'id': 5, 'failed_test': 'not_null_or_empty'}
+  ]
   quarantine_ids: list[int] = [4]
+  first_test_failed_ids: list[int] = [3, 5]
@@ -0,0 +1,52 @@
+from datetime import datetime, UTC
+from deltalake import Field, Schema
+from polars import DataFrame
+
+from polta.enums import TableQuality
+from polta.table import Table
+from polta.write_properties import WriteProperties
+from sample.metastore import metastore
+
+
+class TestingData:
+  """Contains test data for the write properties"""
+  default_properties: WriteProperties = WriteProperties()
+  properties: WriteProperties = WriteProperties(
+    compression='ZSTD',
+    compression_level=3,
+    max_row_group_size=1,
+    target_file_size=1024 * 1024,
+    data_skipping_num_indexed_cols=2,
+    data_skipping_stats_columns=['id', 'name']
+  )
+  expected_configuration: dict[str, str] = {
+    'delta.dataSkippingNumIndexedCols': '2',
+    'delta.dataSkippingStatsColumns': 'id,name'
+  }
+
+  table: Table = Table(
+    domain='standard',
+    quality=TableQuality.STANDARD,
+    name='write_properties_test_table',
+    raw_schema=Schema([
+      Field('id', 'integer'),
+      Field('name', 'string'),
+      Field('active_ind', 'boolean')
+    ]),
+    primary_keys=['id'],
+    metastore=metastore,
+    write_properties=WriteProperties(
+      compression='ZSTD',
+      max_row_group_size=1,
+      data_skipping_stats_columns=['id']
+    )
+  )
+  df: DataFrame = DataFrame([
+    {'_id': 'abc', '_created_ts': datetime(2025, 1, 1, tzinfo=UTC),
+     '_modified_ts': datetime(2025, 1, 1, tzinfo=UTC), 'id': 1, 'name': 'Spongebob', 'active_ind': True},
+    {'_id': 'def', '_created_ts': datetime(2025, 1, 1, tzinfo=UTC),
+     '_modified_ts': datetime(2025, 1, 1, tzinfo=UTC), 'id': 2, 'name': 'Patrick', 'active_ind': False}
+  ])
+  expected_compression: str = 'ZSTD'
+  expected_row_groups: int = 2
+  expected_stats_columns: list[str] = ['min.id', 'max.id']